@@ -0,0 +1,104 @@
+# ==================================================
+# benchmarks/bench_birthday_load.py — Birthday Data Loading
+# ==================================================
+#
+# Times loading a synthetic 12k-event birthday file three ways:
+#   legacy     read + json.loads, regex "loose JSON" fallback (old loader)
+#   parse      the incremental tolerant parser (first load / file changed)
+#   cached     load_birthday_events() with an unchanged file (stat only)
+#
+# Both the strict JSON layout and the loose layout (comments, no
+# enclosing brackets) are measured.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_birthday_load
+# ==================================================
+
+import json
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from services.birthday_service import load_birthday_events, parse_birthday_text
+
+N_EVENTS = 12_000
+ROUNDS = 5
+
+
+def _events(n: int) -> list[dict]:
+    out = []
+    for i in range(n):
+        month, day = i % 12 + 1, i % 28 + 1
+        if i % 50 == 0:
+            date_s = f"{month:02d}-{day:02d}:{(month % 12) + 1:02d}-{day:02d}"
+            out.append({"date": date_s, "name": f"Owner {i} - task {i}", "category": ["challenge"], "countries": ["challenge"]})
+        else:
+            out.append({"date": f"{month:02d}-{day:02d}", "name": f"Member {i} (Имя)", "category": ["birthday"], "countries": ["murloc"]})
+    return out
+
+
+def _strict_text(events: list[dict]) -> str:
+    body = ",\n".join(json.dumps(e, ensure_ascii=False) for e in events)
+    return f"[\n{body}\n]\n"
+
+
+def _loose_text(events: list[dict]) -> str:
+    lines = []
+    for i, e in enumerate(events):
+        if i % 100 == 0:
+            lines.append(f"# block {i // 100}")
+        lines.append(json.dumps(e, ensure_ascii=False) + ("," if i < len(events) - 1 else ""))
+    return "\n".join(lines) + "\n"
+
+
+def _legacy_load(path: str) -> list:
+    raw_text = open(path, "r", encoding="utf-8").read().strip()
+    try:
+        data = json.loads(raw_text)
+    except json.JSONDecodeError:
+        lines = [
+            line for line in raw_text.splitlines()
+            if not (line.strip().startswith("#") or line.strip().startswith("//"))
+        ]
+        cleaned = re.sub(r",\s*]", "]", "\n".join(lines)).strip()
+        if not cleaned.startswith("["):
+            cleaned = f"[{cleaned}]"
+        try:
+            data = json.loads(cleaned)
+        except json.JSONDecodeError:
+            return []
+    return [e for e in data if isinstance(e, dict)]
+
+
+def _best_ms(fn) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    events = _events(N_EVENTS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, text in (("strict", _strict_text(events)), ("loose", _loose_text(events))):
+            path = Path(tmp) / f"{label}.json"
+            path.write_text(text, encoding="utf-8")
+
+            parsed = parse_birthday_text(text)
+            assert len(parsed.events) == N_EVENTS and not parsed.errors, parsed.errors[:3]
+            assert len(_legacy_load(str(path))) == N_EVENTS
+
+            load_birthday_events(str(path))  # prime the cache
+
+            print(f"{label} layout, {N_EVENTS} events ({len(text) / 1024:.0f} KiB):")
+            print(f"  legacy loader:   {_best_ms(lambda: _legacy_load(str(path))):8.2f} ms")
+            print(f"  tolerant parse:  {_best_ms(lambda: parse_birthday_text(path.read_text(encoding='utf-8'))):8.2f} ms")
+            print(f"  cached load:     {_best_ms(lambda: load_birthday_events(str(path))):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# ==================================================
+# benchmarks/bench_holidays_memory.py — Holiday Record Memory
+# ==================================================
+#
+# Compares retained memory of the legacy dict-per-holiday layout with
+# the interned HolidayRecord layout on a synthetic twelve-month dataset
+# (the real monthly files replicated across all twelve months).
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_holidays_memory
+# ==================================================
+
+import json
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+from services.holidays_service import HOLIDAYS_PATH, make_record
+
+
+def _twelve_month_entries() -> list[str]:
+    """JSON text of every month file, re-dated to cover all twelve months."""
+    months = [
+        json.loads(f.read_text(encoding="utf-8"))
+        for f in sorted(Path(HOLIDAYS_PATH).glob("*.json"))
+    ]
+    months = [m for m in months if len(m) >= 100]  # skip partial months
+    texts: list[str] = []
+    for month in range(1, 13):
+        data = json.loads(json.dumps(months[(month - 1) % len(months)]))
+        for entry in data:
+            entry["date"] = f"{month:02d}-{min(int(entry['date'][3:]), 28):02d}"
+        texts.append(json.dumps(data, ensure_ascii=False))
+    return texts
+
+
+def _legacy(texts: list[str]) -> list[dict]:
+    today = date(2026, 1, 1)
+    out = []
+    for i, text in enumerate(texts):
+        for entry in json.loads(text):
+            out.append(
+                {
+                    "name": entry["name"],
+                    "date": entry["date"],
+                    "parsed_date": date(today.year, int(entry["date"][:2]), int(entry["date"][3:])),
+                    "countries": entry.get("countries", []),
+                    "categories": entry.get("category") or entry.get("categories") or [],
+                    "source": f"month-{i}.json",
+                }
+            )
+    return out
+
+
+def _compact(texts: list[str]) -> list:
+    out = []
+    for i, text in enumerate(texts):
+        for entry in json.loads(text):
+            out.append(
+                make_record(
+                    entry["name"],
+                    entry["date"],
+                    entry.get("countries", []),
+                    entry.get("category") or entry.get("categories") or [],
+                    f"month-{i}.json",
+                )
+            )
+    return out
+
+
+def _retained(build, texts: list[str]) -> tuple[int, int]:
+    tracemalloc.start()
+    records = build(texts)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(records), current
+
+
+def main() -> None:
+    texts = _twelve_month_entries()
+    # Warm up interning tables / bit tables so they are not billed to the run
+    _compact(texts[:1])
+
+    n_legacy, legacy = _retained(_legacy, texts)
+    n_compact, compact = _retained(_compact, texts)
+
+    print(f"records:           {n_legacy}")
+    print(f"legacy dicts:      {legacy / 1024:8.1f} KiB ({legacy / n_legacy:.0f} B/record)")
+    print(f"HolidayRecord:     {compact / 1024:8.1f} KiB ({compact / n_compact:.0f} B/record)")
+    print(f"reduction:         {100 * (1 - compact / legacy):.0f}%")
+
+
+if __name__ == "__main__":
+    main()
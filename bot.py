@@ -1,6 +1,9 @@
 import os
 import logging
-import discord
+
+# First import: marks process start for the startup timing report
+from core.startup import startup
+
 from discord.ext import commands
 
 # ===========================
@@ -21,52 +24,75 @@ if not DISCORD_TOKEN:
 
 # ===========================
 # Import Daily Task Modules
-# (imported after env check)
+# (imported after env check; importing registers each job)
+# No module reads data files at import: they register startup warmups.
 # ===========================
+with startup.phase("imports"):
+    from core.scheduler import scheduler
 
-from daily.banlu.banlu_daily import (
-    send_banlu_daily,
-    send_banlu_once,
-)
+    import daily.banlu.banlu_daily  # noqa: F401  (10:00)
+    import daily.holidays.holidays_daily  # noqa: F401  (10:01)
+    import daily.birthday.birthday_daily  # noqa: F401  (10:02)
 
-from daily.holidays.holidays_daily import (
-    send_holidays_daily,
-    send_once_if_missed_holidays,
-)
+    from core.http_client import http
+    from core.io_executor import io_pool
+    from core import timers
+    from core.timer_engine import update_timers_loop
+    from core.memory import client_options, log_memory, memory_reporter
+    from core.settings import MEMORY_REPORT_MINUTES, PREFIX_COMMANDS, SLASH_SYNC
+    from core.slash_sync import sync_app_commands
+    from services.steam_media import steam_media_refresher
 
-from daily.birthday.birthday_daily import (
-    send_birthday_daily,
-    send_once_if_missed_birthday,
-)
 
 # ===========================
 # Bot Initialization
 # ===========================
-intents = discord.Intents.default()
-intents.message_content = True
+class Bot(commands.Bot):
+    """
+    commands.Bot with a one-time initialization stage.
 
-bot = commands.Bot(
-    command_prefix="!",
-    intents=intents,
+    setup_hook runs once per process (after login, before the gateway
+    connects): every background engine is started there exactly once.
+    on_ready may fire again on every reconnect and does no work.
+    """
+
+    async def setup_hook(self) -> None:
+        with startup.phase("setup_hook"):
+            # Loops wait for the first READY themselves (before_loop)
+            startup.start_engine("scheduler", lambda: scheduler.start(self))
+            startup.start_engine("steam_media", steam_media_refresher.start)
+            update_timers_loop.bot = self
+            startup.start_engine("timers", update_timers_loop.start)
+            if MEMORY_REPORT_MINUTES:
+                memory_reporter.bot = self
+                startup.start_engine("memory_report", memory_reporter.start)
+
+            # Data warmups overlap with the gateway connect
+            startup.start_warmups()
+
+            # Only uploads when the command tree changed (hash in the state dir)
+            if SLASH_SYNC != "off":
+                startup.start_engine("slash_sync", lambda: self.loop.create_task(sync_app_commands(self)))
+
+        self.loop.create_task(_finish_startup(self))
+
+    async def close(self) -> None:
+        await http.close()  # pooled aiohttp session (Steam fetches)
+        await timers.flush()  # queued timers.json write
+        io_pool.log_stats()
+        io_pool.shutdown()
+        await super().close()
+
+
+# Intents, member/message caches per profile (BOT_LOW_MEMORY, see core/memory.py)
+bot = Bot(
+    # Without prefix commands only @mentions still reach the `!` handlers
+    command_prefix="!" if PREFIX_COMMANDS else commands.when_mentioned,
     help_command=None,
+    **client_options(),
 )
 
 
-# ===========================
-# Dependency Injection
-# Attach bot reference into task modules
-# ===========================
-for task in (
-    send_banlu_daily,
-    send_banlu_once,
-    send_holidays_daily,
-    send_once_if_missed_holidays,
-    send_birthday_daily,
-    send_once_if_missed_birthday,
-):
-    task.bot = bot
-
-
 # ===========================
 # Command Loader
 # ===========================
@@ -95,35 +121,35 @@ def load_all_commands() -> None:
     logger.info("All command modules loaded successfully.")
 
 
+async def _finish_startup(client: commands.Bot) -> None:
+    """After the first READY: catch-up (concurrent with warmups), then the timing report."""
+    await client.wait_until_ready()
+
+    # Catch up on jobs whose time passed today and that have not run yet
+    logger.info("Running missed-task catch-up...")
+    with startup.phase("catch-up"):
+        await scheduler.catch_up()
+
+    await startup.start_warmups()
+    startup.mark_initialized()
+    startup.log_report()
+    log_memory(client, "startup")
+    logger.info("Background engines initialized: %s", ", ".join(startup.engines))
+
+
 # ===========================
 # Bot Lifecycle Events
 # ===========================
 @bot.event
 async def on_ready():
+    # Fires again on every reconnect: initialization lives in Bot.setup_hook
+    if startup.is_initialized():
+        logger.info("Reconnected as %s.", bot.user)
+        return
+
     logger.info("✅ Bot is online.")
     logger.info(f"Logged in as: {bot.user} (ID: {bot.user.id})")
-
-    # Start background tasks if not already running
-    if not send_banlu_daily.is_running():
-        send_banlu_daily.start()
-        logger.info("Started task: send_banlu_daily")
-
-    if not send_holidays_daily.is_running():
-        send_holidays_daily.start()
-        logger.info("Started task: send_holidays_daily")
-
-
-    if not send_birthday_daily.is_running():
-        send_birthday_daily.start()
-        logger.info("Started task: send_birthday_daily")
-
-    # Run fallback/missed checks
-    logger.info("Running missed-task fallback checks...")
-    await send_banlu_once()
-    await send_once_if_missed_holidays()
-    await send_once_if_missed_birthday()
-
-    logger.info("Background scheduler initialized successfully.")
+    startup.milestone("ready")  # commands are served from here on
 
 
 # ===========================
@@ -131,7 +157,8 @@ async def on_ready():
 # ===========================
 def main():
     """Main application entrypoint."""
-    load_all_commands()
+    with startup.phase("commands"):
+        load_all_commands()
     logger.info("Launching bot...")
     bot.run(DISCORD_TOKEN)
 
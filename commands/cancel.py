@@ -3,12 +3,72 @@
 # ==================================================
 
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import List, Optional
 
+import discord
+from discord import app_commands
 from discord.ext import commands
 
-from core.timers import date_timers, delete_timer, save as save_timers
-from core.helpers import format_remaining
+from core.timers import channel_timers, date_timers, delete_timer, ensure_loaded
+
+
+# ===========================
+# Shared Logic (prefix + slash)
+# ===========================
+def cancel_timer(timer_id: int, channel_id: int) -> str:
+    """
+    Cancel a timer by ID and return the reply text.
+
+    Only timers of `channel_id` can be canceled: IDs are global, so
+    anyone could otherwise cancel another guild's timers.
+    """
+    ensure_loaded()
+    timer = date_timers.get(timer_id)
+    if timer is None or timer["channel_id"] != channel_id:
+        return "❌ No timer found with this ID in this channel."
+
+    delete_timer(timer_id)
+    return f"🛑 Timer **{timer_id}** has been canceled."
+
+
+def format_timers_list(channel_id: int) -> Optional[str]:
+    """Active timers of a channel as a message; None if there are none."""
+    timers_here = channel_timers(channel_id)
+    if not timers_here:
+        return None
+
+    lines = ["📌 **Active Timers:**", ""]
+
+    for t in timers_here:
+        tz = timezone(timedelta(hours=t["tz_offset"]))
+        dt = datetime.fromtimestamp(t["target_timestamp"], tz)
+
+        lines.append(
+            f"• ID **{t['timer_id']}** — {t['text']}\n"
+            f"  Date: **{dt.strftime('%d.%m.%Y %H:%M')} "
+            f"(GMT{t['tz_offset']:+})**\n"
+        )
+
+    return "\n".join(lines)
+
+
+async def timer_id_autocomplete(
+    interaction: discord.Interaction,
+    current: str,
+) -> List[app_commands.Choice[int]]:
+    """This channel's timers (per-channel index), filtered by ID / text."""
+    current = current.strip().lower()
+    choices: List[app_commands.Choice[int]] = []
+
+    for t in channel_timers(interaction.channel_id):
+        label = f"#{t['timer_id']} — {t['text']}"
+        if current and current not in label.lower():
+            continue
+        choices.append(app_commands.Choice(name=label[:100], value=t["timer_id"]))
+        if len(choices) == 25:  # Discord's autocomplete limit
+            break
+
+    return choices
 
 
 # ===========================
@@ -25,12 +85,7 @@ def setup(bot: commands.Bot) -> None:
     async def cmd_cancel(ctx: commands.Context, timer_id: int):
         """Cancel a timer by its ID."""
 
-        timer = date_timers.get(timer_id)
-        if timer is None:
-            return await ctx.send("❌ No timer found with this ID.")
-
-        delete_timer(timer_id)
-        await ctx.send(f"🛑 Timer **{timer_id}** has been canceled.")
+        await ctx.send(cancel_timer(timer_id, ctx.channel.id))
 
     # ===========================
     # !cancelall
@@ -40,14 +95,9 @@ def setup(bot: commands.Bot) -> None:
     async def cmd_cancel_all(ctx: commands.Context):
         """Cancel all timers in this channel."""
 
-        channel_id = ctx.channel.id
-        removed: List[int] = []
-
-        # Iterate over a copy since we mutate the dict
-        for tid, timer in list(date_timers.items()):
-            if timer["channel_id"] == channel_id:
-                removed.append(tid)
-                delete_timer(tid)
+        removed = [t["timer_id"] for t in channel_timers(ctx.channel.id)]
+        for tid in removed:
+            delete_timer(tid)
 
         if not removed:
             return await ctx.send("🔕 There are no active timers in this channel.")
@@ -62,23 +112,21 @@ def setup(bot: commands.Bot) -> None:
     async def cmd_list_timers(ctx: commands.Context):
         """List all active timers in this channel."""
 
-        channel_id = ctx.channel.id
-        timers_here = [t for t in date_timers.values() if t["channel_id"] == channel_id]
-
-        if not timers_here:
-            return await ctx.send("🔔 No timers set in this channel.")
+        await ctx.send(format_timers_list(ctx.channel.id) or "🔔 No timers set in this channel.")
 
-        # Build output
-        lines = ["📌 **Active Timers:**", ""]
-
-        for t in timers_here:
-            tz = timezone(timedelta(hours=t["tz_offset"]))
-            dt = datetime.fromtimestamp(t["target_timestamp"], tz)
-
-            lines.append(
-                f"• ID **{t['timer_id']}** — {t['text']}\n"
-                f"  Date: **{dt.strftime('%d.%m.%Y %H:%M')} "
-                f"(GMT{t['tz_offset']:+})**\n"
-            )
+    # ===========================
+    # /cancel <id> — autocomplete from this channel's timers
+    # ===========================
+    @bot.tree.command(name="cancel", description="Cancel a timer by its ID")
+    @app_commands.describe(timer_id="Timer to cancel")
+    @app_commands.autocomplete(timer_id=timer_id_autocomplete)
+    async def slash_cancel(interaction: discord.Interaction, timer_id: int):
+        await interaction.response.send_message(cancel_timer(timer_id, interaction.channel_id))
 
-        await ctx.send("\n".join(lines))
+    # ===========================
+    # /timers
+    # ===========================
+    @bot.tree.command(name="timers", description="List active timers in this channel")
+    async def slash_timers(interaction: discord.Interaction):
+        text = format_timers_list(interaction.channel_id)
+        await interaction.response.send_message(text or "🔔 No timers set in this channel.")
@@ -3,14 +3,77 @@
 # ==================================================
 
 from datetime import datetime, timedelta, timezone
+from typing import Tuple
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 
 from core.timers import create_timer
 from core.helpers import format_remaining
 
 
+USAGE_EXAMPLE = "`!timerdate 31.12.2025 23:59 +3 New Year! --pin`"
+SLASH_USAGE_EXAMPLE = "`/timerdate date:31.12.2025 time:23:59 gmt:+3 text:New Year! pin:True`"
+DEFAULT_TIMERDATE_TEXT = "⏰ Time is up!"
+
+
+# ===========================
+# Shared Logic (prefix + slash)
+# ===========================
+def parse_target(date: str, time_str: str, gmt: str, usage: str = USAGE_EXAMPLE) -> Tuple[datetime, int, int]:
+    """
+    Parse DD.MM.YYYY, HH:MM and a +N/-N GMT offset.
+
+    Returns (target datetime, tz offset, remaining seconds); raises
+    ValueError with a user-facing message.
+    """
+    try:
+        # Parse DD.MM.YYYY and HH:MM
+        base_dt = datetime.strptime(f"{date} {time_str}", "%d.%m.%Y %H:%M")
+
+        # Validate GMT format (+3 / -5)
+        if not (gmt.startswith("+") or gmt.startswith("-")):
+            raise ValueError("❌ GMT must be in the format `+3` or `-5`.")
+
+        tz_offset = int(gmt)
+        tz = timezone(timedelta(hours=tz_offset))
+    except ValueError as e:
+        if str(e).startswith("❌"):
+            raise
+        raise ValueError(f"❌ Invalid format.\nExample:\n{usage}") from e
+
+    target_dt = base_dt.replace(tzinfo=tz)
+    remaining_seconds = int((target_dt - datetime.now(tz)).total_seconds())
+
+    if remaining_seconds <= 0:
+        raise ValueError("❌ This date has already passed in the specified GMT.")
+
+    return target_dt, tz_offset, remaining_seconds
+
+
+def build_preview_embed(text: str, date: str, time_str: str, gmt: str, remaining_seconds: int) -> discord.Embed:
+    return discord.Embed(
+        title=f"⏳ Timer: {text}",
+        description=(
+            f"Date: **{date} {time_str} (GMT{gmt})**\n"
+            f"Remaining: **{format_remaining(remaining_seconds)}**"
+        ),
+        color=discord.Color.orange(),
+    )
+
+
+async def pin_message(msg: discord.Message) -> str:
+    """Pin the timer message; returns a warning to show, or ""."""
+    try:
+        await msg.pin()
+    except discord.Forbidden:
+        return "⚠️ I don't have permission to pin messages."
+    except Exception as e:
+        return f"⚠️ Pin error: {e}"
+    return ""
+
+
 # ===========================
 # Setup Function
 # Registers the !timerdate command
@@ -49,67 +112,31 @@ def setup(bot: commands.Bot) -> None:
             raw_text = raw_text[:-3].strip()
 
         if not raw_text:
-            raw_text = "⏰ Time is up!"
+            raw_text = DEFAULT_TIMERDATE_TEXT
 
 
         # ===========================
         # Parse: Date, Time, GMT Offset
         # ===========================
         try:
-            # Parse DD.MM.YYYY and HH:MM
-            base_dt = datetime.strptime(
-                f"{date} {time_str}", "%d.%m.%Y %H:%M"
-            )
-
-            # Validate GMT format (+3 / -5)
-            if not (gmt.startswith("+") or gmt.startswith("-")):
-                return await ctx.send("❌ GMT must be in the format `+3` or `-5`.")
-
-            tz_offset = int(gmt)
-            tz = timezone(timedelta(hours=tz_offset))
-
-            target_dt = base_dt.replace(tzinfo=tz)
-            now = datetime.now(tz)
-            remaining_seconds = int((target_dt - now).total_seconds())
-
-            if remaining_seconds <= 0:
-                return await ctx.send(
-                    "❌ This date has already passed in the specified GMT."
-                )
-
-        except Exception:
-            return await ctx.send(
-                "❌ Invalid format.\n"
-                "Example:\n"
-                "`!timerdate 31.12.2025 23:59 +3 New Year! --pin`"
-            )
+            target_dt, tz_offset, remaining_seconds = parse_target(date, time_str, gmt)
+        except ValueError as e:
+            return await ctx.send(str(e))
 
 
         # ===========================
         # Create Preview Embed
         # ===========================
-        embed = discord.Embed(
-            title=f"⏳ Timer: {raw_text}",
-            description=(
-                f"Date: **{date} {time_str} (GMT{gmt})**\n"
-                f"Remaining: **{format_remaining(remaining_seconds)}**"
-            ),
-            color=discord.Color.orange(),
-        )
-
-        msg = await ctx.send(embed=embed)
+        msg = await ctx.send(embed=build_preview_embed(raw_text, date, time_str, gmt, remaining_seconds))
 
 
         # ===========================
         # Pin Message (Optional)
         # ===========================
         if should_pin:
-            try:
-                await msg.pin()
-            except discord.Forbidden:
-                await ctx.send("⚠️ I don't have permission to pin messages.")
-            except Exception as e:
-                await ctx.send(f"⚠️ Pin error: {e}")
+            warning = await pin_message(msg)
+            if warning:
+                await ctx.send(warning)
 
 
         # ===========================
@@ -125,3 +152,48 @@ def setup(bot: commands.Bot) -> None:
         )
 
         await ctx.send(f"✅ Timer created! ID: **{timer_id}**")
+
+    # ===========================
+    # /timerdate date time gmt [text] [pin]
+    # ===========================
+    @bot.tree.command(name="timerdate", description="Persistent countdown to a date/time (GMT offset)")
+    @app_commands.describe(
+        date="DD.MM.YYYY",
+        time="HH:MM",
+        gmt="GMT offset, e.g. +3 or -5",
+        text="Timer text",
+        pin="Pin the timer message",
+    )
+    async def slash_timerdate(
+        interaction: discord.Interaction,
+        date: str,
+        time: str,
+        gmt: str,
+        text: str = DEFAULT_TIMERDATE_TEXT,
+        pin: bool = False,
+    ):
+        try:
+            target_dt, tz_offset, remaining_seconds = parse_target(date, time, gmt, SLASH_USAGE_EXAMPLE)
+        except ValueError as e:
+            return await interaction.response.send_message(str(e), ephemeral=True)
+
+        await interaction.response.send_message(
+            embed=build_preview_embed(text, date, time, gmt, remaining_seconds)
+        )
+        # The response is a regular channel message: the timer engine edits it
+        msg = await interaction.original_response()
+
+        warning = await pin_message(msg) if pin else ""
+
+        timer_id = create_timer(
+            channel_id=interaction.channel_id,
+            message_id=msg.id,
+            text=text,
+            timestamp=int(target_dt.timestamp()),
+            tz_offset=tz_offset,
+            pinned=pin,
+        )
+
+        await interaction.followup.send(
+            "\n".join(filter(None, [warning, f"✅ Timer created! ID: **{timer_id}**"]))
+        )
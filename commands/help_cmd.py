@@ -71,6 +71,7 @@ def setup(bot: commands.Bot) -> None:
             name="🎉 Holidays",
             value=(
                 "`!holidays` — Shows the next upcoming holiday across all JSON files.\n"
+                "`!holidays 7` — Lists every holiday in the next 7 days.\n"
                 "Includes: world, country-specific, religious, and dynamic holidays."
             ),
             inline=False,
@@ -89,6 +90,18 @@ def setup(bot: commands.Bot) -> None:
             inline=False,
         )
 
+        # ===========================
+        # Slash Commands
+        # ===========================
+        embed.add_field(
+            name="⚡ Slash Commands",
+            value=(
+                "`/quote` `/murloc_ai` `/timer` `/timerdate` `/timers` `/cancel` `/holidays`\n"
+                "Same as the `!` commands, with autocomplete for timer IDs and holiday names."
+            ),
+            inline=False,
+        )
+
         embed.set_footer(text="Murloc Edition 🐸")
 
         await ctx.send(embed=embed)
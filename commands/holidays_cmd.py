@@ -2,114 +2,33 @@
 # commands/holidays_cmd.py — Holiday Lookup Command
 # ==================================================
 
-import os
-import json
-from datetime import datetime
+from typing import List
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 
-from core.dynamic_holidays import get_dynamic_holidays
-from core.holidays_flags import COUNTRY_FLAGS, CATEGORY_EMOJIS
+from core.io_executor import io_pool
+from core.response_cache import ResponseCache
+from core.settings import local_today
+from services.holidays_service import DYNAMIC_SOURCE, get_holiday_index
 
-HOLIDAYS_PATH = "data/holidays"
 
-
-# ===========================
-# Load All Holidays (Static JSON + Dynamic)
-# ===========================
-def load_all_holidays():
-    """
-    Load all holidays from JSON files and dynamic holiday sources.
-    Normalizes categories and maps holiday dates to their next occurrence.
-    """
-    today = datetime.now().date()
-    holidays = []
-
-    # -------------------------------------------
-    # 1. Load static holidays from JSON files
-    # -------------------------------------------
-    for filename in sorted(os.listdir(HOLIDAYS_PATH)):
-        if not filename.endswith(".json"):
-            continue
-
-        full_path = os.path.join(HOLIDAYS_PATH, filename)
-
-        with open(full_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        for entry in data:
-            mmdd = entry["date"]
-
-            # Construct YYYY-MM-DD from this year
-            parsed_date = datetime.strptime(
-                f"{today.year}-{mmdd}", "%Y-%m-%d"
-            ).date()
-
-            # If holiday already passed this year → shift to next year
-            if parsed_date < today:
-                parsed_date = parsed_date.replace(year=today.year + 1)
-
-            # Normalize category field
-            categories = (
-                entry.get("category")
-                or entry.get("categories")
-                or []
-            )
-            if isinstance(categories, str):
-                categories = [categories]
-
-            holidays.append(
-                {
-                    "date": mmdd,
-                    "name": entry["name"],
-                    "countries": entry.get("countries", []),
-                    "categories": categories,
-                    "source": filename,
-                    "parsed_date": parsed_date,
-                }
-            )
-
-    # -------------------------------------------
-    # 2. Add dynamic holidays (e.g., Easters)
-    # -------------------------------------------
-    dynamic_list = get_dynamic_holidays()
-    for d in dynamic_list:
-        full_date = datetime.strptime(d["full_date"], "%Y-%m-%d").date()
-
-        holidays.append(
-            {
-                "date": d["date"],
-                "name": d["name"],
-                "countries": d.get("countries", []),
-                "categories": d.get("categories", d.get("category", [])),
-                "source": "dynamic_holidays.py",
-                "parsed_date": full_date,
-            }
-        )
-
-    # -------------------------------------------
-    # Sort by nearest date
-    # -------------------------------------------
-    holidays.sort(key=lambda h: h["parsed_date"])
-    return holidays
+# Upper bound for `!holidays <days>` (Discord allows 25 embed fields)
+MAX_UPCOMING_DAYS = 366
+MAX_UPCOMING_FIELDS = 25
 
 
 # ===========================
 # Get Nearest Holiday For a Given Source File
 # ===========================
-def get_next_for_source(source_name, holidays):
+def get_next_for_source(source_name, today=None):
     """
     Return the nearest upcoming holiday for a given source file.
+    Backed by the per-source bisect tables of the shared HolidayIndex.
     """
-    today = datetime.now().date()
-    relevant = [h for h in holidays if h["source"] == source_name]
-    upcoming = [h for h in relevant if h["parsed_date"] >= today]
-
-    if not upcoming:
-        return None
-
-    return sorted(upcoming, key=lambda h: h["parsed_date"])[0]
+    today = today or local_today()
+    return get_holiday_index().next_for_source(source_name, today)
 
 
 # ===========================
@@ -117,25 +36,56 @@ def get_next_for_source(source_name, holidays):
 # Adds emoji if available
 # ===========================
 def build_category_line_for_cmd(h):
-    categories = h.get("categories", [])
-    if not categories:
+    if not h.categories:
         return ""
 
-    main = categories[0]
-    emoji = CATEGORY_EMOJIS.get(main, "")
-
-    return f"{emoji} {main}" if emoji else main
+    main = h.categories[0]
+    return f"{h.emoji} {main}" if h.emoji else main
 
 
 # ===========================
-# Command: !holidays
-# Show nearest holiday per source file
+# Upcoming Holidays Embed
+# `!holidays <days>`
 # ===========================
-@commands.command(name="holidays")
-async def holidays_cmd(ctx):
-    """Diagnostic command: show nearest holiday for each source file."""
+def build_upcoming_embed(today, days):
+    """List all holidays between today and today + days (capped)."""
+    days = min(days, MAX_UPCOMING_DAYS)
+    upcoming = get_holiday_index().upcoming_within(today, days)
 
-    holidays = load_all_holidays()
+    embed = discord.Embed(
+        title=f"📅 Holidays in the next {days} day(s)",
+        color=0x00AEEF,
+    )
+
+    if not upcoming:
+        embed.description = "❌ No upcoming holidays"
+        return embed
+
+    for h in upcoming[:MAX_UPCOMING_FIELDS]:
+        cat_line = build_category_line_for_cmd(h)
+        when = f"📅 {h.parsed_date.strftime('%m-%d')}"
+
+        embed.add_field(
+            name=f"{h.flag} {h.name}",
+            value=f"{cat_line}\n{when}" if cat_line else when,
+            inline=False,
+        )
+
+    if len(upcoming) > MAX_UPCOMING_FIELDS:
+        embed.set_footer(text=f"…and {len(upcoming) - MAX_UPCOMING_FIELDS} more")
+
+    return embed
+
+
+# ===========================
+# Nearest Holiday per Source Embed
+# `!holidays`
+# ===========================
+def build_sources_embed(today):
+    """Nearest holiday for each source file; None if no source exists."""
+    files = get_holiday_index().sources()
+    if not files:
+        return None
 
     embed = discord.Embed(
         title="📅 Nearest Holidays by Source",
@@ -145,20 +95,20 @@ async def holidays_cmd(ctx):
     # -------------------------------------------
     # 1. Dynamic Holidays (always shown first)
     # -------------------------------------------
-    dyn = get_next_for_source("dynamic_holidays.py", holidays)
+    dyn = get_next_for_source(DYNAMIC_SOURCE, today)
 
     if dyn:
         cat_line = build_category_line_for_cmd(dyn)
         if cat_line:
             value = (
-                f"🌍 **{dyn['name']}**\n"
+                f"🌍 **{dyn.name}**\n"
                 f"{cat_line}\n"
-                f"📅 {dyn['date']}"
+                f"📅 {dyn.date}"
             )
         else:
             value = (
-                f"🌍 **{dyn['name']}**\n"
-                f"📅 {dyn['date']}"
+                f"🌍 **{dyn.name}**\n"
+                f"📅 {dyn.date}"
             )
 
         embed.add_field(
@@ -176,37 +126,25 @@ async def holidays_cmd(ctx):
     # -------------------------------------------
     # 2. Static JSON Files
     # -------------------------------------------
-    try:
-        files = [
-            f for f in os.listdir(HOLIDAYS_PATH)
-            if f.endswith(".json")
-        ]
-    except FileNotFoundError:
-        return await ctx.send("❌ Error: holidays folder not found on server.")
-
     for filename in sorted(files, key=lambda x: x.lower()):
-        next_h = get_next_for_source(filename, holidays)
+        next_h = get_next_for_source(filename, today)
 
         if next_h:
-            # Use first country if available
-            country = (
-                next_h.get("country")
-                or (next_h["countries"][0] if next_h.get("countries") else "")
-            )
-            flag = COUNTRY_FLAGS.get(country, "🌍")
+            # Flag of the first country (precomputed on the record)
+            flag = next_h.flag
 
             cat_line = build_category_line_for_cmd(next_h)
 
             if cat_line:
                 value = (
-                    f"{flag} **{next_h['name']}**\n"
+                    f"{flag} **{next_h.name}**\n"
                     f"{cat_line}\n"
-                    f"📅 {next_h['parsed_date'].strftime('%m-%d')}"
+                    f"📅 {next_h.parsed_date.strftime('%m-%d')}"
                 )
             else:
                 value = (
-                    f"{flag} **{next_h['name']}**\n"
-                    f"📅 {next_h['parsed_date'].strftime('%m-%d')}"
+                    f"{flag} **{next_h.name}**\n"
+                    f"📅 {next_h.parsed_date.strftime('%m-%d')}"
                 )
 
             embed.add_field(
@@ -222,11 +160,140 @@ async def holidays_cmd(ctx):
                 inline=False,
             )
 
+    return embed
+
+
+# ===========================
+# Holiday by Name Embed
+# `/holidays name:<autocomplete>`
+# ===========================
+def build_name_embed(today, name):
+    """Next occurrence of every holiday called `name`."""
+    matches = sorted(get_holiday_index().names(today).exact(name), key=lambda h: h.parsed_date)
+
+    embed = discord.Embed(
+        title=f"📅 {name}",
+        color=0x00AEEF,
+    )
+
+    if not matches:
+        embed.description = "❌ No holiday with this name"
+        return embed
+
+    for h in matches[:MAX_UPCOMING_FIELDS]:
+        cat_line = build_category_line_for_cmd(h)
+        days_left = (h.parsed_date - today).days
+        when = f"📅 {h.parsed_date.strftime('%d.%m.%Y')} ({'today' if days_left == 0 else f'in {days_left} day(s)'})"
+        embed.add_field(
+            name=f"{h.flag} {h.name}",
+            value=f"{cat_line}\n{when}" if cat_line else when,
+            inline=False,
+        )
+
+    return embed
+
+
+async def holiday_name_autocomplete(
+    interaction: discord.Interaction,
+    current: str,
+) -> List[app_commands.Choice[str]]:
+    """Holiday names by word prefix (HolidayNameIndex); upcoming ones when empty."""
+    today = local_today()
+    index = get_holiday_index()
+
+    if current.strip():
+        found = await io_pool.run(
+            "holidays.names", lambda: index.names(today).search(current), resource="holidays"
+        )
+    else:
+        found = await io_pool.run(
+            "holidays.upcoming", lambda: index.upcoming_within(today, 60)[:25], resource="holidays"
+        )
+
+    names = dict.fromkeys(h.name[:100] for h in found)
+    return [app_commands.Choice(name=n, value=n) for n in names]
+
+
+# ===========================
+# Cached / Coalesced Responses
+# ===========================
+# The embeds only change when the date rolls over or the holiday data
+# changes, so they are cached per (date, data version, days) and
+# concurrent identical requests share a single build.
+# Index access (stat / partition parsing) and the build itself run in
+# the I/O pool, serialized on the "holidays" resource.
+_responses = ResponseCache(max_items=32)
+
+
+async def get_holidays_embed(today, days=0):
+    """Return the (cached) `!holidays` embed; None if no source exists."""
+    days = min(max(days, 0), MAX_UPCOMING_DAYS)
+    version = await io_pool.run(
+        "holidays.version", get_holiday_index().data_version, today, resource="holidays"
+    )
+    key = (today, version, days)
+
+    async def build():
+        if days > 0:
+            return await io_pool.run(
+                "holidays.upcoming", build_upcoming_embed, today, days, resource="holidays"
+            )
+        return await io_pool.run("holidays.sources", build_sources_embed, today, resource="holidays")
+
+    return await _responses.get_or_build(key, build)
+
+
+# ===========================
+# Command: !holidays
+# Show nearest holiday per source file
+# ===========================
+@commands.command(name="holidays")
+async def holidays_cmd(ctx, days: int = 0):
+    """
+    Diagnostic command: show nearest holiday for each source file.
+    `!holidays <days>` lists every holiday in the next <days> days instead.
+    """
+    embed = await get_holidays_embed(local_today(), days)
+    if embed is None:
+        return await ctx.send("❌ Error: holidays folder not found on server.")
+
     await ctx.send(embed=embed)
 
 
+# ===========================
+# Slash Command: /holidays [days] [name]
+# ===========================
+@app_commands.command(name="holidays", description="Nearest holidays, the next N days, or one holiday by name")
+@app_commands.describe(
+    days="List every holiday in the next N days",
+    name="Look up a holiday by name",
+)
+@app_commands.autocomplete(name=holiday_name_autocomplete)
+async def holidays_slash(
+    interaction: discord.Interaction,
+    days: app_commands.Range[int, 0, MAX_UPCOMING_DAYS] = 0,
+    name: str = "",
+):
+    # Builds may parse partitions in the I/O pool: acknowledge first
+    await interaction.response.defer(thinking=True)
+    today = local_today()
+
+    if name.strip():
+        embed = await io_pool.run(
+            "holidays.name", build_name_embed, today, name.strip(), resource="holidays"
+        )
+    else:
+        embed = await get_holidays_embed(today, days)
+
+    if embed is None:
+        return await interaction.followup.send("❌ Error: holidays folder not found on server.")
+
+    await interaction.followup.send(embed=embed)
+
+
 # ===========================
 # Registration Hook
 # ===========================
 def setup(bot):
     bot.add_command(holidays_cmd)
+    bot.tree.add_command(holidays_slash)
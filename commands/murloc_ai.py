@@ -7,7 +7,11 @@ import random
 import discord
 from discord.ext import commands
 
-from core.helpers import load_lines
+from core.corpus import TextCorpus
+from core.history_cache import MessageHistoryCache
+from core.io_executor import io_pool
+from core.settings import MORE_EDIT_IN_PLACE, MORE_HISTORY_SIZE, MORE_HISTORY_MESSAGES, MORE_VIEW_TIMEOUT
+from core.startup import startup
 
 
 # ===========================
@@ -17,6 +21,24 @@ MURLOC_STARTS_FILE = os.getenv("MURLOC_STARTS_FILE", "data/murloc_starts.txt")
 MURLOC_MIDDLES_FILE = os.getenv("MURLOC_MIDDLES_FILE", "data/murloc_middles.txt")
 MURLOC_ENDINGS_FILE = os.getenv("MURLOC_ENDINGS_FILE", "data/murloc_endings.txt")
 
+# Read by the startup warmup (or on first use); edits are picked up live
+_corpora = (
+    TextCorpus(MURLOC_STARTS_FILE),
+    TextCorpus(MURLOC_MIDDLES_FILE),
+    TextCorpus(MURLOC_ENDINGS_FILE),
+)
+
+
+@startup.warmup("murloc_ai", resource="murloc_ai")
+def murloc_lines():
+    """Current (starts, middles, ends) lines."""
+    return tuple(c.lines() for c in _corpora)
+
+
+async def load_murloc_lines():
+    """murloc_lines() in the I/O pool (stat per file, re-read after an edit)."""
+    return await io_pool.run("murloc_ai.load", murloc_lines, resource="murloc_ai")
+
 
 # ===========================
 # Phrase Generator
@@ -34,17 +56,103 @@ def generate_murloc_phrase(starts, middles, ends) -> str:
 
 
 # ===========================
-# Interactive UI View (Button: More)
+# "More" Button Mode
+# ===========================
+# Carousel history is only meaningful when the message is edited in place.
+CAROUSEL_ENABLED = MORE_EDIT_IN_PLACE and MORE_HISTORY_SIZE > 0
+
+_history = MessageHistoryCache(
+    max_messages=MORE_HISTORY_MESSAGES,
+    max_entries=MORE_HISTORY_SIZE or 1,
+)
+
+
+# ===========================
+# Embed Builder
+# ===========================
+def build_murloc_embed(phrase: str) -> discord.Embed:
+    """Render a Murloc wisdom phrase as an embed."""
+    embed = discord.Embed(
+        title="🐸 Murloc AI Wisdom 🧠",
+        description=phrase,
+        color=discord.Color.blue(),
+    )
+    embed.set_footer(text="🐸 Mrrglglglgl! 🐸")
+    return embed
+
+
+# ===========================
+# Interactive UI View (Buttons: ◀ / More / ▶)
 # ===========================
 class MurlocView(discord.ui.View):
-    """UI component allowing users to request more Murloc wisdom."""
+    """
+    UI component allowing users to request more Murloc wisdom.
+
+    Same modes as QuoteView: new message per click by default,
+    edit-in-place with MORE_EDIT_IN_PLACE, prev/next carousel
+    with MORE_HISTORY_SIZE > 0.
+    """
 
     def __init__(self, starts, middles, ends):
-        super().__init__(timeout=None)
+        super().__init__(timeout=MORE_VIEW_TIMEOUT or None)
         self.starts = starts
         self.middles = middles
         self.ends = ends
 
+        if CAROUSEL_ENABLED:
+            # A fresh message has a single entry: nothing to browse yet
+            self.prev_ai.disabled = True
+            self.next_ai.disabled = True
+        else:
+            self.remove_item(self.prev_ai)
+            self.remove_item(self.next_ai)
+
+    def _sync_buttons(self, message_id: int) -> None:
+        """Enable/disable carousel buttons based on the cursor position."""
+        cursor, size = _history.position(message_id)
+        self.prev_ai.disabled = cursor <= 0
+        self.next_ai.disabled = cursor >= size - 1
+
+    async def _show_new(self, interaction: discord.Interaction) -> None:
+        phrase = generate_murloc_phrase(self.starts, self.middles, self.ends)
+
+        if not MORE_EDIT_IN_PLACE:
+            await interaction.response.send_message(
+                embed=build_murloc_embed(phrase),
+                view=MurlocView(self.starts, self.middles, self.ends),
+            )
+            return
+
+        if CAROUSEL_ENABLED:
+            _history.push(interaction.message.id, phrase)
+            self._sync_buttons(interaction.message.id)
+
+        await interaction.response.edit_message(
+            embed=build_murloc_embed(phrase),
+            view=self,
+        )
+
+    async def _show_step(self, interaction: discord.Interaction, delta: int) -> None:
+        phrase = _history.step(interaction.message.id, delta)
+        if phrase is None:
+            # History was evicted (or bot restarted) → generate a new phrase
+            return await self._show_new(interaction)
+
+        self._sync_buttons(interaction.message.id)
+        await interaction.response.edit_message(
+            embed=build_murloc_embed(phrase),
+            view=self,
+        )
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def prev_ai(
+        self,
+        interaction: discord.Interaction,
+        button: discord.ui.Button
+    ):
+        """Show the previous phrase from this message's history."""
+        await self._show_step(interaction, -1)
+
     @discord.ui.button(label="More", style=discord.ButtonStyle.primary)
     async def more_ai(
         self,
@@ -52,19 +160,16 @@ class MurlocView(discord.ui.View):
         button: discord.ui.Button
     ):
         """Generate and return another Murloc wisdom phrase."""
-        phrase = generate_murloc_phrase(self.starts, self.middles, self.ends)
-
-        embed = discord.Embed(
-            title="🐸 Murloc AI Wisdom 🧠",
-            description=phrase,
-            color=discord.Color.blue(),
-        )
-        embed.set_footer(text="🐸 Mrrglglglgl! 🐸")
+        await self._show_new(interaction)
 
-        await interaction.response.send_message(
-            embed=embed,
-            view=MurlocView(self.starts, self.middles, self.ends),
-        )
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_ai(
+        self,
+        interaction: discord.Interaction,
+        button: discord.ui.Button
+    ):
+        """Show the next phrase from this message's history."""
+        await self._show_step(interaction, 1)
 
 
 # ===========================
@@ -72,10 +177,7 @@ class MurlocView(discord.ui.View):
 # Registers the !murloc_ai command
 # ===========================
 def setup(bot: commands.Bot) -> None:
-    # Preload data files once at startup
-    starts = load_lines(MURLOC_STARTS_FILE)
-    middles = load_lines(MURLOC_MIDDLES_FILE)
-    ends = load_lines(MURLOC_ENDINGS_FILE)
+    # Data files are loaded by the startup warmup, not here
 
     # -------------------------------------------
     # !murloc_ai — Generate a wisdom phrase
@@ -84,16 +186,30 @@ def setup(bot: commands.Bot) -> None:
     async def murloc_ai_cmd(ctx: commands.Context):
         """Generate and send Murloc wisdom."""
 
+        starts, middles, ends = await load_murloc_lines()
         phrase = generate_murloc_phrase(starts, middles, ends)
 
-        embed = discord.Embed(
-            title="🐸 Murloc AI Wisdom 🧠",
-            description=phrase,
-            color=discord.Color.blue(),
+        msg = await ctx.send(
+            embed=build_murloc_embed(phrase),
+            view=MurlocView(starts, middles, ends),
         )
-        embed.set_footer(text="🐸 Mrrglglglgl! 🐸")
 
-        await ctx.send(
-            embed=embed,
+        if CAROUSEL_ENABLED:
+            _history.push(msg.id, phrase)
+
+    # -------------------------------------------
+    # /murloc_ai — same, as a slash command
+    # -------------------------------------------
+    @bot.tree.command(name="murloc_ai", description="Generate Murloc AI wisdom")
+    async def slash_murloc_ai(interaction: discord.Interaction):
+        starts, middles, ends = await load_murloc_lines()
+        phrase = generate_murloc_phrase(starts, middles, ends)
+
+        await interaction.response.send_message(
+            embed=build_murloc_embed(phrase),
             view=MurlocView(starts, middles, ends),
         )
+
+        if CAROUSEL_ENABLED:
+            msg = await interaction.original_response()
+            _history.push(msg.id, phrase)
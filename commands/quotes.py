@@ -7,7 +7,11 @@ import random
 import discord
 from discord.ext import commands
 
-from core.helpers import load_lines
+from core.corpus import TextCorpus
+from core.history_cache import MessageHistoryCache
+from core.io_executor import io_pool
+from core.settings import MORE_EDIT_IN_PLACE, MORE_HISTORY_SIZE, MORE_HISTORY_MESSAGES, MORE_VIEW_TIMEOUT
+from core.startup import startup
 
 
 # ===========================
@@ -15,38 +19,131 @@ from core.helpers import load_lines
 # ===========================
 QUOTES_FILE = os.getenv("QUOTES_FILE", "data/quotes.txt")
 
+# Read by the startup warmup (or on first use); edits are picked up live
+quotes_corpus = TextCorpus(QUOTES_FILE)
+startup.warmup("quotes", resource="quotes")(quotes_corpus.lines)
+
+
+async def load_quotes():
+    """Current quotes; the stat (and re-read after an edit) runs in the I/O pool."""
+    return await io_pool.run("quotes.load", quotes_corpus.lines, resource="quotes")
+
+
+# ===========================
+# "More" Button Mode
+# ===========================
+# Carousel history is only meaningful when the message is edited in place.
+CAROUSEL_ENABLED = MORE_EDIT_IN_PLACE and MORE_HISTORY_SIZE > 0
+
+_history = MessageHistoryCache(
+    max_messages=MORE_HISTORY_MESSAGES,
+    max_entries=MORE_HISTORY_SIZE or 1,
+)
+
+
+# ===========================
+# Embed Builder
+# ===========================
+def build_quote_embed(phrase: str) -> discord.Embed:
+    """Render a `Quote — Source` line as a quote embed."""
+    text, src = (phrase.split(" — ", 1) + ["Unknown"])[:2]
+
+    embed = discord.Embed(
+        title="🎮 GAME QUOTE",
+        description=text,
+        color=discord.Color.blue(),
+    )
+    embed.set_footer(text=src)
+    return embed
+
 
 # ===========================
-# Quotes UI View (Button: More)
+# Quotes UI View (Buttons: ◀ / More / ▶)
 # ===========================
 class QuoteView(discord.ui.View):
-    """Interactive view allowing users to request more game quotes."""
+    """
+    Interactive view allowing users to request more game quotes.
+
+    By default every click posts a new message. With MORE_EDIT_IN_PLACE
+    the same message is edited instead, and with MORE_HISTORY_SIZE > 0
+    the prev/next buttons browse the last quotes shown in it.
+    """
 
     def __init__(self, quotes: list[str]):
-        super().__init__(timeout=None)
+        super().__init__(timeout=MORE_VIEW_TIMEOUT or None)
         self.quotes = quotes
 
+        if CAROUSEL_ENABLED:
+            # A fresh message has a single entry: nothing to browse yet
+            self.prev_click.disabled = True
+            self.next_click.disabled = True
+        else:
+            self.remove_item(self.prev_click)
+            self.remove_item(self.next_click)
+
+    def _sync_buttons(self, message_id: int) -> None:
+        """Enable/disable carousel buttons based on the cursor position."""
+        cursor, size = _history.position(message_id)
+        self.prev_click.disabled = cursor <= 0
+        self.next_click.disabled = cursor >= size - 1
+
+    async def _show_new(self, interaction: discord.Interaction) -> None:
+        phrase = random.choice(self.quotes)
+
+        if not MORE_EDIT_IN_PLACE:
+            await interaction.response.send_message(
+                embed=build_quote_embed(phrase),
+                view=QuoteView(self.quotes),
+            )
+            return
+
+        if CAROUSEL_ENABLED:
+            _history.push(interaction.message.id, phrase)
+            self._sync_buttons(interaction.message.id)
+
+        await interaction.response.edit_message(
+            embed=build_quote_embed(phrase),
+            view=self,
+        )
+
+    async def _show_step(self, interaction: discord.Interaction, delta: int) -> None:
+        phrase = _history.step(interaction.message.id, delta)
+        if phrase is None:
+            # History was evicted (or bot restarted) → roll a new quote
+            return await self._show_new(interaction)
+
+        self._sync_buttons(interaction.message.id)
+        await interaction.response.edit_message(
+            embed=build_quote_embed(phrase),
+            view=self,
+        )
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def prev_click(
+        self,
+        interaction: discord.Interaction,
+        button: discord.ui.Button
+    ):
+        """Show the previous quote from this message's history."""
+        await self._show_step(interaction, -1)
+
     @discord.ui.button(label="More", style=discord.ButtonStyle.primary)
     async def more_click(
         self,
         interaction: discord.Interaction,
         button: discord.ui.Button
     ):
-        """Send another random quote when the button is pressed."""
-        phrase = random.choice(self.quotes)
-        text, src = (phrase.split(" — ", 1) + ["Unknown"])[:2]
-
-        embed = discord.Embed(
-            title="🎮 GAME QUOTE",
-            description=text,
-            color=discord.Color.blue(),
-        )
-        embed.set_footer(text=src)
+        """Show another random quote when the button is pressed."""
+        await self._show_new(interaction)
 
-        await interaction.response.send_message(
-            embed=embed,
-            view=QuoteView(self.quotes),
-        )
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_click(
+        self,
+        interaction: discord.Interaction,
+        button: discord.ui.Button
+    ):
+        """Show the next quote from this message's history."""
+        await self._show_step(interaction, 1)
 
 
 # ===========================
@@ -54,7 +151,6 @@ class QuoteView(discord.ui.View):
 # Registers: !quote
 # ===========================
 def setup(bot: commands.Bot) -> None:
-    quotes = load_lines(QUOTES_FILE)
 
     # -------------------------------------------
     # !quote — Random game quote
@@ -63,20 +159,36 @@ def setup(bot: commands.Bot) -> None:
     async def quote_cmd(ctx: commands.Context):
         """Send a random game quote with its source."""
 
+        quotes = await load_quotes()
         if not quotes:
             return await ctx.send("❌ Quotes file is empty 😢")
 
         phrase = random.choice(quotes)
-        text, src = (phrase.split(" — ", 1) + ["Unknown"])[:2]
 
-        embed = discord.Embed(
-            title="🎮 GAME QUOTE",
-            description=text,
-            color=discord.Color.blue(),
+        msg = await ctx.send(
+            embed=build_quote_embed(phrase),
+            view=QuoteView(quotes),
         )
-        embed.set_footer(text=src)
 
-        await ctx.send(
-            embed=embed,
+        if CAROUSEL_ENABLED:
+            _history.push(msg.id, phrase)
+
+    # -------------------------------------------
+    # /quote — same, as a slash command
+    # -------------------------------------------
+    @bot.tree.command(name="quote", description="Random game quote")
+    async def slash_quote(interaction: discord.Interaction):
+        quotes = await load_quotes()
+        if not quotes:
+            return await interaction.response.send_message("❌ Quotes file is empty 😢", ephemeral=True)
+
+        phrase = random.choice(quotes)
+
+        await interaction.response.send_message(
+            embed=build_quote_embed(phrase),
             view=QuoteView(quotes),
         )
+
+        if CAROUSEL_ENABLED:
+            msg = await interaction.original_response()
+            _history.push(msg.id, phrase)
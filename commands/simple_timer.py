@@ -4,9 +4,36 @@
 
 import asyncio
 import discord
+from discord import app_commands
 from discord.ext import commands
 
 
+DEFAULT_TIMER_TEXT = "⏰ Time's up!"
+
+
+# ===========================
+# Embed Builders (prefix + slash)
+# ===========================
+def build_started_embed(mention: str, total_seconds: int, text: str) -> discord.Embed:
+    return discord.Embed(
+        title="⏱ Timer started!",
+        description=(
+            f"{mention}\n"
+            f"Duration: **{total_seconds} sec**\n"
+            f"Message: {text}"
+        ),
+        color=discord.Color.orange(),
+    )
+
+
+def build_finished_embed(mention: str, text: str) -> discord.Embed:
+    return discord.Embed(
+        title="⏰ Timer finished!",
+        description=f"{mention}\n{text}",
+        color=discord.Color.green(),
+    )
+
+
 # ===========================
 # Setup Function
 # Registers: !timer
@@ -28,7 +55,7 @@ def setup(bot: commands.Bot) -> None:
         ctx: commands.Context,
         duration: str,
         *,
-        text: str = "⏰ Time's up!"
+        text: str = DEFAULT_TIMER_TEXT
     ):
         """Create a simple countdown timer."""
 
@@ -43,16 +70,7 @@ def setup(bot: commands.Bot) -> None:
         # ===========================
         # Send "Timer Started" Embed
         # ===========================
-        embed = discord.Embed(
-            title="⏱ Timer started!",
-            description=(
-                f"{ctx.author.mention}\n"
-                f"Duration: **{total_seconds} sec**\n"
-                f"Message: {text}"
-            ),
-            color=discord.Color.orange(),
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=build_started_embed(ctx.author.mention, total_seconds, text))
 
         # ===========================
         # Wait for Timer
@@ -62,12 +80,26 @@ def setup(bot: commands.Bot) -> None:
         # ===========================
         # Send "Timer Finished" Embed
         # ===========================
-        embed_done = discord.Embed(
-            title="⏰ Timer finished!",
-            description=f"{ctx.author.mention}\n{text}",
-            color=discord.Color.green(),
-        )
-        await ctx.send(embed=embed_done)
+        await ctx.send(embed=build_finished_embed(ctx.author.mention, text))
+
+    # -------------------------------------------
+    # /timer duration [text]
+    # -------------------------------------------
+    @bot.tree.command(name="timer", description="Start a simple countdown (10s, 5m, 1h20m, 90)")
+    @app_commands.describe(duration="e.g. 10s, 5m, 1h20m (a plain number = minutes)", text="Message when time is up")
+    async def slash_timer(interaction: discord.Interaction, duration: str, text: str = DEFAULT_TIMER_TEXT):
+        try:
+            total_seconds = parse_duration(duration)
+        except Exception as e:
+            return await interaction.response.send_message(f"❌ Error: {e}", ephemeral=True)
+
+        mention = interaction.user.mention
+        await interaction.response.send_message(embed=build_started_embed(mention, total_seconds, text))
+
+        await asyncio.sleep(total_seconds)
+
+        # The interaction token expires after 15 minutes: post to the channel
+        await interaction.channel.send(embed=build_finished_embed(mention, text))
 
 
 # ===========================
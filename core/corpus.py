@@ -0,0 +1,137 @@
+# ==================================================
+# core/corpus.py — Hot-Reloadable Text Corpora + Shuffle Bag
+# ==================================================
+#
+# TextCorpus: a line-per-entry text file (same format as load_lines),
+# read once and re-read only when its mtime/size change, so callers can
+# ask for it on every use and still pick up edits without a restart.
+# Every reload bumps `version` (use it in cache keys).
+#
+# ShuffleBag: walks a corpus in a shuffled order, every entry once per
+# cycle, so the same line never comes back before all others were used.
+# The order is derived from (seed, cycle, corpus size), so a cursor
+# (e.g. a day ordinal) always maps to the same entry — no state to
+# persist across restarts.
+#
+# Layer: Core
+# ==================================================
+
+import itertools
+import logging
+import os
+import random
+from typing import Dict, List, Optional, Tuple
+
+from core.helpers import load_lines
+
+logger = logging.getLogger("corpus")
+
+_versions = itertools.count(1)
+
+
+# ===========================
+# Text Corpus
+# ===========================
+class TextCorpus:
+    """Lines of a UTF-8 text file, reloaded when the file changes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._lines: Tuple[str, ...] = ()
+        self._version = 0
+
+    def _current_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def lines(self) -> Tuple[str, ...]:
+        """Current lines (a stat per call; the file is only read when it changed)."""
+        stamp = self._current_stamp()
+        if stamp != self._stamp or self._version == 0:
+            self._reload(stamp)
+        return self._lines
+
+    def _reload(self, stamp: Optional[Tuple[int, int]]) -> None:
+        try:
+            lines = tuple(load_lines(self.path))
+        except (OSError, UnicodeDecodeError):
+            # Keep the last good copy; retry on the next change
+            logger.exception("Failed to read corpus %s; keeping %d cached line(s).", self.path, len(self._lines))
+            self._stamp = stamp
+            return
+
+        if stamp is None and self._version:
+            logger.warning("Corpus %s is missing.", self.path)
+        self._stamp = stamp
+        self._lines = lines
+        self._version = next(_versions)
+        logger.info("Loaded corpus %s: %d line(s).", self.path, len(lines))
+
+    @property
+    def version(self) -> int:
+        self.lines()
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self.lines())
+
+    def __getitem__(self, index: int) -> str:
+        return self.lines()[index]
+
+
+# ===========================
+# Shuffle Bag
+# ===========================
+class ShuffleBag:
+    """Deterministic shuffle-bag cursor over a TextCorpus."""
+
+    def __init__(self, corpus: TextCorpus, seed: str):
+        self.corpus = corpus
+        self.seed = seed
+        self.cursor = 0
+        self._orders: Dict[Tuple[int, int], List[int]] = {}
+
+    def _shuffled(self, cycle: int, size: int) -> List[int]:
+        order = list(range(size))
+        random.Random(f"{self.seed}:{size}:{cycle}").shuffle(order)
+        return order
+
+    def _order(self, cycle: int, size: int) -> List[int]:
+        key = (cycle, size)
+        order = self._orders.get(key)
+        if order is not None:
+            return order
+
+        order = self._shuffled(cycle, size)
+        # No repeat across the cycle boundary (the swap never moves the
+        # last entry when size > 2, so the previous cycle's raw order is enough)
+        if size > 2 and order[0] == self._shuffled(cycle - 1, size)[-1]:
+            order[0], order[1] = order[1], order[0]
+
+        if len(self._orders) >= 8:
+            self._orders.clear()
+        self._orders[key] = order
+        return order
+
+    def index_at(self, cursor: int) -> Optional[int]:
+        """Corpus index for `cursor`, or None if the corpus is empty."""
+        size = len(self.corpus)
+        if not size:
+            return None
+        cycle, pos = divmod(cursor, size)
+        return self._order(cycle, size)[pos]
+
+    def at(self, cursor: int) -> Optional[Tuple[int, str]]:
+        """(index, line) for `cursor`, or None if the corpus is empty."""
+        index = self.index_at(cursor)
+        return None if index is None else (index, self.corpus[index])
+
+    def draw(self) -> Optional[Tuple[int, str]]:
+        """(index, line) at the internal cursor, then advance it."""
+        item = self.at(self.cursor)
+        self.cursor += 1
+        return item
@@ -1,8 +1,32 @@
 # ==================================================
-# core/dynamic_holidays.py — Dynamic Holiday Generator
+# core/dynamic_holidays.py — Dynamic Holiday Rule Engine
+# ==================================================
+#
+# Movable holidays are described declaratively as rules:
+#   • EasterRelative  — N days from Western or Orthodox Easter
+#   • NthWeekday      — e.g. 4th Thursday of November
+#   • LastWeekday     — e.g. last Monday of May
+#   • LunarTable      — explicit per-year dates (lunar calendars)
+#
+# Each year's table is materialized once ({date: [holidays]}) and
+# cached for the current and next year, so lookups by date are O(1)
+# and adding rules adds no per-request computation.
+#
+# Layer: Core
 # ==================================================
 
+import logging
+from abc import ABC, abstractmethod
+from calendar import monthrange
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, date
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.settings import local_today
+
+logger = logging.getLogger("dynamic_holidays")
+
+MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
 
 
 # ===========================
@@ -34,56 +58,202 @@ def _easter_western(year: int) -> date:
 
 
 # ===========================
-# Orthodox Easter (Approximation)
+# Orthodox Easter Calculation
 # ===========================
 def _easter_orthodox(year: int) -> date:
     """
-    Approximate Orthodox Easter by adding 13 days
-    to the Western Easter (Julian vs Gregorian shift).
-    This is sufficient for bot-level accuracy.
+    Calculate Orthodox Easter with the Julian computus (Meeus),
+    then convert the Julian date to the Gregorian calendar.
     """
-    western = _easter_western(year)
-    return western + timedelta(days=13)
+    a = year % 4
+    b = year % 7
+    c = year % 19
+    d = (19 * c + 15) % 30
+    e = (2 * a + 4 * b - d + 34) % 7
+
+    month = (d + e + 114) // 31
+    day = ((d + e + 114) % 31) + 1
+
+    # Julian → Gregorian offset: 13 days for 1900–2099, 14 for 2100–2199, ...
+    shift = year // 100 - year // 400 - 2
+    return date(year, month, day) + timedelta(days=shift)
 
 
 # ===========================
-# Public API: Dynamic Holidays
+# Rule Types
+# ===========================
+@dataclass(frozen=True)
+class HolidayRule(ABC):
+    """Base rule: a named holiday whose date depends on the year."""
+
+    name: str
+    countries: Tuple[str, ...] = ()
+    categories: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def date_in(self, year: int) -> Optional[date]:
+        """Occurrence in `year`, or None if there is none."""
+
+    def as_entry(self, day: date) -> dict:
+        return {
+            "full_date": day.strftime("%Y-%m-%d"),
+            "date": day.strftime("%m-%d"),
+            "name": self.name,
+            "countries": list(self.countries),
+            "categories": list(self.categories),
+        }
+
+
+@dataclass(frozen=True)
+class EasterRelative(HolidayRule):
+    """`offset` days from Easter (negative = before)."""
+
+    offset: int = 0
+    orthodox: bool = False
+
+    def date_in(self, year: int) -> Optional[date]:
+        easter = _easter_orthodox(year) if self.orthodox else _easter_western(year)
+        return easter + timedelta(days=self.offset)
+
+
+@dataclass(frozen=True)
+class NthWeekday(HolidayRule):
+    """The n-th `weekday` (MON..SUN) of `month`, n starting at 1."""
+
+    month: int = 1
+    weekday: int = MON
+    n: int = 1
+
+    def date_in(self, year: int) -> Optional[date]:
+        first = date(year, self.month, 1)
+        day = 1 + (self.weekday - first.weekday()) % 7 + 7 * (self.n - 1)
+        if day > monthrange(year, self.month)[1]:
+            return None
+        return date(year, self.month, day)
+
+
+@dataclass(frozen=True)
+class LastWeekday(HolidayRule):
+    """The last `weekday` (MON..SUN) of `month`."""
+
+    month: int = 1
+    weekday: int = MON
+
+    def date_in(self, year: int) -> Optional[date]:
+        last = date(year, self.month, monthrange(year, self.month)[1])
+        return last - timedelta(days=(last.weekday() - self.weekday) % 7)
+
+
+_LUNAR_WARNED: Set[Tuple[str, int]] = set()
+
+
+@dataclass(frozen=True)
+class LunarTable(HolidayRule):
+    """Explicit {year: "MM-DD"} table; years outside it have no occurrence."""
+
+    dates: Dict[int, str] = field(default_factory=dict)
+
+    def date_in(self, year: int) -> Optional[date]:
+        mmdd = self.dates.get(year)
+        if not mmdd:
+            if (self.name, year) not in _LUNAR_WARNED:
+                _LUNAR_WARNED.add((self.name, year))
+                logger.warning("No %s date for %d in its LunarTable; extend the table.", self.name, year)
+            return None
+        return datetime.strptime(f"{year}-{mmdd}", "%Y-%m-%d").date()
+
+
+# ===========================
+# Rule Set
+# ===========================
+DYNAMIC_RULES: List[HolidayRule] = [
+    EasterRelative("Catholic Easter", ("catholic",), ("Religious",)),
+    EasterRelative("Orthodox Easter", ("orthodox",), ("Religious",), orthodox=True),
+    EasterRelative("Good Friday", ("catholic",), ("Religious",), offset=-2),
+    EasterRelative("Maslenitsa", ("russia",), ("Cultural",), offset=-55, orthodox=True),
+    NthWeekday("Martin Luther King Jr. Day", ("usa",), ("Federal",), month=1, weekday=MON, n=3),
+    NthWeekday("Presidents' Day", ("usa",), ("Federal",), month=2, weekday=MON, n=3),
+    NthWeekday("Thanksgiving Day", ("usa",), ("Federal",), month=11, weekday=THU, n=4),
+    LastWeekday("Memorial Day", ("usa",), ("Federal",), month=5, weekday=MON),
+    LunarTable(
+        "Chinese New Year",
+        ("china",),
+        ("Cultural",),
+        dates={
+            2024: "02-10",
+            2025: "01-29",
+            2026: "02-17",
+            2027: "02-06",
+            2028: "01-26",
+            2029: "02-13",
+            2030: "02-03",
+        },
+    ),
+]
+
+
 # ===========================
-def get_dynamic_holidays() -> list[dict]:
+# Materialized Year Tables
+# ===========================
+_MAX_CACHED_YEARS = 2
+_YEAR_TABLES: Dict[int, Dict[date, List[dict]]] = {}
+_UPCOMING: Tuple[Optional[date], List[dict]] = (None, [])
+
+
+def materialize_year(year: int) -> Dict[date, List[dict]]:
+    """
+    Return {date: [holiday entries]} for all rules in `year`.
+    Built once per year; only the most recent years are kept.
     """
-    Return upcoming occurrences of:
-      • Catholic Easter
-      • Orthodox Easter
+    table = _YEAR_TABLES.get(year)
+    if table is not None:
+        return table
+
+    table = {}
+    for rule in DYNAMIC_RULES:
+        day = rule.date_in(year)
+        if day is not None:
+            table.setdefault(day, []).append(rule.as_entry(day))
 
-    If Easters for the current year have already passed,
-    the function automatically shifts calculations to next year.
+    _YEAR_TABLES[year] = table
+    while len(_YEAR_TABLES) > _MAX_CACHED_YEARS:
+        del _YEAR_TABLES[min(_YEAR_TABLES)]
+    return table
+
+
+def get_dynamic_on(day: date) -> List[dict]:
+    """Dynamic holidays falling on `day` (O(1) lookup)."""
+    return materialize_year(day.year).get(day, [])
+
+
+# ===========================
+# Public API: Dynamic Holidays
+# ===========================
+def get_dynamic_holidays(today: Optional[date] = None) -> list[dict]:
     """
+    Return the next occurrence (>= today) of every dynamic holiday,
+    sorted by date. Occurrences already past this year roll over to
+    next year. The result is cached per day: treat it as read-only.
+    """
+    global _UPCOMING
 
-    today = datetime.now().date()
-    year = today.year
-
-    catholic = _easter_western(year)
-    orthodox = _easter_orthodox(year)
-
-    # If both holidays are in the past → use next year
-    if max(catholic, orthodox) < today:
-        year += 1
-        catholic = _easter_western(year)
-        orthodox = _easter_orthodox(year)
-
-    return [
-        {
-            "full_date": catholic.strftime("%Y-%m-%d"),
-            "date": catholic.strftime("%m-%d"),
-            "name": "Catholic Easter",
-            "countries": ["catholic"],
-            "categories": ["Religious"],
-        },
-        {
-            "full_date": orthodox.strftime("%Y-%m-%d"),
-            "date": orthodox.strftime("%m-%d"),
-            "name": "Orthodox Easter",
-            "countries": ["orthodox"],
-            "categories": ["Religious"],
-        },
-    ]
+    today = today or local_today()
+    if _UPCOMING[0] == today:
+        return _UPCOMING[1]
+
+    this_year = materialize_year(today.year)
+    next_year = materialize_year(today.year + 1)
+
+    seen: set[str] = set()
+    upcoming: list[dict] = []
+    for table, is_this_year in ((this_year, True), (next_year, False)):
+        for day in sorted(table):
+            if is_this_year and day < today:
+                continue
+            for entry in table[day]:
+                if entry["name"] not in seen:
+                    seen.add(entry["name"])
+                    upcoming.append(entry)
+
+    _UPCOMING = (today, upcoming)
+    return upcoming
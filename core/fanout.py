@@ -0,0 +1,132 @@
+# ==================================================
+# core/fanout.py — Concurrent Channel Fan-Out
+# ==================================================
+#
+# Sends one message per channel to many channels concurrently, with a
+# cap on in-flight sends (DAILY_SEND_CONCURRENCY, default 5).
+#
+# Rate limits: every channel is its own Discord route bucket
+# (POST /channels/{id}/messages) and discord.py's HTTP client already
+# serializes and backs off per bucket and on the global limit. The
+# dispatcher sends at most one message per channel per call, so
+# concurrent sends never contend for the same bucket; the cap keeps
+# bursts well under the global limit.
+#
+# Every call returns per-channel outcome + latency stats. Daily jobs
+# call `report.raise_if_all_failed()`: a run where no channel got the
+# post raises FanoutError, so the scheduler does not mark it done and
+# retries it on the next tick / restart (partial failures are only logged,
+# a retry would re-post to the channels that succeeded).
+#
+# Layer: Core
+# ==================================================
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from core.settings import env_int
+
+logger = logging.getLogger("fanout")
+
+DAILY_SEND_CONCURRENCY = env_int("DAILY_SEND_CONCURRENCY", 5, minimum=1)
+
+
+class FanoutError(RuntimeError):
+    """Every channel of a fan-out failed."""
+
+
+@dataclass(frozen=True)
+class SendResult:
+    """Outcome of one channel send."""
+
+    channel_id: int
+    ok: bool
+    latency_ms: float
+    error: Optional[str] = None
+
+
+@dataclass
+class FanoutReport:
+    """Per-channel results of one fan-out, in target order."""
+
+    label: str
+    results: List[SendResult] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def sent(self) -> List[int]:
+        return [r.channel_id for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[SendResult]:
+        return [r for r in self.results if not r.ok]
+
+    def raise_if_all_failed(self) -> None:
+        if self.results and not self.sent:
+            raise FanoutError(f"{self.label}: all {len(self.results)} channel send(s) failed")
+
+    def log(self) -> None:
+        if not self.results:
+            return
+        slowest = max(self.results, key=lambda r: r.latency_ms)
+        logger.info(
+            "%s: sent to %d/%d channel(s) in %.0f ms (slowest %s: %.0f ms)",
+            self.label,
+            len(self.sent),
+            len(self.results),
+            self.elapsed_ms,
+            slowest.channel_id,
+            slowest.latency_ms,
+        )
+        for r in self.failed:
+            logger.warning("%s: channel %s failed: %s", self.label, r.channel_id, r.error)
+
+
+async def _send_one(bot, channel_id: int, kwargs: Dict[str, Any], gate: asyncio.Semaphore) -> SendResult:
+    channel = bot.get_channel(channel_id)
+    if channel is None:
+        return SendResult(channel_id, False, 0.0, "channel not found")
+
+    async with gate:
+        start = time.perf_counter()
+        try:
+            await channel.send(**kwargs)
+        except Exception as e:
+            latency = (time.perf_counter() - start) * 1000
+            logger.debug("Send to channel %s failed.", channel_id, exc_info=True)
+            return SendResult(channel_id, False, latency, f"{type(e).__name__}: {e}")
+        return SendResult(channel_id, True, (time.perf_counter() - start) * 1000)
+
+
+async def fan_out(
+    bot,
+    messages: Mapping[int, Dict[str, Any]],
+    *,
+    label: str = "fan-out",
+    concurrency: Optional[int] = None,
+) -> FanoutReport:
+    """
+    Send `messages[channel_id]` (kwargs for channel.send) to every channel
+    concurrently, at most `concurrency` in flight. Never raises for a
+    single channel: failures are reported in the returned FanoutReport.
+    """
+    report = FanoutReport(label)
+    if not messages:
+        return report
+
+    gate = asyncio.Semaphore(max(1, concurrency or DAILY_SEND_CONCURRENCY))
+    start = time.perf_counter()
+    report.results = list(
+        await asyncio.gather(*(_send_one(bot, cid, kwargs, gate) for cid, kwargs in messages.items()))
+    )
+    report.elapsed_ms = (time.perf_counter() - start) * 1000
+    report.log()
+    return report
+
+
+async def fan_out_same(bot, channel_ids: Iterable[int], *, label: str = "fan-out", **kwargs: Any) -> FanoutReport:
+    """Send the same message to each channel (duplicate IDs are sent once)."""
+    return await fan_out(bot, {cid: kwargs for cid in channel_ids}, label=label)
@@ -48,9 +48,14 @@ def save_timers(data: dict) -> None:
     """
     Save the timer dictionary back to timers.json
     using pretty-printed UTF-8 JSON.
+
+    Written to a temp file and renamed, so a reader (or a crash) never
+    sees half a file. Blocking: async code goes through core.timers.save().
     """
-    with open(TIMERS_FILE, "w", encoding="utf-8") as f:
+    tmp = f"{TIMERS_FILE}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, TIMERS_FILE)
 
 
 # ===========================
@@ -0,0 +1,87 @@
+# ==================================================
+# core/history_cache.py — Bounded Per-Message History
+# ==================================================
+#
+# Keeps a short history of generated items (quotes, Murloc phrases)
+# for each interactive message, so "More" buttons can edit the
+# message in place and offer a prev/next carousel.
+#
+# Both dimensions are bounded:
+# - at most `max_messages` messages are tracked (LRU eviction)
+# - each message keeps at most `max_entries` items (oldest dropped)
+#
+# Layer: Core
+# ==================================================
+
+from collections import OrderedDict, deque
+from typing import Any, Optional
+
+
+class _MessageHistory:
+    """History entries + cursor for a single message."""
+
+    __slots__ = ("entries", "cursor")
+
+    def __init__(self, max_entries: int):
+        self.entries: deque = deque(maxlen=max_entries)
+        self.cursor: int = -1
+
+
+class MessageHistoryCache:
+    """LRU cache of per-message histories, keyed by message ID."""
+
+    def __init__(self, max_messages: int = 256, max_entries: int = 10):
+        self.max_messages = max(1, max_messages)
+        self.max_entries = max(1, max_entries)
+        self._items: "OrderedDict[int, _MessageHistory]" = OrderedDict()
+
+    # ===========================
+    # Internal Helpers
+    # ===========================
+    def _get(self, message_id: int) -> Optional[_MessageHistory]:
+        history = self._items.get(message_id)
+        if history is not None:
+            self._items.move_to_end(message_id)
+        return history
+
+    # ===========================
+    # Public API
+    # ===========================
+    def push(self, message_id: int, item: Any) -> Any:
+        """
+        Append a new item for a message and move the cursor to it.
+        Evicts the least recently used message if the cache is full.
+        """
+        history = self._get(message_id)
+        if history is None:
+            history = _MessageHistory(self.max_entries)
+            self._items[message_id] = history
+            while len(self._items) > self.max_messages:
+                self._items.popitem(last=False)
+
+        history.entries.append(item)
+        history.cursor = len(history.entries) - 1
+        return item
+
+    def step(self, message_id: int, delta: int) -> Optional[Any]:
+        """
+        Move the cursor by `delta` (clamped to the history bounds)
+        and return the item under it, or None if nothing is cached.
+        """
+        history = self._get(message_id)
+        if history is None or not history.entries:
+            return None
+
+        last = len(history.entries) - 1
+        history.cursor = min(max(history.cursor + delta, 0), last)
+        return history.entries[history.cursor]
+
+    def position(self, message_id: int) -> tuple[int, int]:
+        """Return (cursor, size) for a message; (-1, 0) if unknown."""
+        history = self._items.get(message_id)
+        if history is None:
+            return -1, 0
+        return history.cursor, len(history.entries)
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,122 @@
+# ==================================================
+# core/http_client.py — Shared Async HTTP Client
+# ==================================================
+#
+# One pooled aiohttp session for every external fetch (Steam, ...),
+# so nothing blocks the event loop (gateway heartbeats, timer edits)
+# and TCP/TLS connections are reused between requests.
+#
+# - Lazily created inside the running loop; closed on bot shutdown.
+# - Total / connect timeouts from HTTP_TIMEOUT / HTTP_CONNECT_TIMEOUT.
+# - Responses are returned as plain HttpResponse values (status,
+#   headers, body), so conditional requests (ETag / Last-Modified)
+#   and local stub servers work the same way.
+#
+# aiohttp is already installed as a discord.py dependency.
+#
+# Layer: Core
+# ==================================================
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+import aiohttp
+from multidict import CIMultiDict
+
+logger = logging.getLogger("http")
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10") or 10)
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5") or 5)
+HTTP_USER_AGENT = "Mozilla/5.0 (Just_Quotes/1.0)"
+
+
+class HttpError(Exception):
+    """Network failure, timeout or unexpected status."""
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """A fully read response."""
+
+    url: str
+    status: int
+    # Case-insensitive, like HTTP itself: a server or proxy may send `etag`
+    headers: Mapping[str, str] = field(default_factory=CIMultiDict)
+    body: bytes = b""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        try:
+            return json.loads(self.body.decode("utf-8", errors="ignore"))
+        except ValueError as e:
+            raise HttpError(f"{self.url}: invalid JSON: {e}") from e
+
+
+class HttpClient:
+    """Pooled async HTTP client with timeouts."""
+
+    def __init__(
+        self,
+        *,
+        timeout: float = HTTP_TIMEOUT,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        max_connections: int = 10,
+        user_agent: str = HTTP_USER_AGENT,
+    ):
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.max_connections = max_connections
+        self.user_agent = user_agent
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300),
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        read_body: bool = True,
+    ) -> HttpResponse:
+        """Perform a request; raises HttpError on network errors / timeouts."""
+        try:
+            async with self._get_session().request(method, url, headers=headers) as resp:
+                body = await resp.read() if read_body else b""
+                return HttpResponse(str(resp.url), resp.status, CIMultiDict(resp.headers), body)
+        except asyncio.TimeoutError as e:
+            raise HttpError(f"{method} {url}: timed out") from e
+        except aiohttp.ClientError as e:
+            raise HttpError(f"{method} {url}: {e}") from e
+
+    async def get(self, url: str, *, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        return await self.request("GET", url, headers=headers)
+
+    async def get_json(self, url: str, *, headers: Optional[Dict[str, str]] = None) -> Any:
+        """GET + decode JSON; raises HttpError unless the status is 2xx."""
+        resp = await self.get(url, headers=headers)
+        if not resp.ok:
+            raise HttpError(f"GET {url}: HTTP {resp.status}")
+        return resp.json()
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# Shared instance (one connection pool for the whole bot)
+http = HttpClient()
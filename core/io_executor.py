@@ -0,0 +1,155 @@
+# ==================================================
+# core/io_executor.py — Blocking I/O Offload
+# ==================================================
+#
+# Disk reads, parsing and JSON writes run in a small thread pool so
+# they never stall the event loop (gateway heartbeats, timer edits,
+# other commands):
+#
+#   from core.io_executor import io_pool
+#
+#   events = await io_pool.run("birthday.load", load_birthday_events, resource="birthday")
+#
+# - `resource` serializes calls touching the same in-memory structure
+#   (e.g. the holiday index): at most one worker holds it at a time.
+# - Every call is timed per label (queue wait + run time); calls slower
+#   than IO_SLOW_MS are logged, and `io_pool.log_stats()` prints a summary.
+# - Pool size: IO_WORKERS (default 4).
+#
+# Layer: Core
+# ==================================================
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from core.settings import env_float, env_int
+
+logger = logging.getLogger("io")
+
+IO_WORKERS = env_int("IO_WORKERS", 4, minimum=1)
+IO_SLOW_MS = env_float("IO_SLOW_MS", 250.0)
+
+T = TypeVar("T")
+
+
+@dataclass
+class IOStat:
+    """Accumulated timings of one label."""
+
+    calls: int = 0
+    errors: int = 0
+    run_ms: float = 0.0
+    max_run_ms: float = 0.0
+    wait_ms: float = 0.0
+
+    @property
+    def avg_run_ms(self) -> float:
+        return self.run_ms / self.calls if self.calls else 0.0
+
+
+class IOExecutor:
+    """Thread pool with async wrappers and per-label timing."""
+
+    def __init__(self, max_workers: int = IO_WORKERS, slow_ms: float = IO_SLOW_MS):
+        self.max_workers = max_workers
+        self.slow_ms = slow_ms
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._stats: Dict[str, IOStat] = {}
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="io")
+        return self._pool
+
+    def _lock_for(self, resource: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(resource, threading.Lock())
+
+    def _record(self, label: str, wait_ms: float, run_ms: float, ok: bool) -> None:
+        stat = self._stats.setdefault(label, IOStat())
+        stat.calls += 1
+        stat.errors += 0 if ok else 1
+        stat.run_ms += run_ms
+        stat.max_run_ms = max(stat.max_run_ms, run_ms)
+        stat.wait_ms += wait_ms
+        if run_ms >= self.slow_ms:
+            logger.warning("Slow I/O %s: %.0f ms (queued %.0f ms).", label, run_ms, wait_ms)
+
+    async def run(
+        self,
+        label: str,
+        func: Callable[..., T],
+        *args: Any,
+        resource: Optional[str] = None,
+        **kwargs: Any,
+    ) -> T:
+        """Run `func(*args, **kwargs)` in the pool and await its result."""
+        lock = self._lock_for(resource) if resource else None
+        submitted = time.perf_counter()
+        timings = {}
+
+        def call() -> T:
+            if lock is not None:
+                lock.acquire()
+            started = time.perf_counter()
+            timings["wait"] = (started - submitted) * 1000
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings["run"] = (time.perf_counter() - started) * 1000
+                if lock is not None:
+                    lock.release()
+
+        ok = False
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._get_pool(), call)
+            ok = True
+            return result
+        finally:
+            if "run" in timings:
+                self._record(label, timings["wait"], timings["run"], ok)
+
+    def wrap(self, label: str, *, resource: Optional[str] = None):
+        """Decorator: async version of a blocking function."""
+
+        def decorator(func: Callable[..., T]) -> Callable[..., Any]:
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> T:
+                return await self.run(label, func, *args, resource=resource, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def stats(self) -> Dict[str, IOStat]:
+        return dict(self._stats)
+
+    def log_stats(self) -> None:
+        for label, s in sorted(self._stats.items()):
+            logger.info(
+                "I/O %s: %d call(s), avg %.1f ms, max %.1f ms, avg queue %.1f ms, %d error(s)",
+                label,
+                s.calls,
+                s.avg_run_ms,
+                s.max_run_ms,
+                s.wait_ms / s.calls if s.calls else 0.0,
+                s.errors,
+            )
+
+    def shutdown(self) -> None:
+        """Wait for pending writes, then stop the workers."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+# Shared instance for all loaders / persisters
+io_pool = IOExecutor()
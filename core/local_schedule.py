@@ -0,0 +1,170 @@
+# ==================================================
+# core/local_schedule.py — Per-Guild / Per-Channel Posting Times
+# ==================================================
+#
+# Daily posts go out at each job's own time in BOT_TZ unless a channel
+# or guild overrides it with a local time and/or timezone:
+#
+#   DAILY_SCHEDULE="<target>=<when>;<target>=<when>"
+#
+#   <target>  channel ID, or guild:<guild ID> (all of its daily channels)
+#   <when>    HH:MM@Area/City   time + timezone
+#             @Area/City        the job's own time (10:00, 10:01, ...) in that zone
+#             HH:MM             that time in BOT_TZ
+#
+#   DAILY_SCHEDULE="111=09:00@Asia/Tokyo;guild:222=@America/New_York"
+#
+# A channel entry wins over its guild's entry. Every resolved
+# (timezone, time) pair is a Slot: the scheduler groups a job's channels
+# by slot ("timezone buckets"), wakes up once per slot and dispatches
+# only that bucket, evaluated on the slot's local date.
+#
+# Layer: Core
+# ==================================================
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Callable, Dict, Optional, Set
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger("scheduler")
+
+
+@dataclass(frozen=True)
+class Slot:
+    """A local posting time: `at` wall-clock time in `tz`."""
+
+    tz: tzinfo
+    at: time
+
+    @property
+    def label(self) -> str:
+        return f"{self.at:%H:%M} {self.tz}"
+
+    def local_date(self, now: datetime) -> date:
+        return now.astimezone(self.tz).date()
+
+    def next_run(self, now: datetime) -> datetime:
+        """Next occurrence of this slot strictly after `now` (aware datetime)."""
+        local = now.astimezone(self.tz)
+        candidate = datetime.combine(local.date(), self.at, tzinfo=self.tz)
+        if candidate <= local:
+            candidate = datetime.combine(local.date() + timedelta(days=1), self.at, tzinfo=self.tz)
+        return candidate
+
+
+@dataclass(frozen=True)
+class SlotOverride:
+    """A partial slot from DAILY_SCHEDULE (None = keep the job's default)."""
+
+    tz: Optional[tzinfo] = None
+    at: Optional[time] = None
+
+    def apply(self, default: Slot) -> Slot:
+        return Slot(self.tz or default.tz, self.at or default.at)
+
+
+# ===========================
+# Parsing
+# ===========================
+def parse_tz(name: str) -> Optional[tzinfo]:
+    name = name.strip()
+    if name.upper() in ("UTC", "GMT", "Z"):
+        return timezone.utc
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+def _parse_when(value: str) -> Optional[SlotOverride]:
+    at_s, _, tz_s = value.strip().partition("@")
+    at: Optional[time] = None
+    tz: Optional[tzinfo] = None
+
+    if at_s.strip():
+        try:
+            hour, minute = (int(x) for x in at_s.strip().split(":", 1))
+            at = time(hour, minute)
+        except ValueError:
+            return None
+    if tz_s.strip():
+        tz = parse_tz(tz_s)
+        if tz is None:
+            return None
+
+    return SlotOverride(tz, at) if (tz or at) else None
+
+
+class LocalSchedule:
+    """Channel / guild → posting slot overrides."""
+
+    def __init__(
+        self,
+        channels: Optional[Dict[int, SlotOverride]] = None,
+        guilds: Optional[Dict[int, SlotOverride]] = None,
+    ):
+        self.channels = channels or {}
+        self.guilds = guilds or {}
+
+    def __bool__(self) -> bool:
+        return bool(self.channels or self.guilds)
+
+    def slot_for(
+        self,
+        default: Slot,
+        channel_id: int,
+        guild_of: Callable[[int], Optional[int]],
+    ) -> Slot:
+        """Resolve a channel's slot: channel entry, else guild entry, else the default."""
+        override = self.channels.get(channel_id)
+        if override is None and self.guilds:
+            override = self.guilds.get(guild_of(channel_id))
+        return override.apply(default) if override is not None else default
+
+    def slots(self, default: Slot) -> Set[Slot]:
+        """Every slot a job with this default can resolve to (wakeup times)."""
+        return {default} | {o.apply(default) for o in (*self.channels.values(), *self.guilds.values())}
+
+
+def parse_schedule(raw: str, env_key: str = "DAILY_SCHEDULE") -> LocalSchedule:
+    """Parse the compact schedule syntax; invalid parts are skipped with warnings."""
+    channels: Dict[int, SlotOverride] = {}
+    guilds: Dict[int, SlotOverride] = {}
+
+    for part in (raw or "").split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        if "=" not in part:
+            logger.warning("Invalid schedule '%s' in %s (expected <target>=<when>); skipping.", part, env_key)
+            continue
+
+        target_s, when_s = part.split("=", 1)
+        kind, _, id_s = target_s.strip().rpartition(":")
+        if kind.strip().lower() not in ("", "channel", "guild"):
+            logger.warning("Unknown schedule target '%s' in %s (use <channel_id> or guild:<id>).", target_s, env_key)
+            continue
+        try:
+            target_id = int(id_s.strip().lstrip("+"))
+        except ValueError:
+            logger.warning("Invalid ID '%s' in %s; skipping.", target_s, env_key)
+            continue
+
+        override = _parse_when(when_s)
+        if override is None:
+            logger.warning("Invalid time/timezone '%s' in %s (use HH:MM@Area/City); skipping.", when_s, env_key)
+            continue
+
+        (guilds if kind.strip().lower() == "guild" else channels)[target_id] = override
+
+    return LocalSchedule(channels, guilds)
+
+
+def load_schedule_from_env(env_key: str = "DAILY_SCHEDULE") -> LocalSchedule:
+    """Read per-channel / per-guild posting times from the environment."""
+    return parse_schedule(os.getenv(env_key, ""), env_key)
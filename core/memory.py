@@ -0,0 +1,112 @@
+# ==================================================
+# core/memory.py — Memory Profile + RSS Reporting
+# ==================================================
+#
+# Builds the discord.py client options for the configured runtime
+# profile (core/settings.py: BOT_LOW_MEMORY, BOT_MAX_MESSAGES) and
+# reports resident memory:
+#
+# - client_options()  → intents / member cache / chunking / max_messages
+# - rss_mb()          → current RSS (Linux /proc), peak RSS elsewhere
+# - log_memory(bot)   → one line with RSS + discord.py cache sizes
+# - memory_reporter   → tasks.loop logging it every MEMORY_REPORT_MINUTES
+#
+# Low-memory profile: the bot only needs guilds (channel cache),
+# guild/DM messages + message content (prefix commands) and
+# interactions (always delivered). Members, presences, typing, voice,
+# reactions, invites, etc. are dropped, so those events are neither
+# received nor cached. With PREFIX_COMMANDS=0 the message intents are
+# dropped too (slash commands only).
+#
+# Layer: Core
+# ==================================================
+
+import logging
+import resource
+import sys
+from typing import Any, Dict, Optional
+
+import discord
+from discord.ext import tasks
+
+from core.settings import BOT_MAX_MESSAGES, LOW_MEMORY, MEMORY_REPORT_MINUTES, PREFIX_COMMANDS
+
+logger = logging.getLogger("memory")
+
+
+# ===========================
+# Client Profile
+# ===========================
+def build_intents(low_memory: bool = LOW_MEMORY) -> discord.Intents:
+    if not low_memory:
+        intents = discord.Intents.default()
+        intents.message_content = PREFIX_COMMANDS
+        return intents
+
+    intents = discord.Intents.none()
+    intents.guilds = True  # channel cache: get_channel() for daily posts / timers
+    intents.guild_messages = PREFIX_COMMANDS
+    intents.dm_messages = PREFIX_COMMANDS
+    intents.message_content = PREFIX_COMMANDS
+    return intents
+
+
+def client_options() -> Dict[str, Any]:
+    """Keyword arguments for commands.Bot(...) for the active profile."""
+    options: Dict[str, Any] = {
+        "intents": build_intents(),
+        "max_messages": BOT_MAX_MESSAGES or None,
+    }
+    if LOW_MEMORY:
+        options["member_cache_flags"] = discord.MemberCacheFlags.none()
+        options["chunk_guilds_at_startup"] = False
+    return options
+
+
+# ===========================
+# RSS
+# ===========================
+def rss_mb() -> Optional[float]:
+    """Current resident set size in MiB (peak RSS if /proc is unavailable)."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (AttributeError, ValueError):
+        return None
+    # ru_maxrss: KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def log_memory(bot, label: str) -> None:
+    rss = rss_mb()
+    logger.info(
+        "Memory (%s): RSS %s, %d guild(s), %d cached user(s), %d cached message(s), profile %s",
+        label,
+        f"{rss:.1f} MiB" if rss is not None else "n/a",
+        len(bot.guilds),
+        len(bot.users),
+        len(bot.cached_messages),
+        "low-memory" if LOW_MEMORY else "default",
+    )
+
+
+@tasks.loop(minutes=MEMORY_REPORT_MINUTES or 30)
+async def memory_reporter():
+    """Periodic steady-state RSS report (bot injected as memory_reporter.bot)."""
+    bot = getattr(memory_reporter, "bot", None)
+    # First iteration runs right after READY: the startup report covers it
+    if bot is not None and memory_reporter.current_loop > 0:
+        log_memory(bot, "steady state")
+
+
+@memory_reporter.before_loop
+async def _wait_until_ready():
+    bot = getattr(memory_reporter, "bot", None)
+    if bot is not None:
+        await bot.wait_until_ready()
@@ -0,0 +1,108 @@
+# ==================================================
+# core/response_cache.py — Single-Flight + Response Cache
+# ==================================================
+#
+# Helpers for commands whose output only changes when the date or
+# the underlying data changes:
+#
+# - SingleFlight merges concurrent identical computations: the first
+#   caller runs the builder, everyone else awaits the same result.
+# - ResponseCache is a small LRU keyed by e.g. (date, data version)
+#   that uses SingleFlight on misses.
+#
+# Layer: Core
+# ==================================================
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+_MISSING = object()
+
+
+# ===========================
+# Single-Flight
+# ===========================
+class SingleFlight:
+    """Run at most one builder per key at a time; share its result."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, builder: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        if future is not None:
+            # Shield: a cancelled follower must not cancel the leader's work
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        # Avoid "exception was never retrieved" when nobody else waited
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+
+        try:
+            result = await builder()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+# ===========================
+# Response Cache
+# ===========================
+class ResponseCache:
+    """Bounded LRU of built responses with single-flight misses."""
+
+    def __init__(self, max_items: int = 32):
+        self.max_items = max(1, max_items)
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._items.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._items.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    async def get_or_build(self, key: Hashable, builder: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value or build it once, even under concurrency."""
+        value = self._items.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return value
+
+        self.misses += 1
+
+        async def build_and_store():
+            result = await builder()
+            self.put(key, result)
+            return result
+
+        return await self._flight.do(key, build_and_store)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,492 @@
+# ==================================================
+# core/scheduler.py — Unified Daily Job Scheduler
+# ==================================================
+#
+# Daily posts register declaratively:
+#
+#   from core.scheduler import scheduler
+#
+#   @scheduler.daily("banlu", time(10, 0))
+#   async def send_banlu_daily(bot, today): ...
+#
+# One discord.ext.tasks loop fires at every registered time; on each
+# tick (and once at startup, as catch-up) the scheduler runs every job
+# whose time has passed today and that has not run today yet. Due jobs
+# run concurrently (they post to different channels), so a startup
+# catch-up of several jobs takes as long as the slowest one.
+#
+# The last run date per job (per channel with targets) is persisted to
+# SCHEDULER_STATE_PATH, so a restart after the scheduled time never
+# posts twice. Redeploys only keep it on a mounted volume: fly.toml
+# mounts `bot_state` at /data and points SCHEDULER_STATE_PATH there
+# (the default under data/ is image-local).
+#
+# Prepare phase: a job may also register `build(day)` (and optionally
+# `fingerprint(day)`, a cheap data version, plain or async). Shortly after midnight
+# (DAILY_PREPARE_TIME, default 00:05) the scheduler builds every job's
+# payload in the background; at send time the job only dispatches it.
+# If the fingerprint changed since the prepare (data edited), or
+# nothing was prepared, the payload is built live instead:
+#
+#   @scheduler.daily("holidays", time(10, 1), build=_build, fingerprint=_version)
+#   async def send_holidays_daily(bot, today, payload): ...
+#
+# Local posting times: a job registered with `targets` (its channel
+# IDs) is dispatched per timezone bucket. DAILY_SCHEDULE
+# (core/local_schedule.py) moves a channel or a whole guild to another
+# time and/or timezone; channels resolving to the same (timezone, time)
+# slot form one bucket, with its own local date (the payload is built
+# for that date) and its own wakeup. Last-run dates are kept per
+# channel (`name:channel_id`), so moving a channel to another slot
+# never re-posts the same date to it:
+#
+#   @scheduler.daily("banlu", time(10, 0), build=_build, targets=lambda: BANLU_CHANNEL_ID)
+#   async def send_banlu_daily(bot, today, payload, channels): ...
+#
+# The loop wakes at the next occurrence of every slot, converted to
+# UTC and recomputed after each tick (DST changes included).
+#
+# Layer: Core
+# ==================================================
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
+
+from discord.ext import tasks
+
+from core.io_executor import io_pool
+from core.local_schedule import LocalSchedule, Slot, load_schedule_from_env
+from core.settings import BOT_TZ, BOT_TZ_NAME
+
+logger = logging.getLogger("scheduler")
+
+# BOT_TZ is parsed in core/settings.py (shared with local_today())
+TZ_NAME = BOT_TZ_NAME
+TZ: tzinfo = BOT_TZ
+
+SCHEDULER_STATE_PATH = os.getenv("SCHEDULER_STATE_PATH", "data/daily_state.json")
+
+# Per-channel / per-guild posting times (see core/local_schedule.py)
+DAILY_SCHEDULE = load_schedule_from_env("DAILY_SCHEDULE")
+
+
+def _parse_hhmm(value: str, default: time) -> time:
+    try:
+        hour, minute = (int(x) for x in value.strip().split(":", 1))
+        return time(hour, minute)
+    except ValueError:
+        logger.warning("Invalid time %r (expected HH:MM), using %s", value, default.strftime("%H:%M"))
+        return default
+
+
+DAILY_PREPARE_TIME = _parse_hhmm(os.getenv("DAILY_PREPARE_TIME", "00:05"), time(0, 5))
+
+# tasks.loop may wake a moment before the exact second
+_EARLY_SLACK = timedelta(seconds=30)
+
+JobFunc = Callable[..., Awaitable[None]]
+BuildFunc = Callable[[date], Awaitable[Any]]
+FingerprintFunc = Callable[[date], Union[Hashable, Awaitable[Hashable]]]
+TargetsFunc = Callable[[], Iterable[int]]
+
+
+@dataclass(frozen=True)
+class DailyJob:
+    """
+    A job that runs once per day at `at` (local time in the scheduler TZ).
+
+    Without `build`, `run(bot, today)` does everything. With `build`,
+    `run(bot, today, payload)` receives the prepared (or live-built) payload.
+    With `targets`, it runs once per timezone bucket and also receives
+    `channels=[...]`, the bucket's channel IDs; `today` is the bucket's
+    local date.
+    """
+
+    name: str
+    at: time
+    run: JobFunc
+    build: Optional[BuildFunc] = None
+    fingerprint: Optional[FingerprintFunc] = None
+    targets: Optional[TargetsFunc] = None
+
+
+@dataclass(frozen=True)
+class Dispatch:
+    """One due bucket of a job: its slot, local date and channels."""
+
+    job: DailyJob
+    slot: Slot
+    day: date
+    channels: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class _Prepared:
+    day: date
+    fingerprint: Hashable
+    payload: Any
+
+
+# ===========================
+# Persisted State
+# ===========================
+def _load_state(path: str) -> Dict[str, str]:
+    """{job name: ISO date of last run}; empty if missing or corrupted."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        logger.warning("Scheduler state %s is unreadable; starting fresh.", path)
+        return {}
+    return {k: v for k, v in data.items() if isinstance(v, str)} if isinstance(data, dict) else {}
+
+
+def _save_state(path: str, state: Dict[str, str]) -> None:
+    """Atomic write (tmp + rename) so a crash never leaves half a file."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+# ===========================
+# Scheduler
+# ===========================
+class DailyScheduler:
+    """Registry + single loop for all daily jobs."""
+
+    def __init__(
+        self,
+        tz: tzinfo = TZ,
+        state_path: str = SCHEDULER_STATE_PATH,
+        schedule: Optional[LocalSchedule] = None,
+    ):
+        self.tz = tz
+        self.state_path = state_path
+        self.schedule = schedule if schedule is not None else DAILY_SCHEDULE
+        self.bot = None
+        self._jobs: Dict[str, DailyJob] = {}
+        self._state: Optional[Dict[str, str]] = None
+        self._lock = asyncio.Lock()
+        self._save_lock = asyncio.Lock()
+        self._loop: Optional[tasks.Loop] = None
+        self._prepare_loop: Optional[tasks.Loop] = None
+        self._prepared: Dict[Tuple[str, date], _Prepared] = {}
+        self._background: Optional[asyncio.Task] = None
+
+    # -------- registration --------
+    def daily(
+        self,
+        name: str,
+        at: time,
+        *,
+        build: Optional[BuildFunc] = None,
+        fingerprint: Optional[FingerprintFunc] = None,
+        targets: Optional[TargetsFunc] = None,
+    ) -> Callable[[JobFunc], JobFunc]:
+        """Decorator: register `func(bot, today[, payload][, channels=])` to run daily at `at`."""
+
+        def decorator(func: JobFunc) -> JobFunc:
+            self.register(DailyJob(name, at.replace(tzinfo=None), func, build, fingerprint, targets))
+            return func
+
+        return decorator
+
+    def register(self, job: DailyJob) -> None:
+        if job.name in self._jobs:
+            raise ValueError(f"daily job {job.name!r} is already registered")
+        if self._loop is not None:
+            raise RuntimeError("register daily jobs before the scheduler starts")
+        self._jobs[job.name] = job
+
+    @property
+    def jobs(self) -> List[DailyJob]:
+        return sorted(self._jobs.values(), key=lambda j: (j.at, j.name))
+
+    # -------- state --------
+    def _get_state(self) -> Dict[str, str]:
+        if self._state is None:
+            self._state = _load_state(self.state_path)
+        return self._state
+
+    def last_run(self, name: str) -> Optional[date]:
+        value = self._get_state().get(name)
+        try:
+            return date.fromisoformat(value) if value else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def state_keys(job: DailyJob, channels: Iterable[int]) -> List[str]:
+        """
+        Last-run keys: one per channel (`name:channel_id`), the job name
+        without channels. Independent of the slot, so editing
+        DAILY_SCHEDULE (or a guild entry resolving late) keeps the history.
+        """
+        return [f"{job.name}:{cid}" for cid in channels] or [job.name]
+
+    def channel_last_run(self, job: DailyJob, channel_id: int) -> Optional[date]:
+        # Channels without an entry yet inherit the job-wide date (older state files)
+        return self.last_run(f"{job.name}:{channel_id}") or self.last_run(job.name)
+
+    def pending_channels(self, job: DailyJob, channels: Tuple[int, ...], day: date) -> Tuple[int, ...]:
+        """Channels of a bucket that have not been posted to for `day` (or a later date)."""
+        return tuple(cid for cid in channels if (self.channel_last_run(job, cid) or date.min) < day)
+
+    def has_run(self, job: DailyJob, channels: Tuple[int, ...], day: date) -> bool:
+        """Whether a bucket already ran for `day` (per channel with targets, job-wide without)."""
+        if channels:
+            return not self.pending_channels(job, channels, day)
+        return (self.last_run(job.name) or date.min) >= day
+
+    async def _mark_done(self, names: Iterable[str], day: date) -> None:
+        # Serialized: concurrent jobs must not write an older snapshot last
+        async with self._save_lock:
+            state = self._get_state()
+            state.update(dict.fromkeys(names, day.isoformat()))
+            try:
+                await io_pool.run("scheduler.state", _save_state, self.state_path, dict(state), resource="scheduler")
+            except OSError:
+                logger.exception("Failed to persist scheduler state to %s.", self.state_path)
+
+    # -------- due computation (the only place catch-up is decided) --------
+    def now(self) -> datetime:
+        return datetime.now(self.tz)
+
+    def default_slot(self, job: DailyJob) -> Slot:
+        return Slot(self.tz, job.at)
+
+    def _guild_of(self, channel_id: int) -> Optional[int]:
+        channel = self.bot.get_channel(channel_id) if self.bot is not None else None
+        guild = getattr(channel, "guild", None)
+        return getattr(guild, "id", None)
+
+    def buckets(self, job: DailyJob) -> Dict[Slot, Tuple[int, ...]]:
+        """The job's channels grouped by resolved slot (one bucket without targets)."""
+        default = self.default_slot(job)
+        if job.targets is None:
+            return {default: ()}
+
+        groups: Dict[Slot, List[int]] = {}
+        for channel_id in dict.fromkeys(job.targets()):
+            slot = self.schedule.slot_for(default, channel_id, self._guild_of)
+            groups.setdefault(slot, []).append(channel_id)
+        # No channels configured: still "run" once so the job can log it
+        return {slot: tuple(ids) for slot, ids in groups.items()} or {default: ()}
+
+    @staticmethod
+    def _passed(slot: Slot, now: datetime) -> bool:
+        local = now.astimezone(slot.tz)
+        soon = local + _EARLY_SLACK
+        cutoff = soon.time() if soon.date() == local.date() else time.max
+        return slot.at <= cutoff
+
+    def due(self, now: Optional[datetime] = None) -> List[Dispatch]:
+        """Buckets whose local time passed today (local date) and that have not run today."""
+        now = now or self.now()
+        due: List[Dispatch] = []
+        for job in self.jobs:
+            for slot, channels in self.buckets(job).items():
+                if not self._passed(slot, now):
+                    continue
+                today = slot.local_date(now)
+                if not channels:
+                    if not self.has_run(job, channels, today):
+                        due.append(Dispatch(job, slot, today))
+                    continue
+                # Only channels not posted to for this date (e.g. one that
+                # just moved here from a zone that already had its post)
+                pending = self.pending_channels(job, channels, today)
+                if pending:
+                    due.append(Dispatch(job, slot, today, pending))
+        return due
+
+    def due_jobs(self, now: Optional[datetime] = None) -> List[DailyJob]:
+        """Jobs with at least one due bucket."""
+        return list({d.job.name: d.job for d in self.due(now)}.values())
+
+    async def _run_job(self, dispatch: Dispatch) -> bool:
+        job, today = dispatch.job, dispatch.day
+        kwargs = {"channels": list(dispatch.channels)} if job.targets is not None else {}
+        try:
+            if job.build is None:
+                await job.run(self.bot, today, **kwargs)
+            else:
+                await job.run(self.bot, today, await self._payload_for(job, today), **kwargs)
+        except Exception:
+            # Not marked: the next restart / tick retries it
+            logger.exception("Daily job %s (%s) failed.", job.name, dispatch.slot.label)
+            return False
+        await self._mark_done(self.state_keys(job, dispatch.channels), today)
+        logger.info(
+            "Daily job %s done for %s (%s, %d channel(s)).",
+            job.name,
+            today.isoformat(),
+            dispatch.slot.label,
+            len(dispatch.channels),
+        )
+        return True
+
+    async def run_due(self, now: Optional[datetime] = None) -> List[str]:
+        """Run due buckets concurrently; returns the jobs that ran (schedule order)."""
+        async with self._lock:
+            due = self.due(now)
+            done = await asyncio.gather(*(self._run_job(d) for d in due))
+            return list(dict.fromkeys(d.job.name for d, ok in zip(due, done) if ok))
+
+    # -------- prepare phase --------
+    async def _fingerprint(self, job: DailyJob, day: date) -> Hashable:
+        if job.fingerprint is None:
+            return None
+        value = job.fingerprint(day)
+        return await value if inspect.isawaitable(value) else value
+
+    async def _build(self, job: DailyJob, day: date) -> Any:
+        # Fingerprint first: an edit during the build invalidates it
+        fingerprint = await self._fingerprint(job, day)
+        payload = await job.build(day)
+        self._prepared[(job.name, day)] = _Prepared(day, fingerprint, payload)
+        return payload
+
+    def _prune_prepared(self) -> None:
+        # Buckets span at most a day around BOT_TZ's date
+        oldest = self.now().date() - timedelta(days=1)
+        for key in [k for k, p in self._prepared.items() if p.day < oldest]:
+            del self._prepared[key]
+
+    async def _payload_for(self, job: DailyJob, day: date) -> Any:
+        """Prepared payload if still valid for `day`, else a live build (kept for other buckets)."""
+        prepared = self._prepared.get((job.name, day))
+        if prepared is not None:
+            if await self._fingerprint(job, day) == prepared.fingerprint:
+                logger.info("Daily job %s: sending prepared payload for %s.", job.name, day.isoformat())
+                return prepared.payload
+            logger.info("Daily job %s: data changed since prepare, building live.", job.name)
+        self._prune_prepared()
+        return await self._build(job, day)
+
+    def pending_days(self, job: DailyJob, now: Optional[datetime] = None) -> Set[date]:
+        """Local dates of the next run of each of the job's buckets."""
+        now = now or self.now()
+        days: Set[date] = set()
+        for slot, channels in self.buckets(job).items():
+            today = slot.local_date(now)
+            days.add(today + timedelta(days=1) if self.has_run(job, channels, today) else today)
+        return days
+
+    async def prepare(self, day: Optional[date] = None) -> List[str]:
+        """
+        Build payloads ahead of the sends: for `day` if given, else for the
+        local date of every bucket's next run (one build per job and date).
+        """
+        self._prune_prepared()
+        built: List[str] = []
+
+        for job in self.jobs:
+            if job.build is None:
+                continue
+            if day is not None:
+                # Same per-channel check as due(): skip if every bucket already ran
+                buckets = self.buckets(job).values()
+                days = set() if all(self.has_run(job, ch, day) for ch in buckets) else {day}
+            else:
+                days = self.pending_days(job)
+            for d in sorted(days):
+                if (job.name, d) in self._prepared:
+                    continue
+                try:
+                    await self._build(job, d)
+                except Exception:
+                    logger.exception("Preparing daily job %s failed; it will build live.", job.name)
+                    continue
+                built.append(f"{job.name} ({d.isoformat()})")
+
+        if built:
+            logger.info("Prepared daily payloads: %s", ", ".join(built))
+        return built
+
+    # -------- wakeups --------
+    def slots(self) -> Set[Slot]:
+        """Every slot any job can be dispatched in (resolving guilds is not needed)."""
+        slots: Set[Slot] = set()
+        for job in self._jobs.values():
+            default = self.default_slot(job)
+            slots |= self.schedule.slots(default) if job.targets is not None else {default}
+        return slots
+
+    def wakeup_times(self, now: Optional[datetime] = None) -> List[time]:
+        """
+        Next occurrence of every slot as a UTC time of day: tasks.loop
+        orders its times by wall clock, which only works within one zone.
+        Recomputed after each tick, so DST shifts are picked up.
+        """
+        now = now or self.now()
+        return sorted({slot.next_run(now).astimezone(timezone.utc).timetz() for slot in self.slots()})
+
+    # -------- lifecycle --------
+    def start(self, bot) -> None:
+        """Start the single loop firing at every slot's local time (idempotent)."""
+        self.bot = bot
+        if self._loop is not None and self._loop.is_running():
+            return
+
+        times = self.wakeup_times()
+        if not times:
+            return
+
+        @tasks.loop(time=times)
+        async def _tick():
+            try:
+                await self.run_due()
+            finally:
+                _tick.change_interval(time=self.wakeup_times())
+
+        @_tick.before_loop
+        async def _wait_ready():
+            # Started from setup_hook: channels are only cached once ready
+            await bot.wait_until_ready()
+
+        @tasks.loop(time=DAILY_PREPARE_TIME.replace(tzinfo=self.tz))
+        async def _prepare_tick():
+            await self.prepare()
+
+        self._loop = _tick
+        self._loop.start()
+        if any(job.build is not None for job in self._jobs.values()):
+            self._prepare_loop = _prepare_tick
+            self._prepare_loop.start()
+        logger.info(
+            "Daily scheduler started: %s; %d slot(s): %s",
+            ", ".join(f"{j.name}@{j.at:%H:%M}" for j in self.jobs),
+            len(times),
+            ", ".join(sorted(s.label for s in self.slots())),
+        )
+
+    async def catch_up(self) -> List[str]:
+        """Run jobs missed while the bot was offline (same rule as a tick)."""
+        ran = await self.run_due()
+        if ran:
+            logger.info("Caught up missed daily jobs: %s", ", ".join(ran))
+
+        # Jobs still ahead today were not prepared at midnight: do it now
+        if self._background is None or self._background.done():
+            self._background = asyncio.create_task(self.prepare())
+        return ran
+
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+
+# Shared instance used by the daily modules and bot.py
+scheduler = DailyScheduler()
@@ -1,5 +1,35 @@
 # core/settings.py
+import logging
 import os
+from datetime import date, datetime, timezone, tzinfo
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger("settings")
+
+
+# ============================
+# Env Parsing Helpers
+# ============================
+# A malformed number must not stop the bot from starting: fall back to
+# the default with a warning (like scheduler._parse_hhmm for times).
+def env_int(name: str, default: int, minimum: int = 0) -> int:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        value = int(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid %s=%r (expected an integer), using %d", name, raw, default)
+        value = default
+    return max(minimum, value)
+
+
+def env_float(name: str, default: float, minimum: float = 0.0) -> float:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        value = float(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid %s=%r (expected a number), using %s", name, raw, default)
+        value = default
+    return max(minimum, value)
 
 # ============================
 # Discord Bot Settings
@@ -7,6 +37,24 @@ import os
 
 DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 
+# ============================
+# Bot Timezone (BOT_TZ)
+# ============================
+# The scheduler's timezone; "today" for commands and lookups comes from
+# local_today() so they agree with the daily posts (the host runs UTC).
+BOT_TZ_NAME = os.getenv("BOT_TZ", "Europe/Moscow")
+try:
+    BOT_TZ: tzinfo = ZoneInfo(BOT_TZ_NAME)
+except Exception:
+    logger.warning("Invalid BOT_TZ=%s, fallback to UTC", BOT_TZ_NAME)
+    BOT_TZ = timezone.utc
+
+
+def local_today() -> date:
+    """Today's date in BOT_TZ."""
+    return datetime.now(BOT_TZ).date()
+
+
 # Channels
 BANLU_CHANNEL_ID = int(os.getenv("BANLU_CHANNEL_ID", "0"))
 
@@ -29,6 +77,57 @@ ENABLE_DAILY_BANLU = True
 ENABLE_HOLIDAYS = True
 ENABLE_TIMERS = True
 
+# ============================
+# Interactive "More" Buttons
+# ============================
+# Opt-in: edit the existing message instead of posting a new one per click.
+MORE_EDIT_IN_PLACE = os.getenv("MORE_EDIT_IN_PLACE", "").strip().lower() in ("1", "true", "yes", "on")
+
+# Prev/next carousel size per message (0 disables the carousel).
+MORE_HISTORY_SIZE = int(os.getenv("MORE_HISTORY_SIZE", "0") or 0)
+
+# How many messages keep a carousel history at once (LRU).
+MORE_HISTORY_MESSAGES = int(os.getenv("MORE_HISTORY_MESSAGES", "256") or 256)
+
+# ============================
+# Command Interfaces
+# ============================
+# Every command also exists as a slash command (/quote, /timer, ...).
+# PREFIX_COMMANDS=0 drops the `!` commands and with them the privileged
+# message_content intent and guild message events; the bot then only
+# answers slash commands (and `@bot` mentions).
+PREFIX_COMMANDS = os.getenv("PREFIX_COMMANDS", "1").strip().lower() in ("1", "true", "yes", "on")
+
+# Slash command sync on startup (core/slash_sync.py):
+#   auto   → only when the command tree changed since the last sync (default)
+#   always → every start (rate-limited by Discord: avoid in production)
+#   off    → never
+# SLASH_GUILD_IDS syncs to those guilds only (instant, handy for testing).
+_SLASH_SYNC_RAW = os.getenv("SLASH_SYNC", "auto").strip().lower()
+SLASH_SYNC = (
+    "off" if _SLASH_SYNC_RAW in ("0", "false", "no", "off")
+    else "always" if _SLASH_SYNC_RAW in ("always", "force")
+    else "auto"
+)
+SLASH_GUILD_IDS = [int(x) for x in os.getenv("SLASH_GUILD_IDS", "").split(",") if x.strip()]
+
+# ============================
+# Runtime Profile (memory)
+# ============================
+# BOT_LOW_MEMORY=1: minimal gateway intents, no member cache / chunking,
+# no message cache and expiring "More" views. For 256 MB VMs.
+LOW_MEMORY = os.getenv("BOT_LOW_MEMORY", "").strip().lower() in ("1", "true", "yes", "on")
+
+# Messages kept in discord.py's message cache (0 disables it).
+BOT_MAX_MESSAGES = int(os.getenv("BOT_MAX_MESSAGES", "0" if LOW_MEMORY else "1000") or 0)
+
+# Seconds a "More" button view stays clickable (0 = never expires).
+# Non-expiring views stay in discord.py's view store for the process lifetime.
+MORE_VIEW_TIMEOUT = float(os.getenv("MORE_VIEW_TIMEOUT", "900" if LOW_MEMORY else "0") or 0)
+
+# How often RSS is logged after startup (0 disables the periodic report).
+MEMORY_REPORT_MINUTES = float(os.getenv("MEMORY_REPORT_MINUTES", "30") or 0)
+
 # ============================
 # Ban'Lu
 # ============================
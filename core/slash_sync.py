@@ -0,0 +1,116 @@
+# ==================================================
+# core/slash_sync.py — Slash Command Sync (only when changed)
+# ==================================================
+#
+# Discord rate-limits command syncs, and the bot restarts on every
+# deploy. So the startup sync hashes the command tree (names, options,
+# descriptions: exactly what `tree.sync()` uploads) and only syncs a
+# target (global, or each SLASH_GUILD_IDS guild) when its hash differs
+# from the last successful sync.
+#
+# The hashes live in SLASH_SYNC_STATE_PATH, by default next to the
+# scheduler state (on Fly.io: the `bot_state` volume).
+#
+# SLASH_SYNC: auto (default, sync when changed), always, off.
+#
+# Layer: Core
+# ==================================================
+
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from core.io_executor import io_pool
+from core.scheduler import SCHEDULER_STATE_PATH
+from core.settings import SLASH_GUILD_IDS, SLASH_SYNC
+from core.startup import startup
+
+logger = logging.getLogger("slash_sync")
+
+SLASH_SYNC_STATE_PATH = os.getenv(
+    "SLASH_SYNC_STATE_PATH",
+    os.path.join(os.path.dirname(SCHEDULER_STATE_PATH), "slash_sync.json"),
+)
+
+
+# ===========================
+# Persisted Hashes
+# ===========================
+def _load_hashes(path: str) -> Dict[str, str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        logger.warning("Slash sync state %s is unreadable; syncing.", path)
+        return {}
+    return {k: v for k, v in data.items() if isinstance(v, str)} if isinstance(data, dict) else {}
+
+
+def _save_hashes(path: str, hashes: Dict[str, str]) -> None:
+    """Atomic write (tmp + rename)."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(hashes, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def tree_hash(tree: app_commands.CommandTree, guild: Optional[discord.Object] = None) -> str:
+    """Hash of the payload `tree.sync(guild=guild)` would upload."""
+    payload = sorted(
+        (cmd.to_dict(tree) for cmd in tree.get_commands(guild=guild)),
+        key=lambda c: (c.get("type", 1), c["name"]),
+    )
+    raw = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ===========================
+# Sync
+# ===========================
+async def sync_app_commands(client: commands.Bot) -> None:
+    """Publish the slash commands (globally, or to SLASH_GUILD_IDS only) if they changed."""
+    if SLASH_SYNC == "off":
+        return
+
+    hashes = await io_pool.run("slash_sync.load", _load_hashes, SLASH_SYNC_STATE_PATH, resource="slash_sync")
+    targets = [discord.Object(id=g) for g in SLASH_GUILD_IDS] or [None]
+    synced_any = False
+
+    with startup.phase("slash sync"):
+        for guild in targets:
+            if guild is not None:
+                client.tree.copy_global_to(guild=guild)
+            key = f"{client.application_id}:{guild.id if guild is not None else 'global'}"
+            digest = tree_hash(client.tree, guild)
+
+            if SLASH_SYNC != "always" and hashes.get(key) == digest:
+                logger.info("Slash commands unchanged (%s); skipping sync.", key)
+                continue
+            try:
+                synced = await client.tree.sync(guild=guild)
+            except discord.HTTPException:
+                logger.exception("Slash command sync failed (%s); existing registrations stay active.", key)
+                continue
+
+            hashes[key] = digest
+            synced_any = True
+            logger.info("Synced %d slash command(s) (%s).", len(synced), key)
+
+    if synced_any:
+        try:
+            await io_pool.run(
+                "slash_sync.save", _save_hashes, SLASH_SYNC_STATE_PATH, dict(hashes), resource="slash_sync"
+            )
+        except OSError:
+            logger.exception("Failed to persist slash sync state to %s.", SLASH_SYNC_STATE_PATH)
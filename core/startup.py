@@ -0,0 +1,135 @@
+# ==================================================
+# core/startup.py — Startup Pipeline (warmups + timing report)
+# ==================================================
+#
+# Nothing reads data files at import time. Modules register warmups
+# instead, and the bot runs them in the background once it is up:
+#
+#   from core.startup import startup
+#
+#   @startup.warmup("timers")
+#   def _warm_timers(): ...        # sync → runs in the I/O pool
+#
+#   @startup.warmup("birthday")
+#   async def _warm_birthday(): ...  # async → awaited as is
+#
+# All warmups run concurrently; a failed warmup is logged and the data
+# is simply loaded on first use instead.
+#
+# Engines: `start_engine("name", starter)` starts a background loop at
+# most once per process (gateway reconnects never restart anything);
+# `initialized` is set once the first catch-up + warmups are done.
+#
+# Timing: `startup.phase("name")` measures a block, `milestone("name")`
+# records the time since process start, and `log_report()` prints every
+# phase / milestone / warmup in one summary. "Process start" is the
+# first import of this module (bot.py imports it first).
+#
+# Layer: Core
+# ==================================================
+
+import asyncio
+import inspect
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.io_executor import io_pool
+
+logger = logging.getLogger("startup")
+
+WarmupFunc = Callable[[], Any]
+
+
+class Startup:
+    """Warmup registry + per-phase startup timings."""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.milestones: List[Tuple[str, float]] = []
+        self.warmups: Dict[str, float] = {}
+        self._warmups: Dict[str, Tuple[WarmupFunc, Optional[str]]] = {}
+        self._warm_task: Optional[asyncio.Task] = None
+        self.engines: Dict[str, float] = {}
+        self.initialized = asyncio.Event()
+
+    # -------- timings --------
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block (sync, or containing awaits) as a startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def milestone(self, name: str) -> None:
+        """Record the time since process start (first time only)."""
+        if all(n != name for n, _ in self.milestones):
+            self.milestones.append((name, self.elapsed_ms()))
+
+    # -------- warmups --------
+    def warmup(self, name: str, *, resource: Optional[str] = None) -> Callable[[WarmupFunc], WarmupFunc]:
+        """Decorator: register a background data warmup (sync or async)."""
+
+        def decorator(func: WarmupFunc) -> WarmupFunc:
+            self._warmups[name] = (func, resource)
+            return func
+
+        return decorator
+
+    async def _run_one(self, name: str, func: WarmupFunc, resource: Optional[str]) -> None:
+        start = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(func):
+                await func()
+            else:
+                await io_pool.run(f"warmup.{name}", func, resource=resource)
+        except Exception:
+            logger.exception("Warmup %s failed; it will load on first use.", name)
+            return
+        self.warmups[name] = (time.perf_counter() - start) * 1000
+
+    async def run_warmups(self) -> None:
+        """Run every registered warmup concurrently."""
+        await asyncio.gather(*(self._run_one(n, f, r) for n, (f, r) in self._warmups.items()))
+        self.milestone("warm")
+
+    def start_warmups(self) -> asyncio.Task:
+        """Start the warmups in the background (once per process)."""
+        if self._warm_task is None:
+            self._warm_task = asyncio.create_task(self.run_warmups())
+        return self._warm_task
+
+    # -------- engines / readiness --------
+    def start_engine(self, name: str, starter: Callable[[], Any]) -> bool:
+        """Start a background engine once; False if it was already started."""
+        if name in self.engines:
+            return False
+        starter()
+        self.engines[name] = self.elapsed_ms()
+        return True
+
+    def mark_initialized(self) -> None:
+        self.milestone("initialized")
+        self.initialized.set()
+
+    def is_initialized(self) -> bool:
+        return self.initialized.is_set()
+
+    # -------- report --------
+    def log_report(self) -> None:
+        lines = [f"  phase     {name:<16} {ms:8.1f} ms" for name, ms in self.phases]
+        lines += [f"  warmup    {name:<16} {ms:8.1f} ms" for name, ms in sorted(self.warmups.items())]
+        lines += [f"  engine    {name:<16} {ms:8.1f} ms after start" for name, ms in self.engines.items()]
+        lines += [f"  at        {name:<16} {ms:8.1f} ms after start" for name, ms in self.milestones]
+        logger.info("Startup timings:\n%s", "\n".join(lines))
+
+
+# Shared instance (created on first import ≈ process start)
+startup = Startup()
@@ -7,7 +7,7 @@ from datetime import datetime, timezone, timedelta
 import discord
 from discord.ext import tasks
 
-from core.timers import date_timers, delete_timer, save as save_all_timers
+from core.timers import date_timers, delete_timer, ensure_loaded
 from core.helpers import choose_update_interval, format_remaining
 
 
@@ -25,6 +25,8 @@ async def update_timers_loop():
     if bot is None:
         return
 
+    ensure_loaded()
+
     # Iterate over a copy since timer removal may occur
     for timer_id, t in list(date_timers.items()):
         channel = bot.get_channel(t["channel_id"])
@@ -65,8 +67,7 @@ async def update_timers_loop():
                 except Exception:
                     pass
 
-            delete_timer(timer_id)
-            save_all_timers()
+            delete_timer(timer_id)  # queues the save (I/O pool)
             continue
 
         # ===========================
@@ -90,3 +91,11 @@ async def update_timers_loop():
         except Exception:
             # If editing fails (permissions / deleted message), skip silently
             continue
+
+
+@update_timers_loop.before_loop
+async def _wait_until_ready():
+    """Started from setup_hook: wait for the channel cache before the first tick."""
+    bot = getattr(update_timers_loop, "bot", None)
+    if bot is not None:
+        await bot.wait_until_ready()
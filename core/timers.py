@@ -1,22 +1,62 @@
 # ==================================================
 # core/timers.py — Persistent Timer Storage & Helpers
 # ==================================================
+#
+# Writes to timers.json run in the shared I/O pool
+# (core/io_executor.py): save() snapshots the timers and returns at
+# once; one background writer persists the latest snapshot, so a
+# burst of changes costs a single write and never blocks the loop.
+#
+# timers.json is not read at import: the "timers" startup warmup loads
+# it in the background, and every accessor calls ensure_loaded() first
+# (a synchronous read only if it runs before the warmup finished).
+# ==================================================
+
+import asyncio
+import logging
+import threading
+from typing import Optional
 
 from core.helpers import load_timers, save_timers
+from core.io_executor import io_pool
+from core.startup import startup
+
+logger = logging.getLogger("timers")
 
 
 # ===========================
-# Load Existing Timers on Startup
+# Load Existing Timers (lazily)
 # ===========================
-timers_data = load_timers()
-
 # All active timers stored as: { timer_id: timer_dict }
-date_timers: dict[int, dict] = {
-    t["timer_id"]: t for t in timers_data["timers"]
-}
+# (filled in place, so `from core.timers import date_timers` stays valid)
+date_timers: dict[int, dict] = {}
+
+# Per-channel view of the same timers: { channel_id: { timer_id: timer_dict } }
+# (channel listings and /cancel autocomplete without scanning every timer)
+_by_channel: dict[int, dict[int, dict]] = {}
 
 # Next available ID for new timers
-next_timer_id: int = timers_data.get("next_timer_id", 1)
+next_timer_id: int = 1
+
+_loaded = False
+_load_lock = threading.Lock()
+
+
+@startup.warmup("timers")
+def ensure_loaded() -> None:
+    """Load timers.json once (thread-safe; the warmup runs it in the I/O pool)."""
+    global next_timer_id, _loaded
+    if _loaded:
+        return
+    with _load_lock:
+        if _loaded:
+            return
+        data = load_timers()
+        for t in data["timers"]:
+            date_timers[t["timer_id"]] = t
+            _by_channel.setdefault(t["channel_id"], {})[t["timer_id"]] = t
+        next_timer_id = max(next_timer_id, data.get("next_timer_id", 1))
+        _loaded = True
 
 
 # ===========================
@@ -30,6 +70,7 @@ def create_timer(channel_id, message_id, text, timestamp, tz_offset, pinned) ->
         timer_id (int)
     """
     global next_timer_id
+    ensure_loaded()
 
     timer = {
         "timer_id": next_timer_id,
@@ -42,6 +83,7 @@ def create_timer(channel_id, message_id, text, timestamp, tz_offset, pinned) ->
     }
 
     date_timers[next_timer_id] = timer
+    _by_channel.setdefault(channel_id, {})[next_timer_id] = timer
     next_timer_id += 1
     save()
 
@@ -56,20 +98,72 @@ def delete_timer(timer_id: int) -> None:
     Remove a timer by its ID.
     If the timer doesn't exist, nothing happens.
     """
-    date_timers.pop(timer_id, None)
+    ensure_loaded()
+    timer = date_timers.pop(timer_id, None)
+    if timer is not None:
+        in_channel = _by_channel.get(timer["channel_id"], {})
+        in_channel.pop(timer_id, None)
+        if not in_channel:
+            _by_channel.pop(timer["channel_id"], None)
     save()
 
 
+# ===========================
+# Channel Lookup
+# ===========================
+def channel_timers(channel_id: int) -> list[dict]:
+    """Active timers of one channel, oldest first."""
+    ensure_loaded()
+    in_channel = _by_channel.get(channel_id)
+    return [in_channel[tid] for tid in sorted(in_channel)] if in_channel else []
+
+
 # ===========================
 # Save All Timers to File
 # ===========================
+_pending: Optional[dict] = None
+_writer: Optional[asyncio.Task] = None
+
+
 def save() -> None:
     """
     Persist the current state of timers to timers.json.
+
+    Inside the event loop the write is queued (latest snapshot wins);
+    without a running loop it is written synchronously.
     """
-    save_timers(
-        {
-            "next_timer_id": next_timer_id,
-            "timers": list(date_timers.values()),
-        }
-    )
+    global _pending, _writer
+
+    snapshot = {
+        "next_timer_id": next_timer_id,
+        # Copies: the event loop keeps mutating the timer dicts while
+        # the I/O pool serializes this snapshot
+        "timers": [dict(t) for t in date_timers.values()],
+    }
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        save_timers(snapshot)
+        return
+
+    _pending = snapshot
+    if _writer is None or _writer.done():
+        _writer = loop.create_task(_write_pending())
+
+
+async def _write_pending() -> None:
+    global _pending
+    while _pending is not None:
+        data, _pending = _pending, None
+        try:
+            await io_pool.run("timers.save", save_timers, data, resource="timers")
+        except Exception:
+            # Never let the writer die: later saves must still flush
+            logger.exception("Failed to save timers.")
+
+
+async def flush() -> None:
+    """Wait until every queued save is on disk (called on shutdown)."""
+    if _writer is not None and not _writer.done():
+        await _writer
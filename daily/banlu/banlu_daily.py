@@ -2,155 +2,70 @@
 # daily/banlu/banlu_daily.py — Naughty Dog Daily Quote
 # ==================================================
 #
-# Posts a random quote + random official Steam screenshot
+# Posts a quote + random official Steam screenshot
 # for The Last of Us™ Part I.
 #
-# bot.py imports:
-#   from daily.banlu.banlu_daily import (send_banlu_daily, send_banlu_once)
+# Quotes come from the shared Ban'Lu corpus (services/banlu_service.py,
+# data/quotersbanlu.txt) through a shuffle bag keyed on the date, so
+# every quote is used once before any repeats. Built embeds are cached
+# by (corpus version, quote index, media URL); each send gets a copy
+# stamped with the send time.
 #
-# bot.py injects:
-#   send_banlu_daily.bot = bot
-#   send_banlu_once.bot = bot
+# Registered with the daily scheduler (core/scheduler.py) at 10:00 in
+# BOT_TZ (or each channel's DAILY_SCHEDULE time); importing this module
+# is enough. Catch-up after a restart and the once-per-day guard are
+# handled by the scheduler, per timezone bucket.
 # ==================================================
 
-import json
 import logging
 import os
 import random
-import time as time_module
-import urllib.request
 from datetime import datetime, timezone, time, date
-from zoneinfo import ZoneInfo
-from typing import Optional
+from typing import List, Optional
 
 import discord
-from discord.ext import tasks
 
+from core.fanout import FanoutReport, fan_out_same
+from core.io_executor import io_pool
+from core.response_cache import ResponseCache
+from core.scheduler import scheduler
+from services.banlu_service import banlu_quotes, quote_for_day
 from services.channel_ids import parse_chat_ids_from_env
+from services.steam_media import STEAM_STORE_URL, steam_media
 
 logger = logging.getLogger("banlu_daily")
 
-# --- TZ: same pattern as holidays/birthday ---
-TZ_NAME = os.getenv("BOT_TZ", "Europe/Moscow")
-try:
-    TZ = ZoneInfo(TZ_NAME)
-except Exception:
-    logger.warning("Invalid BOT_TZ=%s, fallback to UTC", TZ_NAME)
-    TZ = timezone.utc
-
 # --- Channels (same pattern) ---
 BANLU_CHANNEL_ID = parse_chat_ids_from_env("BANLU_CHANNEL_ID")
 if not BANLU_CHANNEL_ID:
     # backwards compat if you ever used this old name
     BANLU_CHANNEL_ID = parse_chat_ids_from_env("BANLU_CHANNEL_IDS")
 
-# --- Steam source ---
-STEAM_APP_ID = int(os.getenv("BANLU_STEAM_APP_ID", "1888930"))
-STEAM_STORE_URL = os.getenv(
-    "BANLU_STEAM_URL",
-    f"https://store.steampowered.com/app/{STEAM_APP_ID}/The_Last_of_Us_Part_I/",
-)
-STEAM_APPDETAILS_URL = f"https://store.steampowered.com/api/appdetails?appids={STEAM_APP_ID}&l=english"
-
-# cache
-_STEAM_MEDIA_CACHE: list[str] = []
-_STEAM_MEDIA_CACHE_TS: float = 0.0
-
-# --- Content ---
-BANLU_QUOTES = [
-    "The world doesn’t need heroes. It needs survivors.",
-    "You can’t outrun what you are.",
-    "Sometimes the only way out is through.",
-    "Every choice costs something.",
-    "Hope is dangerous. But so is giving up.",
-]
+# --- Steam source: services/steam_media.py (disk-backed, refreshed in the background) ---
 
+# --- Content: services/banlu_service.py (shared quote corpus) ---
 DEFAULT_COLOR = 0x2F3136
-_last_sent: Optional[date] = None
 
-
-def _fetch_steam_media_urls() -> list[str]:
-    """
-    Official Steam source via appdetails API.
-    Returns a list of image URLs (screenshots + fallback images).
-    """
-    req = urllib.request.Request(
-        STEAM_APPDETAILS_URL,
-        headers={"User-Agent": "Mozilla/5.0 (Just_Quotes/1.0)"},
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=12) as resp:
-            payload = json.loads(resp.read().decode("utf-8", errors="ignore"))
-    except Exception as e:
-        logger.warning("Steam appdetails fetch failed: %s", e)
-        return []
-
-    try:
-        block = payload.get(str(STEAM_APP_ID), {})
-        if not block.get("success"):
-            return []
-        data = block.get("data", {}) or {}
-    except Exception:
-        return []
-
-    urls: list[str] = []
-
-    # screenshots
-    for s in (data.get("screenshots") or []):
-        full = s.get("path_full")
-        if full:
-            urls.append(full)
-
-    # nice fallbacks (still official)
-    for key in ("background_raw", "header_image"):
-        v = data.get(key)
-        if isinstance(v, str) and v:
-            urls.append(v)
-
-    # de-dup keep order
-    seen = set()
-    out: list[str] = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
-
-    return out[:80]
-
-
-def _get_cached_media(ttl_seconds: int = 6 * 60 * 60) -> list[str]:
-    global _STEAM_MEDIA_CACHE, _STEAM_MEDIA_CACHE_TS
-
-    now = time_module.time()
-    if _STEAM_MEDIA_CACHE and (now - _STEAM_MEDIA_CACHE_TS) < ttl_seconds:
-        return _STEAM_MEDIA_CACHE
-
-    media = _fetch_steam_media_urls()
-    if media:
-        _STEAM_MEDIA_CACHE = media
-        _STEAM_MEDIA_CACHE_TS = now
-    return _STEAM_MEDIA_CACHE
+# (corpus version, quote index, media URL) -> embed
+_embeds = ResponseCache(64)
 
 
 def _pick_media_url() -> Optional[str]:
-    media = _get_cached_media()
+    # Never waits on the network: stale lists are revalidated in the background
+    media = steam_media.urls()
     if not media:
         return None
     return random.choice(media)
 
 
-def _build_embed() -> discord.Embed:
-    quote = random.choice(BANLU_QUOTES)
-
+def _render_embed(quote: str, img: Optional[str]) -> discord.Embed:
     embed = discord.Embed(
         title="🐶 Naughty Dog says…",
         description=quote,
         color=DEFAULT_COLOR,
         url=STEAM_STORE_URL,
-        timestamp=datetime.now(timezone.utc),
     )
 
-    img = _pick_media_url()
     if img:
         embed.set_image(url=img)
 
@@ -159,54 +74,66 @@ def _build_embed() -> discord.Embed:
     return embed
 
 
-async def _send_to_channels(bot: discord.Client, *, embed: discord.Embed) -> None:
-    if not BANLU_CHANNEL_ID:
+def _build_embed(day: date, img: Optional[str]) -> Optional[discord.Embed]:
+    """
+    Embed for `day` (from the cache when the same quote + image come up again).
+    Stats / reads the corpus: runs in the I/O pool.
+    """
+    item = quote_for_day(day)
+    if item is None:
+        logger.warning("Ban'Lu quote corpus %s is empty.", banlu_quotes.path)
+        return None
+
+    index, quote = item
+    key = (banlu_quotes.version, index, img)
+    embed = _embeds.get(key)
+    if embed is None:
+        embed = _render_embed(quote, img)
+        _embeds.put(key, embed)
+    return embed
+
+
+async def _send_to_channels(bot: discord.Client, channels: List[int], *, embed: discord.Embed) -> Optional[FanoutReport]:
+    if not channels:
         logger.info("No BANLU_CHANNEL_ID configured, skipping Ban'Lu/NaughtyDog send.")
-        return
+        return None
 
-    for channel_id in BANLU_CHANNEL_ID:
-        channel = bot.get_channel(channel_id)
-        if channel is None:
-            logger.warning("Channel %s not found.", channel_id)
-            continue
-        try:
-            await channel.send(embed=embed)
-        except Exception:
-            logger.exception("Failed to send embed to channel %s.", channel_id)
-
-
-@tasks.loop(time=time(hour=10, minute=0, tzinfo=TZ))
-async def send_banlu_daily() -> None:
-    """Scheduled daily job (10:00 in BOT_TZ)."""
-    global _last_sent
-    bot = send_banlu_daily.bot  # type: ignore[attr-defined]
-
-    today = datetime.now(TZ).date()
-    if _last_sent == today:
-        return
+    return await fan_out_same(bot, channels, label="banlu", embed=embed)
 
-    await _send_to_channels(bot, embed=_build_embed())
-    _last_sent = today
-    logger.info("Naughty Dog quote sent for %s.", today.isoformat())
 
+async def _prepare_embed(day: date) -> Optional[discord.Embed]:
+    """Prepare phase: pick quote + screenshot ahead of the send."""
+    # Media pick on the loop (it may schedule a revalidation); corpus work in the pool
+    img = _pick_media_url()
+    return await io_pool.run("banlu.build", _build_embed, day, img, resource="banlu")
 
-async def send_banlu_once() -> None:
-    """
-    One-time recovery on startup:
-    if bot starts AFTER 10:00 and today's quote wasn't sent yet — send once.
-    """
-    global _last_sent
-    bot = send_banlu_once.bot  # type: ignore[attr-defined]
 
-    now = datetime.now(TZ)
-    scheduled = now.replace(hour=10, minute=0, second=0, microsecond=0)
-    if now <= scheduled:
-        return
+async def _data_version(day: date) -> int:
+    """Corpus version: an edited quote file invalidates the prepared embed."""
+    return await io_pool.run("banlu.version", lambda: banlu_quotes.version, resource="banlu")
 
-    today = now.date()
-    if _last_sent == today:
+
+@scheduler.daily(
+    "banlu",
+    time(hour=10, minute=0),
+    build=_prepare_embed,
+    fingerprint=_data_version,
+    targets=lambda: BANLU_CHANNEL_ID,
+)
+async def send_banlu_daily(
+    bot: discord.Client,
+    today: date,
+    embed: Optional[discord.Embed],
+    channels: List[int],
+) -> None:
+    """Scheduled daily job (10:00 local): dispatches the prepared embed to one bucket."""
+    if embed is None:
         return
 
-    logger.info("Bot restarted after schedule → sending missed Naughty Dog quote.")
-    await _send_to_channels(bot, embed=_build_embed())
-    _last_sent = today
+    # The cached embed is shared: send a copy stamped with the send time
+    embed = embed.copy()
+    embed.timestamp = datetime.now(timezone.utc)
+    report = await _send_to_channels(bot, channels, embed=embed)
+    if report is not None:
+        report.raise_if_all_failed()  # not marked done: retried
+    logger.info("Naughty Dog quote sent for %s.", today.isoformat())
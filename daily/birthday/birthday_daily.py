@@ -4,10 +4,14 @@
 #
 # Posts guild events (Challenges / Heroes / Birthdays) to configured Discord channels.
 #
+# Registered with the daily scheduler (core/scheduler.py) at 10:02 in BOT_TZ
+# (or each channel's DAILY_SCHEDULE time). Events are looked up for the
+# local date of each timezone bucket.
+#
 # Layer: Daily
 #
 # Responsibilities:
-# - Schedule recurring jobs via discord.ext.tasks
+# - Register the daily job with core/scheduler.py
 # - Load/normalize/format content via services/
 # - Send messages to configured channels
 #
@@ -16,110 +20,59 @@
 #
 # ==================================================
 
-# ==================================================
-# daily/birthday/birthday_daily.py — Daily Guild Events Sender
-# ==================================================
-
-# ==================================================
-# daily/birthday/birthday_daily.py — Daily Guild Events Sender
-# ==================================================
-
 import logging
-import os
-from datetime import datetime, timedelta, timezone, time, date
-from zoneinfo import ZoneInfo
-from typing import Optional
+from datetime import time, date
+from typing import List, Optional
 
 import discord
-from discord.ext import tasks
 
+from core.fanout import FanoutReport, fan_out_same
+from core.scheduler import scheduler
 from services.channel_ids import parse_chat_ids_from_env
-from services.birthday_service import load_birthday_events, get_today_birthday_payload
-from services.birthday_format import build_guild_events_embed
+from services.birthday_service import get_birthday_index, load_birthday_events_async
+from services.birthday_format import get_guild_events_embed
 
 logger = logging.getLogger("birthday_daily")
 
-TZ_NAME = os.getenv("BOT_TZ", "Europe/Moscow")
-try:
-    TZ = ZoneInfo(TZ_NAME)
-except Exception:
-    logger.warning("Invalid BOT_TZ=%s, fallback to UTC", TZ_NAME)
-    TZ = timezone.utc
-
 # Accept one or many channel IDs, comma-separated.
 BIRTHDAY_CHANNEL_ID = parse_chat_ids_from_env("BIRTHDAY_CHANNEL_ID")
 
-# In-memory guard to avoid double-sends after restarts.
-_last_sent: Optional[date] = None
-
 
-async def _send_to_channels(bot: discord.Client, *, embed: discord.Embed) -> None:
-    """Send an embed to all configured channels."""
-    if not BIRTHDAY_CHANNEL_ID:
-        return
+async def _send_to_channels(bot: discord.Client, channels: List[int], *, embed: discord.Embed) -> Optional[FanoutReport]:
+    """Send an embed to the bucket's channels (concurrently)."""
+    if not channels:
+        return None
 
-    for channel_id in BIRTHDAY_CHANNEL_ID:
-        channel = bot.get_channel(channel_id)
-        if channel is None:
-            logger.warning("Channel %s not found.", channel_id)
-            continue
+    return await fan_out_same(bot, channels, label="birthday", embed=embed)
 
-        try:
-            await channel.send(embed=embed)
-        except Exception:
-            logger.exception("Failed to send guild events message to channel %s.", channel_id)
 
+async def _build_today_embed(today: date) -> discord.Embed:
+    # File read / parse / index run in the I/O pool, only if the file changed
+    events = await load_birthday_events_async()
+    # Cached per (event-set version, date)
+    return get_guild_events_embed(today, events)
 
-def _build_today_embed(today: date) -> discord.Embed:
-    events = load_birthday_events()
-    payload = get_today_birthday_payload(events=events, today=today) or {
-        "title": "Guild events",
-        "challenges": [],
-        "heroes": [],
-        "birthdays": [],
-    }
-    return build_guild_events_embed(payload=payload, today=today)
 
+async def _prepare_embed(day: date) -> discord.Embed:
+    """Prepare phase: build the day's embed ahead of the send."""
+    return await _build_today_embed(day)
 
-@tasks.loop(time=time(hour=10, minute=2, tzinfo=TZ))
-async def send_birthday_daily():
-    """Scheduled daily job (10:05 GMT+3)."""
-    global _last_sent
 
-    bot = send_birthday_daily.bot
-    now = datetime.now(TZ)
-    today = now.date()
+async def _data_version(day: date) -> int:
+    """Event-set version; changes when birthday.json was edited (mtime/size)."""
+    return get_birthday_index(await load_birthday_events_async()).version
 
-    if _last_sent == today:
-        return
 
-    embed = _build_today_embed(today)
-
-    await _send_to_channels(bot, embed=embed)
-    _last_sent = today
+@scheduler.daily(
+    "birthday",
+    time(hour=10, minute=2),
+    build=_prepare_embed,
+    fingerprint=_data_version,
+    targets=lambda: BIRTHDAY_CHANNEL_ID,
+)
+async def send_birthday_daily(bot: discord.Client, today: date, embed: discord.Embed, channels: List[int]) -> None:
+    """Scheduled daily job (10:02 local): dispatches the embed for the bucket's local date."""
+    report = await _send_to_channels(bot, channels, embed=embed)
+    if report is not None:
+        report.raise_if_all_failed()  # not marked done: retried
     logger.info("Guild events sent for %s.", today.isoformat())
-
-
-# ==================================================
-# One-Time Recovery (Bot Restart After 10:05)
-# ==================================================
-async def send_once_if_missed_birthday():
-    """If the bot starts after today's scheduled time, send once."""
-    global _last_sent
-
-    bot = send_once_if_missed_birthday.bot
-    now = datetime.now(TZ)
-    scheduled = now.replace(hour=10, minute=5, second=0, microsecond=0)
-
-    if now <= scheduled:
-        return
-
-    today = now.date()
-    if _last_sent == today:
-        return
-
-    embed = _build_today_embed(today)
-
-    logger.info("Bot restarted after schedule → sending missed guild events.")
-    await _send_to_channels(bot, embed=embed)
-    _last_sent = today
\ No newline at end of file
@@ -4,74 +4,60 @@
 #
 # Posts today's holidays (static + dynamic) to configured Discord channels.
 #
+# Registered with the daily scheduler (core/scheduler.py) at 10:01 in BOT_TZ
+# (or each channel's DAILY_SCHEDULE time). Holidays are looked up for the
+# local date of each timezone bucket.
+#
 # Layer: Daily
 # ==================================================
 
-import os
 import logging
-from datetime import datetime, timedelta, timezone, time, date
-from zoneinfo import ZoneInfo
-from typing import Optional
+from datetime import time, date
+from typing import Dict, List, Optional, Tuple
 
 import discord
-from discord.ext import tasks
 
+from core.fanout import FanoutReport, fan_out
+from core.io_executor import io_pool
+from core.scheduler import scheduler
 from services.channel_ids import parse_chat_ids_from_env
-from services.holidays_service import get_today_holidays
-from services.holidays_flags import COUNTRY_FLAGS, CATEGORY_EMOJIS
+from services.holidays_service import (
+    filter_by_masks,
+    get_holiday_index,
+    get_today_holidays,
+    subscription_masks,
+)
+from services.holidays_subscriptions import load_subscriptions_from_env
 
 logger = logging.getLogger("holidays_daily")
 
-TZ_NAME = os.getenv("BOT_TZ", "Europe/Moscow")
-try:
-    TZ = ZoneInfo(TZ_NAME)
-except Exception:
-    logger.warning("Invalid BOT_TZ=%s, fallback to UTC", TZ_NAME)
-    TZ = timezone.utc
-
 # Accept one or many channel IDs, comma-separated.
 HOLIDAYS_CHANNEL_ID = parse_chat_ids_from_env("HOLIDAYS_CHANNEL_ID")
 
-_last_sent: Optional[date] = None
+# Optional per-channel country/category filters (see services/holidays_subscriptions.py)
+HOLIDAYS_SUBSCRIPTIONS = load_subscriptions_from_env("HOLIDAYS_SUBSCRIPTIONS")
 
 
 def build_flag(h) -> str:
     """Return first country flag emoji for a holiday entry."""
-    countries = h.get("countries") or []
-    if not countries:
-        return "🌍"
-    country = countries[0]
-    return COUNTRY_FLAGS.get(country, "🌍")
+    return h.flag
 
 
 def build_category_line(h) -> str:
     """Return first category with emoji (formatted for embed)."""
-    categories = h.get("categories") or []
-    if not categories:
+    if not h.categories:
         return ""
 
-    main = categories[0]
-    emoji = CATEGORY_EMOJIS.get(main, "")
-    return f"{emoji} `{main}`" if emoji else f"`{main}`"
-
+    main = h.categories[0]
+    return f"{h.emoji} `{main}`" if h.emoji else f"`{main}`"
 
-async def _send_embed_to_channels(bot: discord.Client, embed: discord.Embed) -> None:
-    if not HOLIDAYS_CHANNEL_ID:
-        return
 
-    for channel_id in HOLIDAYS_CHANNEL_ID:
-        channel = bot.get_channel(channel_id)
-        if not channel:
-            logger.warning("Channel %s not found.", channel_id)
-            continue
-        try:
-            await channel.send(embed=embed)
-        except Exception:
-            logger.exception("Failed to send holidays embed to channel %s.", channel_id)
+async def _send_embeds_to_channels(bot: discord.Client, embeds: Dict[int, discord.Embed]) -> FanoutReport:
+    """Send each channel its own embed (concurrently)."""
+    return await fan_out(bot, {cid: {"embed": embed} for cid, embed in embeds.items()}, label="holidays")
 
 
-def _build_today_embed(today: date) -> Optional[discord.Embed]:
-    todays = get_today_holidays(today=today)
+def _build_embed(todays) -> Optional[discord.Embed]:
     if not todays:
         return None
 
@@ -81,56 +67,73 @@ def _build_today_embed(today: date) -> Optional[discord.Embed]:
 
     for h in todays:
         embed.add_field(
-            name=f"{build_flag(h)} {h.get('name', 'Holiday')}",
+            name=f"{build_flag(h)} {h.name}",
             value=build_category_line(h) or " ",
             inline=False,
         )
     return embed
 
 
-@tasks.loop(time=time(hour=10, minute=1, tzinfo=TZ))
-async def send_holidays_daily():
-    """Scheduled daily job (10:01 GMT+3)."""
-    global _last_sent
+def _build_channel_embeds(today: date) -> Dict[int, discord.Embed]:
+    """
+    Build one embed per channel from a single scan of today's holidays.
 
-    bot = send_holidays_daily.bot
-    now = datetime.now(TZ)
-    today = now.date()
+    Channels with identical subscriptions share the same embed; channels
+    whose filter matches nothing today get no message.
+    """
+    todays = get_today_holidays(today=today)
+    if not todays:
+        return {}
 
-    if _last_sent == today:
-        return
+    by_masks: Dict[Tuple[int, int], Optional[discord.Embed]] = {}
+    embeds: Dict[int, discord.Embed] = {}
 
-    embed = _build_today_embed(today)
-    if not embed:
-        logger.info("No holidays today.")
+    for channel_id in HOLIDAYS_CHANNEL_ID:
+        sub = HOLIDAYS_SUBSCRIPTIONS.get(channel_id)
+        if sub is not None and sub.matches_nothing:
+            continue  # every tag was invalid: never widen to "any"
+        masks = subscription_masks(sub.countries, sub.categories) if sub else (0, 0)
+
+        if masks not in by_masks:
+            by_masks[masks] = _build_embed(filter_by_masks(todays, *masks))
+
+        embed = by_masks[masks]
+        if embed is not None:
+            embeds[channel_id] = embed
+
+    return embeds
+
+
+async def _prepare_embeds(day: date) -> Dict[int, discord.Embed]:
+    """Prepare phase: build every channel's embed ahead of the send (in the I/O pool)."""
+    return await io_pool.run("holidays.daily", _build_channel_embeds, day, resource="holidays")
+
+
+async def _data_version(day: date) -> int:
+    """Re-stat the holiday sources; changes when a JSON file was edited."""
+    return await io_pool.run("holidays.refresh", get_holiday_index().refresh, day, resource="holidays")
+
+
+@scheduler.daily(
+    "holidays",
+    time(hour=10, minute=1),
+    build=_prepare_embeds,
+    fingerprint=_data_version,
+    targets=lambda: HOLIDAYS_CHANNEL_ID,
+)
+async def send_holidays_daily(
+    bot: discord.Client,
+    today: date,
+    embeds: Dict[int, discord.Embed],
+    channels: List[int],
+) -> None:
+    """Scheduled daily job (10:01 local): dispatches the bucket's embeds for its local date."""
+    # The build covers every channel for that date; send only this bucket's
+    embeds = {cid: embeds[cid] for cid in channels if cid in embeds}
+    if not embeds:
+        logger.info("No holidays on %s for this bucket.", today.isoformat())
         return
 
-    await _send_embed_to_channels(bot, embed)
-    _last_sent = today
+    report = await _send_embeds_to_channels(bot, embeds)
+    report.raise_if_all_failed()  # not marked done: retried
     logger.info("Holidays sent for %s.", today.isoformat())
-
-
-# ==================================================
-# One-Time Recovery (Bot Restart After 10:01)
-# ==================================================
-async def send_once_if_missed_holidays():
-    global _last_sent
-
-    bot = send_once_if_missed_holidays.bot
-    now = datetime.now(TZ)
-    scheduled = now.replace(hour=10, minute=1, second=0, microsecond=0)
-
-    if now <= scheduled:
-        return
-
-    today = now.date()
-    if _last_sent == today:
-        return
-
-    embed = _build_today_embed(today)
-    if not embed:
-        return
-
-    logger.info("Bot restarted after schedule → sending missed holidays.")
-    await _send_embed_to_channels(bot, embed)
-    _last_sent = today
@@ -4,17 +4,30 @@
 #
 # Loads Ban'Lu quotes and provides helpers for daily posting.
 #
+# The quotes live in one corpus (BANLU_QUOTES_FILE, default
+# data/quotersbanlu.txt), read through core.corpus.TextCorpus: loaded
+# once, re-read only when the file is edited. Two shuffle bags walk it
+# so every quote is used once before any repeats:
+#
+# - the daily post: `quote_for_day(day)`, cursor = the date (stable
+#   across restarts);
+# - commands: `next_banlu_quote(today)`, a separate process-local
+#   cursor on purpose (a command must not advance the daily sequence)
+#   that skips the quote posted that day.
+#
 # Layer: Services
 # ==================================================
 
 from __future__ import annotations
 
 import os
-import random
 import re
-from typing import List, Optional
+from datetime import date
+from typing import Optional, Tuple
 
+from core.corpus import ShuffleBag, TextCorpus
 from core.settings import BANLU_WOWHEAD_URL
+from core.startup import startup
 
 # Optional: link/image for Ban'Lu embeds in Discord.
 # If not provided, we default to the given Steam page (The Last of Us Part I)
@@ -36,24 +49,32 @@ def _steam_header_image(url: str) -> Optional[str]:
 BANLU_LINK_URL = os.getenv("BANLU_LINK_URL", DEFAULT_BANLU_STEAM_URL)
 BANLU_IMAGE_URL = os.getenv("BANLU_IMAGE_URL", _steam_header_image(BANLU_LINK_URL) or BANLU_WOWHEAD_URL)
 
+BANLU_QUOTES_FILE = os.getenv("BANLU_QUOTES_FILE", "data/quotersbanlu.txt")
 
-def load_banlu_quotes(path: str) -> List[str]:
-    """Load Ban’Lu quotes from UTF-8 file."""
-    if not os.path.exists(path):
-        return []
+# One corpus; the daily bag is walked by date, the command bag by its own cursor
+banlu_quotes = TextCorpus(BANLU_QUOTES_FILE)
+banlu_bag = ShuffleBag(banlu_quotes, seed="banlu")
+banlu_command_bag = ShuffleBag(banlu_quotes, seed="banlu:command")
+startup.warmup("banlu", resource="banlu")(banlu_quotes.lines)
 
-    with open(path, "r", encoding="utf-8") as f:
-        return [line.strip() for line in f.readlines() if line.strip()]
 
+def quote_for_day(day: date) -> Optional[Tuple[int, str]]:
+    """(index, quote) for `day`: stable across restarts, no repeats within a cycle."""
+    return banlu_bag.at(day.toordinal())
 
-def get_random_banlu_quote(quotes: List[str]) -> Optional[str]:
-    if not quotes:
-        return None
-    return random.choice(quotes)
+
+def next_banlu_quote(today: date) -> Optional[Tuple[int, str]]:
+    """(index, quote) from the command bag, never the quote posted on `today`."""
+    posted = quote_for_day(today)
+    item = banlu_command_bag.draw()
+    if item is not None and posted is not None and item[0] == posted[0] and len(banlu_quotes) > 1:
+        item = banlu_command_bag.draw()
+    return item
 
 
-def format_banlu_message() -> str:
-    quote = get_random_banlu_quote()
+def format_banlu_message(today: date) -> str:
+    item = next_banlu_quote(today)
+    quote = item[1] if item else "…"
 
     # We intentionally do NOT append an external link (e.g., Wowhead) here.
     # The Discord embed can carry an image + optional Steam URL separately.
@@ -26,6 +26,14 @@ from typing import Any, Dict, List, Optional, Tuple
 import discord
 
 from services.birthday_service import _norm_token  # reuse normalization (avoid duplicates)
+from services.birthday_service import (
+    EventSpan,
+    get_birthday_index,
+    get_event_span,
+    get_today_birthday_payload,
+)
+from core.response_cache import ResponseCache
+from core.settings import local_today
 # ------------------------------------------------------------------
 # Date range helpers
 # ------------------------------------------------------------------
@@ -187,37 +195,29 @@ class RangeProgress:
 
 
 def _range_dates(date_str: str, today: date) -> Optional[Tuple[date, date]]:
-    """Parse 'MM-DD:MM-DD' into actual start/end dates around 'today'.
+    """Start/end dates of a 'MM-DD:MM-DD' range around 'today'.
 
-    Handles year wrap (e.g. 12-19:01-20).
+    Reads the window precomputed by the birthday index (year wrap,
+    e.g. 12-19:01-20, is resolved there); None for single days.
     """
-    if ":" not in date_str:
-        return None
-
-    start_str, end_str = date_str.split(":", 1)
-    sm, sd = map(int, start_str.split("-"))
-    em, ed = map(int, end_str.split("-"))
+    return _span_dates(get_event_span(date_str), today)
 
-    wraps = (em, ed) < (sm, sd)
 
-    # choose a year so that today is inside the window
-    if wraps:
-        if today.month > sm or (today.month == sm and today.day >= sd):
-            start_y = today.year
-            end_y = today.year + 1
-        else:
-            start_y = today.year - 1
-            end_y = today.year
-    else:
-        start_y = today.year
-        end_y = today.year
-
-    return date(start_y, sm, sd), date(end_y, em, ed)
+def _span_dates(span: Optional[EventSpan], today: date) -> Optional[Tuple[date, date]]:
+    """Service function:  span dates (ranges only)."""
+    if span is None or not span.is_range:
+        return None
+    return span.window(today)
 
 
 def _range_progress(date_str: str, today: date) -> Optional[RangeProgress]:
     """Service function:  range progress."""
-    rng = _range_dates(date_str, today)
+    return _span_progress(get_event_span(date_str), today)
+
+
+def _span_progress(span: Optional[EventSpan], today: date) -> Optional[RangeProgress]:
+    """Per-day progress numbers for a ranged event active on *today*."""
+    rng = _span_dates(span, today)
     if not rng:
         return None
 
@@ -357,6 +357,191 @@ def _split_owner_desc(name: str) -> Tuple[str, str]:
     return parts[0], " ".join(parts[1:]).strip()
 
 
+# ------------------------------
+# Precomputed render layer
+# ------------------------------
+#
+# Everything that does not depend on the date (name splits, emoji
+# resolution, the short period label) is rendered once per event and
+# kind. Only the progress numbers are filled in per day, and complete
+# embeds are cached by (event-set version, date) so the daily job and
+# any preview share one build.
+
+
+@dataclass(frozen=True)
+class RenderedEvent:
+    """Date-independent parts of one event block."""
+
+    event: Dict[str, Any]
+    text_lines: Tuple[str, ...]   # format_birthday_message block (before progress)
+    embed_lines: Tuple[str, ...]  # embed field block (before progress)
+    span: Optional[EventSpan]
+    period: str                   # "Dec 19–Jan 20"
+    period_padded: str            # "Dec 19–Jan 05"
+
+    def progress(self, today: date) -> Optional[RangeProgress]:
+        return _span_progress(self.span, today)
+
+
+def _static_challenge(ev: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """Service function:  static challenge lines (text, embed)."""
+    name = str(ev.get("name", "")).strip()
+    categories = ev.get("category", []) or []
+    countries = ev.get("countries", []) or []
+
+    owner, task = _split_owner_task(name)
+    owner_emoji = _emoji_for_country(countries)
+    task_emoji = _emoji_for_category(categories)
+
+    text: List[str] = []
+    if owner:
+        text.append(f"{owner_emoji} {owner}".strip())
+    if task:
+        text.append(f"↳ {task_emoji} {task}".strip())
+
+    embed = [f"⚡️ {owner}" if owner else "⚡️ Challenge"]
+    if task:
+        embed.append(f"↳ {task_emoji} {task}".rstrip())
+
+    return text, embed
+
+
+def _static_hero(ev: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """Service function:  static hero lines (text, embed)."""
+    name = str(ev.get("name", "")).strip()
+    categories = ev.get("category", []) or []
+    countries = ev.get("countries", []) or []
+
+    hero, _desc = _split_owner_desc(name)
+    hero_emoji = _emoji_for_country(countries)
+    status_emoji = _emoji_for_category(categories)
+
+    text: List[str] = []
+    if hero:
+        text.append(f"{hero_emoji} {hero}".strip())
+    # This phrase is intentionally normalized for the 'accept/complete' hero format
+    text.append(f"↳ {status_emoji} Challenge accepted, but not completed".strip())
+
+    if not name:
+        return text, ["🤡 (unnamed hero)"]
+    # Keep the same phrase as the Telegram formatter
+    embed = [
+        f"🤡 {hero}".strip() if hero else "🤡 (unnamed hero)",
+        "↳ 💩 Challenge accepted, but not completed",
+    ]
+    return text, embed
+
+
+def _static_birthday(ev: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """Service function:  static birthday lines (text, embed)."""
+    return _birthday_text_lines(ev), [_birthday_embed_line(ev)]
+
+
+def _birthday_text_lines(ev: Dict[str, Any]) -> List[str]:
+    """Two-line text block for a birthday; empty if the entry has no name."""
+    name = str(ev.get("name", "")).strip()
+    if not name:
+        return []
+
+    # Birthday JSON can contain either singular or plural fields
+    categories = _as_list(ev.get("categories", ev.get("category", [])))
+    countries = _as_list(ev.get("countries", ev.get("country", [])))
+
+    # Use *all* provided categories/countries (no de-dup)
+    cat_emojis = _emoji_for_categories_all(categories) or "🥳"
+    country_emojis = _emoji_for_countries_all(countries)
+
+    # Optional birthday phrase/message (preferred)
+    message = (
+        str(
+            ev.get("message")
+            or ev.get("text")
+            or ev.get("phrase")
+            or ev.get("msg")
+            or ""
+        )
+        .strip()
+    )
+
+    lines = [f"{cat_emojis} {name}".strip()]
+
+    # Second line: country emojis + message (or country keys as fallback)
+    if message:
+        lines.append(f"{country_emojis} {message}".strip())
+        return lines
+
+    # If all tokens were resolved to emojis (e.g. 'murloc'), don't print raw keys like 'murloc'.
+    unresolved: List[str] = []
+    is_murloc = any(_norm_key(c) == "murloc" for c in countries)
+
+    for c in countries:
+        raw = str(c).strip()
+        k = _norm_token(c)
+        if not raw:
+            continue
+        if k and k not in _COUNTRY_FLAGS_NORM:
+            unresolved.append(raw)
+
+    if unresolved:
+        # Keep unresolved raw keys visible
+        lines.append(" ".join([country_emojis, " ".join(unresolved)]).strip())
+    elif country_emojis:
+        # Only emojis (clean)
+        if is_murloc:
+            lines.append(f"{country_emojis} Mrgl Mrgl!".strip())
+        else:
+            lines.append(country_emojis)
+    else:
+        lines.append(" ".join([str(c).strip() for c in countries if str(c).strip()]))
+
+    return lines
+
+
+def _birthday_embed_line(ev: Dict[str, Any]) -> str:
+    """Service function:  birthday embed line."""
+    name = (ev.get("name") or "").strip()
+    if not name:
+        name = "(unknown)"
+    # Try to add a category emoji if present (falls back to 🎂)
+    emo = _emoji_for_category(ev.get("category") or [])
+    if not emo or emo == "🎉":
+        emo = "🎂"
+    return f"{emo} {name}".rstrip()
+
+
+_STATIC_BUILDERS = {
+    "challenge": _static_challenge,
+    "hero": _static_hero,
+    "birthday": _static_birthday,
+}
+
+_RENDERED: Dict[Tuple[int, str], RenderedEvent] = {}
+_RENDERED_MAX = 4096
+
+
+def _rendered(ev: Dict[str, Any], kind: str) -> RenderedEvent:
+    """Static render of an event, computed once per (event, kind)."""
+    key = (id(ev), kind)
+    cached = _RENDERED.get(key)
+    if cached is not None and cached.event is ev:
+        return cached
+
+    text, embed = _STATIC_BUILDERS[kind](ev)
+    span = get_event_span(str(ev.get("date", "")))
+    if span is not None and span.is_range:
+        (sm, sd), (em, ed) = span.start, span.end
+        period = f"{_MONTH_ABBR[sm]} {sd}–{_MONTH_ABBR[em]} {ed}"
+        period_padded = f"{_MONTH_ABBR[sm]} {sd:02d}–{_MONTH_ABBR[em]} {ed:02d}"
+    else:
+        period = period_padded = ""
+
+    rendered = RenderedEvent(ev, tuple(text), tuple(embed), span, period, period_padded)
+    if len(_RENDERED) >= _RENDERED_MAX:
+        _RENDERED.clear()
+    _RENDERED[key] = rendered
+    return rendered
+
+
 # ------------------------------
 # Public API
 # ------------------------------
@@ -389,22 +574,12 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
         _ensure_blank(lines)  # ensure spacing before the next section
     else:
         for ev in challenges:
-            name = str(ev.get("name", "")).strip()
-            categories = ev.get("category", []) or []
-            countries = ev.get("countries", []) or []
-
-            owner, task = _split_owner_task(name)
-            owner_emoji = _emoji_for_country(countries)
-            task_emoji = _emoji_for_category(categories)
+            r = _rendered(ev, "challenge")
+            lines.extend(r.text_lines)
 
-            if owner:
-                lines.append(f"{owner_emoji} {owner}".strip())
-            if task:
-                lines.append(f"↳ {task_emoji} {task}".strip())
-
-            prog = _range_progress(str(ev.get("date", "")), today)
+            prog = r.progress(today)
             if prog:
-                lines.append(f"↳ challenge period {range_emoji} {_format_range(prog.start, prog.end)}")
+                lines.append(f"↳ challenge period {range_emoji} {r.period}")
                 lines.append(
                     f"↳ Currently day {prog.day_index} out of {prog.remaining_days} {_days_word(prog.remaining_days)} remaining "
                 )
@@ -423,23 +598,13 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
         _ensure_blank(lines)  # ensure spacing before the next section
     else:
         for ev in heroes:
-            name = str(ev.get("name", "")).strip()
-            categories = ev.get("category", []) or []
-            countries = ev.get("countries", []) or []
-
-            hero, _desc = _split_owner_desc(name)
-            hero_emoji = _emoji_for_country(countries)
-            status_emoji = _emoji_for_category(categories)
-
-            if hero:
-                lines.append(f"{hero_emoji} {hero}".strip())
-            # This phrase is intentionally normalized for the 'accept/complete' hero format
-            lines.append(f"↳ {status_emoji} Challenge accepted, but not completed".strip())
+            r = _rendered(ev, "hero")
+            lines.extend(r.text_lines)
 
-            prog = _range_progress(str(ev.get("date", "")), today)
+            prog = r.progress(today)
             if prog:
                 lines.append(
-                    f"↳ period {range_emoji} {_format_range(prog.start, prog.end)}"
+                    f"↳ period {range_emoji} {r.period}"
                 )
                 lines.append(
                     f"↳  {prog.remaining_days} {_days_word(prog.remaining_days)} "
@@ -459,60 +624,7 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
         lines.append("↳ no birthdays found")
     else:
         for ev in birthdays:
-            name = str(ev.get("name", "")).strip()
-            if not name:
-                continue
-
-            # Birthday JSON can contain either singular or plural fields
-            categories = _as_list(ev.get("categories", ev.get("category", [])))
-            countries = _as_list(ev.get("countries", ev.get("country", [])))
-
-            # Use *all* provided categories/countries (no de-dup)
-            cat_emojis = _emoji_for_categories_all(categories) or "🥳"
-            country_emojis = _emoji_for_countries_all(countries)
-
-            # Optional birthday phrase/message (preferred)
-            message = (
-                str(
-                    ev.get("message")
-                    or ev.get("text")
-                    or ev.get("phrase")
-                    or ev.get("msg")
-                    or ""
-                )
-                .strip()
-            )
-
-            lines.append(f"{cat_emojis} {name}".strip())
-
-            # Second line: country emojis + message (or country keys as fallback)
-            if message:
-                lines.append(f"{country_emojis} {message}".strip())
-            else:
-                # If all tokens were resolved to emojis (e.g. 'murloc'), don't print raw keys like 'murloc'.
-                unresolved: List[str] = []
-                is_murloc = any(_norm_key(c) == "murloc" for c in countries)
-
-                for c in countries:
-                    raw = str(c).strip()
-                    k = _norm_token(c)
-                    if not raw:
-                        continue
-                    if k and k not in _COUNTRY_FLAGS_NORM:
-                        unresolved.append(raw)
-
-                if unresolved:
-                    # Keep unresolved raw keys visible
-                    lines.append(" ".join([country_emojis, " ".join(unresolved)]).strip())
-                else:
-                    # Only emojis (clean)
-                    if country_emojis:
-                        if is_murloc:
-                            lines.append(f"{country_emojis} Mrgl Mrgl!".strip())
-                        else:
-                            lines.append(country_emojis)
-                    else:
-                        lines.append(" ".join([str(c).strip() for c in countries if str(c).strip()]))
+            lines.extend(_rendered(ev, "birthday").text_lines)
 
     # Trim trailing blanks
     while lines and lines[-1] == "":
@@ -523,25 +635,13 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
 
 def _render_challenge(ev: dict, today: date) -> list[str]:
     """Render one challenge event as embed-friendly lines."""
-    owner, task = _split_owner_task(ev.get("name", ""))
-    lines: list[str] = []
-
-    # Owner/title line
-    if owner:
-        lines.append(f"⚡️ {owner}")
-    else:
-        lines.append("⚡️ Challenge")
-
-    # Task line
-    if task:
-        emo = _emoji_for_category(ev.get("category") or [])
-        lines.append(f"↳ {emo} {task}".rstrip())
+    r = _rendered(ev, "challenge")
+    lines = list(r.embed_lines)
 
-    # Period + progress for ranged events (✅ фикс сигнатуры)
-    date_str = str(ev.get("date", ""))
-    prog = _range_progress(date_str, today)
+    # Period + progress for ranged events
+    prog = r.progress(today)
     if prog:
-        lines.append(f"↳ challenge period 🗓️ {prog.start:%b %d}–{prog.end:%b %d}")
+        lines.append(f"↳ challenge period 🗓️ {r.period_padded}")
         lines.append(
             f"↳ Currently day {prog.day_index} out of {prog.remaining_days} {_days_word(prog.remaining_days)} remaining "
         )
@@ -552,20 +652,14 @@ def _render_challenge(ev: dict, today: date) -> list[str]:
 
 def _render_hero(ev: dict, today: date) -> list[str]:
     """Render one hero event as embed-friendly lines (Telegram-like block)."""
-    name = str(ev.get("name", "")).strip()
-    if not name:
-        return ["🤡 (unnamed hero)"]
-
-    hero, _desc = _split_owner_desc(name)
+    r = _rendered(ev, "hero")
+    lines = list(r.embed_lines)
+    if not str(ev.get("name", "")).strip():
+        return lines
 
-    lines: list[str] = []
-    lines.append(f"🤡 {hero}".strip() if hero else "🤡 (unnamed hero)")
-    # Keep the same phrase as the Telegram formatter
-    lines.append("↳ 💩 Challenge accepted, but not completed")
-
-    prog = _range_progress(str(ev.get("date", "")), today)
+    prog = r.progress(today)
     if prog:
-        lines.append(f"↳ period 🗓️ {_format_range(prog.start, prog.end)}")
+        lines.append(f"↳ period 🗓️ {r.period}")
         lines.append(
             f"↳ {prog.remaining_days} {_days_word(prog.remaining_days)} "
             f"(day {prog.day_index} of {prog.total_days})"
@@ -575,14 +669,7 @@ def _render_hero(ev: dict, today: date) -> list[str]:
 
 
 def _render_birthday(ev: dict) -> str:
-    name = (ev.get("name") or "").strip()
-    if not name:
-        name = "(unknown)"
-    # Try to add a category emoji if present (falls back to 🎂)
-    emo = _emoji_for_category(ev.get("category") or [])
-    if not emo or emo == "🎉":
-        emo = "🎂"
-    return f"{emo} {name}".rstrip()
+    return _rendered(ev, "birthday").embed_lines[0]
 
 
 def build_guild_events_embed(
@@ -598,7 +685,7 @@ def build_guild_events_embed(
     """
 
     if today is None:
-        today = date.today()
+        today = local_today()
 
     # Title matches the screenshot style
     title = f"📅 Guild events — {today.strftime('%d %b')}"
@@ -646,4 +733,30 @@ def build_guild_events_embed(
 
     embed.add_field(name="🎂 Birthdays", value=b_value, inline=False)
 
-    return embed
\ No newline at end of file
+    return embed
+
+
+# ------------------------------
+# Cached embeds
+# ------------------------------
+
+_embeds = ResponseCache(4)
+
+
+def get_guild_events_embed(
+    today: date,
+    events: Optional[List[Dict[str, Any]]] = None,
+) -> discord.Embed:
+    """Guild events embed for *today*, cached by (event-set version, date).
+
+    Shared by the daily job and previews; treat the embed as read-only.
+    """
+    index = get_birthday_index(events)
+    key = (index.version, today)
+
+    embed = _embeds.get(key)
+    if embed is None:
+        payload = get_today_birthday_payload(events=index.events, today=today) or {}
+        embed = build_guild_events_embed(payload, today=today)
+        _embeds.put(key, embed)
+    return embed
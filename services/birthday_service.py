@@ -4,6 +4,17 @@
 #
 # Loads and normalizes guild event data (challenges, heroes, birthdays) used by daily jobs.
 #
+# Events are compiled once into a 366-bucket day-of-year index
+# (BirthdayIndex): date windows are parsed, year-wrap ranges split
+# and the event kind classified at load, so "active on date" is a
+# single bucket read.
+#
+# The data file is parsed by a tolerant incremental parser (strict or
+# 'loose' JSON with comments); problems are logged with line numbers.
+# Parsed events are cached until the file's mtime/size change.
+# Async callers use load_birthday_events_async(), which reads, parses
+# and indexes in the shared I/O pool (core/io_executor.py).
+#
 # Layer: Services
 #
 # Responsibilities:
@@ -16,11 +27,20 @@
 # - Services should not perform Telegram network calls directly (commands/daily own messaging).
 #
 # ==================================================
+import itertools
 import json
+import logging
 import os
 import re
-from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from core.io_executor import io_pool
+from core.settings import local_today
+from core.startup import startup
+
+logger = logging.getLogger(__name__)
 
 # -----------------------------------------------------------------------------
 # Normalization helpers
@@ -72,120 +92,242 @@ def _birthday_file_path() -> str:
     return os.path.join("data", "birthday.json")
 
 
-def _strip_loose_json_list(text: str) -> str:
-    """Turn a 'loose JSON' list into valid JSON.
+class BirthdayParse(NamedTuple):
+    """Parsed events plus line-numbered problems ("line 12: ...")."""
+
+    events: List[Dict[str, Any]]
+    errors: List[str]
 
-    Supports files that look like:
+
+_SEPARATORS = frozenset(" \t\r\n,[]\ufeff")
+_NEXT_OBJECT_RE = re.compile(r"\n[ \t]*\{")
+
+
+def parse_birthday_text(text: str) -> BirthdayParse:
+    """Tolerant, incremental parser for the birthday data file.
+
+    Accepts strict JSON (`[ {...}, ... ]` or `{"events": [...]}`) as well
+    as the 'loose' format:
         # comment
         { ... },
         { ... },
 
-    We remove comment lines and wrap into [ ... ].
+    Objects are decoded one at a time. A broken object is reported with
+    its line number and skipped; parsing resumes at the next line that
+    starts with `{`, so one typo doesn't drop the whole file.
     """
-    lines: List[str] = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("#") or stripped.startswith("//"):
+    # Fast path: a clean strict-JSON file is decoded in one call
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    else:
+        if isinstance(data, dict) and isinstance(data.get("events"), list):
+            data = data["events"]
+        if isinstance(data, list) and all(
+            isinstance(e, dict) and parse_event_span(str(e.get("date", ""))) is not None for e in data
+        ):
+            return BirthdayParse(data, [])
+        # otherwise re-scan below to report problems with line numbers
+
+    decoder = json.JSONDecoder()
+    events: List[Dict[str, Any]] = []
+    errors: List[str] = []
+
+    def accept(item: Any, where: str) -> None:
+        if not isinstance(item, dict):
+            errors.append(f"{where}: expected an object, got {type(item).__name__}")
+            return
+        if parse_event_span(str(item.get("date", ""))) is None:
+            errors.append(f"{where}: bad date {item.get('date')!r} (expected MM-DD or MM-DD:MM-DD), skipped")
+            return
+        events.append(item)
+
+    pos, line, n = 0, 1, len(text)
+    while True:
+        # Skip list punctuation, whitespace and comment lines between objects
+        while pos < n:
+            ch = text[pos]
+            if ch in _SEPARATORS:
+                if ch == "\n":
+                    line += 1
+                pos += 1
+            elif ch == "#" or text.startswith("//", pos):
+                end = text.find("\n", pos)
+                pos = n if end < 0 else end
+            else:
+                break
+        if pos >= n:
+            break
+
+        try:
+            obj, end = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError as e:
+            errors.append(f"line {e.lineno}, column {e.colno}: {e.msg}")
+            resync = _NEXT_OBJECT_RE.search(text, pos)
+            if resync is None:
+                break
+            line += text.count("\n", pos, resync.start())
+            pos = resync.start()
             continue
-        lines.append(line)
 
-    cleaned = "\n".join(lines)
-    cleaned = re.sub(r",\s*]", "]", cleaned)
-    cleaned = cleaned.strip()
+        where = f"line {line}"
+        line += text.count("\n", pos, end)
+        pos = end
+
+        # allow {"events": [ ... ]} as the whole document
+        if isinstance(obj, dict) and "events" in obj and "date" not in obj:
+            items = obj["events"]
+            if not isinstance(items, list):
+                errors.append(f"{where}: 'events' must be a list")
+                continue
+            for i, item in enumerate(items):
+                accept(item, f"{where}, events[{i}]")
+        else:
+            accept(obj, where)
+
+    return BirthdayParse(events, errors)
 
-    if not cleaned.startswith("["):
-        cleaned = f"[{cleaned}]"
 
-    return cleaned
+# path -> (mtime_ns, size, events); the same list object is returned
+# until the file changes, which also keeps the day index warm.
+_parsed: Dict[str, Tuple[int, int, List[Dict[str, Any]]]] = {}
 
 
 def load_birthday_events(path: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Service function: load birthday events."""
+    """Service function: load birthday events (cached until the file's mtime/size change)."""
     path = path or _birthday_file_path()
 
     try:
-        raw_text = open(path, "r", encoding="utf-8").read()
+        st = os.stat(path)
     except FileNotFoundError:
+        _parsed.pop(path, None)
         return []
 
-    raw_text = raw_text.strip()
-    if not raw_text:
-        return []
+    cached = _parsed.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
 
     try:
-        data = json.loads(raw_text)
-    except json.JSONDecodeError:
-        try:
-            data = json.loads(_strip_loose_json_list(raw_text))
-        except json.JSONDecodeError:
-            return []
+        with open(path, "r", encoding="utf-8") as f:
+            raw_text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error("Cannot read %s: %s", path, e)
+        # keep serving the last good parse rather than going silent
+        return cached[2] if cached is not None else []
 
-    # allow either: [ {...}, {...} ]  OR  {"events": [ ... ]}
-    if isinstance(data, dict):
-        data = data.get("events", [])
+    result = parse_birthday_text(raw_text)
+    for problem in result.errors:
+        logger.warning("%s: %s", path, problem)
+    if result.errors and not result.events:
+        logger.error("%s: no valid events (%d problem(s))", path, len(result.errors))
 
-    if not isinstance(data, list):
-        return []
-
-    return [e for e in data if isinstance(e, dict)]
+    _parsed[path] = (st.st_mtime_ns, st.st_size, result.events)
+    return result.events
 
 
 # -----------------------------------------------------------------------------
 # Date parsing / matching
 # -----------------------------------------------------------------------------
 
+_MMDD_RE = re.compile(r"\s*(\d{2})-(\d{2})\s*")
+
 
 def _parse_mmdd(mmdd: str) -> Optional[Tuple[int, int]]:
-    """Service function:  parse mmdd."""
-    m = re.fullmatch(r"\s*(\d{2})-(\d{2})\s*", mmdd)
+    """Service function:  parse mmdd (None if not a real calendar day)."""
+    m = _MMDD_RE.fullmatch(mmdd)
     if not m:
         return None
-    return int(m.group(1)), int(m.group(2))
+    month, day = int(m.group(1)), int(m.group(2))
+    try:
+        date(2000, month, day)  # leap year: accepts 02-29
+    except ValueError:
+        return None
+    return month, day
+
+
+def _day_offset(month: int, day: int) -> int:
+    """Day-of-year offset on a leap-year calendar (Feb 29 has its own slot)."""
+    return date(2000, month, day).timetuple().tm_yday
+
+
+def _today_offset(today: date) -> int:
+    """Offset of a real date; in common years no date maps to Feb 29 (60)."""
+    return _day_offset(today.month, today.day)
+
+
+class EventSpan(NamedTuple):
+    """Parsed 'MM-DD' or 'MM-DD:MM-DD' window, resolved once at load."""
+
+    start: Tuple[int, int]
+    end: Tuple[int, int]
+
+    @property
+    def is_range(self) -> bool:
+        return self.start != self.end
+
+    @property
+    def wraps(self) -> bool:
+        """True for ranges crossing the year boundary, e.g. 12-19:01-20."""
+        return self.end < self.start
+
+    def offsets(self) -> List[int]:
+        """Covered day-of-year offsets; wrap ranges are split in two."""
+        first = _day_offset(*self.start)
+        last = _day_offset(*self.end)
+        if not self.wraps:
+            return list(range(first, last + 1))
+        return list(range(first, 367)) + list(range(1, last + 1))
+
+    def contains(self, today: date) -> bool:
+        offset = _today_offset(today)
+        first = _day_offset(*self.start)
+        last = _day_offset(*self.end)
+        if not self.wraps:
+            return first <= offset <= last
+        return offset >= first or offset <= last
+
+    def window(self, today: date) -> Optional[Tuple[date, date]]:
+        """Concrete [start, end] dates of the occurrence around *today*.
+
+        For wrap ranges the season started last year if today is before
+        the start on the calendar. None if the dates don't exist this year.
+        """
+        start_y = end_y = today.year
+        if self.wraps:
+            if (today.month, today.day) >= self.start:
+                end_y += 1
+            else:
+                start_y -= 1
+        try:
+            return date(start_y, *self.start), date(end_y, *self.end)
+        except ValueError:
+            return None
 
 
-def event_active_on(date_str: str, today: date) -> bool:
-    """True if an event is active on the given 'today' date."""
+@lru_cache(maxsize=1024)
+def parse_event_span(date_str: str) -> Optional[EventSpan]:
+    """Parse an event 'date' field; None if it is empty or malformed."""
     ds = (date_str or "").strip()
     if not ds:
-        return False
+        return None
 
-    # single day
     if ":" not in ds:
         parsed = _parse_mmdd(ds)
-        if not parsed:
-            return False
-        month, day = parsed
-        return today.month == month and today.day == day
+        return EventSpan(parsed, parsed) if parsed else None
 
-    # range
     start_s, end_s = ds.split(":", 1)
     start = _parse_mmdd(start_s)
     end = _parse_mmdd(end_s)
     if not start or not end:
-        return False
-
-    sm, sd = start
-    em, ed = end
-    wraps_year = (em, ed) < (sm, sd)
+        return None
+    return EventSpan(start, end)
 
-    try:
-        if not wraps_year:
-            start_date = date(today.year, sm, sd)
-            end_date = date(today.year, em, ed)
-            return start_date <= today <= end_date
-
-        # wraps across year boundary, e.g. 12-19:01-20
-        if (today.month, today.day) <= (em, ed):
-            start_date = date(today.year - 1, sm, sd)
-            end_date = date(today.year, em, ed)
-        else:
-            start_date = date(today.year, sm, sd)
-            end_date = date(today.year + 1, em, ed)
 
-        return start_date <= today <= end_date
-    except ValueError:
-        # invalid calendar date
-        return False
+def event_active_on(date_str: str, today: date) -> bool:
+    """True if an event is active on the given 'today' date."""
+    span = parse_event_span(str(date_str or ""))
+    return span is not None and span.contains(today)
 
 
 # -----------------------------------------------------------------------------
@@ -214,6 +356,116 @@ def _event_kind(event: Dict[str, Any]) -> str:
     return "other"
 
 
+# -----------------------------------------------------------------------------
+# Day-of-year index
+# -----------------------------------------------------------------------------
+
+
+class IndexedEvent(NamedTuple):
+    """An event with its kind and date window precomputed."""
+
+    event: Dict[str, Any]
+    kind: str
+    span: EventSpan
+
+
+_index_versions = itertools.count(1)
+
+
+class BirthdayIndex:
+    """Events compiled into 366 day-of-year buckets (Feb 29 included).
+
+    Built once per loaded event list: date parsing, wrap splitting and
+    kind classification happen here, so daily lookups are a single
+    bucket read. Buckets keep the original event order.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self.events = events
+        # Changes whenever the event set is rebuilt (cache key for renders)
+        self.version = next(_index_versions)
+        self.entries: List[IndexedEvent] = []
+        self._spans: Dict[str, EventSpan] = {}
+        buckets: List[List[IndexedEvent]] = [[] for _ in range(367)]
+
+        for event in events:
+            date_str = str(event.get("date", "")).strip()
+            span = parse_event_span(date_str)
+            if span is None:
+                continue
+            entry = IndexedEvent(event, _event_kind(event), span)
+            self.entries.append(entry)
+            self._spans[date_str] = span
+            for offset in span.offsets():
+                buckets[offset].append(entry)
+
+        self._buckets: List[Tuple[IndexedEvent, ...]] = [tuple(b) for b in buckets]
+
+    def active_on(self, today: date) -> Tuple[IndexedEvent, ...]:
+        """Events active on *today*."""
+        return self._buckets[_today_offset(today)]
+
+    def active_between(self, start: date, end: date) -> List[IndexedEvent]:
+        """Events active on any day in [start, end], each listed once."""
+        if end < start:
+            return []
+        if (end - start).days >= 365:
+            return list(self.entries)
+
+        seen: set[int] = set()
+        out: List[IndexedEvent] = []
+        day = start
+        while day <= end:
+            for entry in self._buckets[_today_offset(day)]:
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    out.append(entry)
+            day += timedelta(days=1)
+        return out
+
+    def span_for(self, date_str: str) -> Optional[EventSpan]:
+        """Precomputed window for an event date string."""
+        ds = (date_str or "").strip()
+        span = self._spans.get(ds)
+        return span if span is not None else parse_event_span(ds)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+_index: Optional[BirthdayIndex] = None
+
+
+def get_birthday_index(events: Optional[List[Dict[str, Any]]] = None) -> BirthdayIndex:
+    """Index for *events* (default: the data file); rebuilt only when the list changes."""
+    global _index
+    events = events if events is not None else load_birthday_events()
+    if _index is None or _index.events is not events:
+        _index = BirthdayIndex(events)
+    return _index
+
+
+def _load_indexed(path: Optional[str]) -> List[Dict[str, Any]]:
+    events = load_birthday_events(path)
+    get_birthday_index(events)  # build the day index in the worker too
+    return events
+
+
+async def load_birthday_events_async(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """load_birthday_events() + index build, off the event loop."""
+    return await io_pool.run("birthday.load", _load_indexed, path, resource="birthday")
+
+
+startup.warmup("birthday")(load_birthday_events_async)
+
+
+def get_event_span(date_str: str) -> Optional[EventSpan]:
+    """Window of an event date string, read from the current index when possible."""
+    if _index is not None:
+        return _index.span_for(date_str)
+    return parse_event_span((date_str or "").strip())
+
+
 def get_today_birthday_payload(
     events: Optional[List[Dict[str, Any]]] = None,
     today: Optional[date] = None,
@@ -222,30 +474,23 @@ def get_today_birthday_payload(
 
     Returns None when there is nothing to send.
     """
-    today = today or date.today()
-    events = events if events is not None else load_birthday_events()
-
-    challenges: List[Dict[str, Any]] = []
-    heroes: List[Dict[str, Any]] = []
-    birthdays: List[Dict[str, Any]] = []
-
-    for event in events:
-        if not event_active_on(str(event.get("date", "")), today):
-            continue
-
-        kind = _event_kind(event)
-        if kind == "challenge":
-            challenges.append(event)
-        elif kind == "hero":
-            heroes.append(event)
-        elif kind == "birthday":
-            birthdays.append(event)
-
-    if not (challenges or heroes or birthdays):
+    today = today or local_today()
+
+    groups: Dict[str, List[Dict[str, Any]]] = {
+        "challenge": [],
+        "hero": [],
+        "birthday": [],
+    }
+    for entry in get_birthday_index(events).active_on(today):
+        bucket = groups.get(entry.kind)
+        if bucket is not None:
+            bucket.append(entry.event)
+
+    if not any(groups.values()):
         return None
 
     return {
-        "challenges": challenges,
-        "heroes": heroes,
-        "birthdays": birthdays,
-    }
\ No newline at end of file
+        "challenges": groups["challenge"],
+        "heroes": groups["hero"],
+        "birthdays": groups["birthday"],
+    }
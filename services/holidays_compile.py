@@ -0,0 +1,369 @@
+# ==================================================
+# services/holidays_compile.py — Holiday Snapshot Compiler
+# ==================================================
+#
+# Validates, normalizes and deduplicates the hand-edited
+# data/holidays/*.json files into a compiled snapshot:
+#
+#   data/holidays/.compiled/manifest.json   source stats + partition list
+#   data/holidays/.compiled/MM.pickle        one partition per month
+#
+# Each month partition loads with a single read. The snapshot is only
+# published when every source file is valid; otherwise the previous
+# snapshot is left untouched and the errors are reported per file.
+#
+# Layer: Services
+#
+# Usage (CLI):
+#   python -m services.holidays_compile           # compile + publish
+#   python -m services.holidays_compile --check   # validate only
+#
+# The holiday index also recompiles automatically when a source
+# file's mtime/size no longer matches the manifest.
+#
+# ==================================================
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import pickle
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ==================================================
+# Types & constants
+# ==================================================
+
+# Bump when the partition row layout changes (forces a recompile).
+FORMAT_VERSION = 1
+
+HOLIDAYS_PATH = Path("data/holidays")
+SNAPSHOT_DIRNAME = ".compiled"
+MANIFEST_NAME = "manifest.json"
+
+# Compiled row: (mmdd, name, countries, categories, source)
+Row = Tuple[str, str, Tuple[str, ...], Tuple[str, ...], str]
+
+_MMDD_RE = re.compile(r"^\s*(\d{1,2})-(\d{1,2})\s*$")
+
+
+def snapshot_dir(src: Path) -> Path:
+    """Default snapshot location for a holidays folder."""
+    return src / SNAPSHOT_DIRNAME
+
+
+def _partition_path(out: Path, month: int) -> Path:
+    return out / f"{month:02d}.pickle"
+
+
+# ==================================================
+# Validation & normalization
+# ==================================================
+
+def _normalize_date(value: Any) -> Optional[str]:
+    """'1-5' / '01-05' → '01-05'; None if not a real calendar day."""
+    if not isinstance(value, str):
+        return None
+    m = _MMDD_RE.match(value)
+    if not m:
+        return None
+    month, day = int(m.group(1)), int(m.group(2))
+    try:
+        date(2000, month, day)  # leap year: accepts 02-29
+    except ValueError:
+        return None
+    return f"{month:02d}-{day:02d}"
+
+
+def _normalize_tags(value: Any, *, lower: bool) -> Optional[Tuple[str, ...]]:
+    """Accept a str or a list of str; None if the type is wrong."""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        return None
+
+    out: List[str] = []
+    for v in value:
+        v = " ".join(v.split())
+        if lower:
+            v = v.lower()
+        if v and v not in out:
+            out.append(v)
+    return tuple(out)
+
+
+def _merge(a: Tuple[str, ...], b: Tuple[str, ...]) -> Tuple[str, ...]:
+    return a + tuple(x for x in b if x not in a)
+
+
+@dataclass
+class CompileReport:
+    """Result of compiling the holiday sources (nothing written yet)."""
+
+    errors: Dict[str, List[str]] = field(default_factory=dict)
+    warnings: Dict[str, List[str]] = field(default_factory=dict)
+    partitions: Dict[int, List[Row]] = field(default_factory=dict)
+    sources: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def count(self) -> int:
+        return sum(len(rows) for rows in self.partitions.values())
+
+    def log(self) -> None:
+        for name, problems in self.errors.items():
+            for problem in problems:
+                logger.error("%s: %s", name, problem)
+        for name, problems in self.warnings.items():
+            for problem in problems:
+                logger.warning("%s: %s", name, problem)
+
+
+def _source_stats(src: Path) -> Dict[str, Dict[str, Any]]:
+    """mtime/size of every source file, keyed by file name."""
+    stats: Dict[str, Dict[str, Any]] = {}
+    if not src.exists():
+        return stats
+    for file in sorted(src.glob("*.json")):
+        st = file.stat()
+        stats[file.name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    return stats
+
+
+def compile_holidays(src: Path = HOLIDAYS_PATH) -> CompileReport:
+    """
+    Validate + normalize + deduplicate all source files.
+
+    Invalid entries are reported as errors and left out of the
+    partitions; duplicates (same date + name) are merged into the
+    first occurrence and reported as warnings.
+    """
+    report = CompileReport(sources=_source_stats(src))
+    seen: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+    for name in report.sources:
+        errors: List[str] = []
+        warnings: List[str] = []
+        months: List[int] = []
+
+        try:
+            data = json.loads((src / name).read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError) as e:
+            errors.append(f"cannot read file: {e}")
+            data = []
+        except json.JSONDecodeError as e:
+            errors.append(f"invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}")
+            data = []
+
+        if not isinstance(data, list):
+            errors.append("top level must be a JSON list")
+            data = []
+
+        for i, entry in enumerate(data):
+            where = f"entry #{i + 1}"
+            if not isinstance(entry, dict):
+                errors.append(f"{where}: not an object")
+                continue
+
+            title = entry.get("name")
+            if not isinstance(title, str) or not title.strip():
+                errors.append(f"{where}: missing name")
+                continue
+            title = " ".join(title.split())
+            where = f"{where} ({title!r})"
+
+            mmdd = _normalize_date(entry.get("date"))
+            if mmdd is None:
+                errors.append(f"{where}: bad date {entry.get('date')!r} (expected MM-DD)")
+                continue
+
+            countries = _normalize_tags(entry.get("countries"), lower=True)
+            if countries is None:
+                errors.append(f"{where}: countries must be a string or a list of strings")
+                continue
+
+            raw_categories = entry.get("category")
+            if raw_categories is None:
+                raw_categories = entry.get("categories")
+            categories = _normalize_tags(raw_categories, lower=False)
+            if categories is None:
+                errors.append(f"{where}: category must be a string or a list of strings")
+                continue
+
+            month = int(mmdd[:2])
+            key = (mmdd, title.casefold())
+            if key in seen:
+                m, idx = seen[key]
+                prev = report.partitions[m][idx]
+                report.partitions[m][idx] = (
+                    prev[0], prev[1], _merge(prev[2], countries), _merge(prev[3], categories), prev[4],
+                )
+                warnings.append(f"{where}: duplicate of {prev[4]} {mmdd}, merged")
+                continue
+
+            rows = report.partitions.setdefault(month, [])
+            seen[key] = (month, len(rows))
+            rows.append((mmdd, title, countries, categories, name))
+            if month not in months:
+                months.append(month)
+
+        report.sources[name]["months"] = sorted(months)
+        if errors:
+            report.errors[name] = errors
+        if warnings:
+            report.warnings[name] = warnings
+
+    return report
+
+
+# ==================================================
+# Snapshot I/O
+# ==================================================
+
+def publish_snapshot(report: CompileReport, out: Path) -> None:
+    """
+    Atomically write the partitions + manifest.
+    Refuses to publish a report with errors.
+    """
+    if not report.ok:
+        raise ValueError("refusing to publish a holiday snapshot with errors")
+
+    out.mkdir(parents=True, exist_ok=True)
+
+    for month, rows in report.partitions.items():
+        path = _partition_path(out, month)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(pickle.dumps((FORMAT_VERSION, rows), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, path)
+
+    # Drop partitions for months that no longer have any holiday
+    for month in range(1, 13):
+        if month not in report.partitions:
+            _partition_path(out, month).unlink(missing_ok=True)
+
+    manifest = {
+        "version": FORMAT_VERSION,
+        "count": report.count,
+        "partitions": sorted(report.partitions),
+        "sources": report.sources,
+    }
+    path = out / MANIFEST_NAME
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_manifest(out: Path) -> Optional[Dict[str, Any]]:
+    """Load the manifest; None if missing, unreadable or outdated."""
+    try:
+        manifest = json.loads((out / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def read_partition(out: Path, month: int) -> List[Row]:
+    """Load one compiled month partition (single read)."""
+    try:
+        version, rows = pickle.loads(_partition_path(out, month).read_bytes())
+    except FileNotFoundError:
+        return []
+    if version != FORMAT_VERSION:
+        raise ValueError(f"holiday partition {month:02d} has format {version}, expected {FORMAT_VERSION}")
+    return rows
+
+
+def _is_fresh(manifest: Optional[Dict[str, Any]], src: Path) -> bool:
+    if manifest is None:
+        return False
+    current = _source_stats(src)
+    recorded = manifest.get("sources", {})
+    if current.keys() != recorded.keys():
+        return False
+    return all(
+        recorded[name].get("mtime_ns") == st["mtime_ns"] and recorded[name].get("size") == st["size"]
+        for name, st in current.items()
+    )
+
+
+def ensure_snapshot(src: Path = HOLIDAYS_PATH, out: Optional[Path] = None) -> Optional[CompileReport]:
+    """
+    Recompile when the sources changed since the last snapshot.
+
+    Returns:
+        None if the published snapshot is up to date (or was just
+        republished); otherwise the failed CompileReport, whose valid
+        partitions the caller can serve from memory.
+    """
+    out = out or snapshot_dir(src)
+    if _is_fresh(read_manifest(out), src):
+        return None
+
+    report = compile_holidays(src)
+    report.log()
+
+    if not report.ok:
+        logger.error("Holiday snapshot not published: %d file(s) with errors.", len(report.errors))
+        return report
+
+    try:
+        publish_snapshot(report, out)
+    except OSError:
+        logger.exception("Failed to write holiday snapshot to %s; serving from memory.", out)
+        return report
+
+    logger.info("Holiday snapshot compiled: %d holidays from %d file(s).", report.count, len(report.sources))
+    return None
+
+
+# ==================================================
+# CLI
+# ==================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile data/holidays/*.json into a snapshot.")
+    parser.add_argument("--src", type=Path, default=HOLIDAYS_PATH, help="holiday JSON folder")
+    parser.add_argument("--out", type=Path, default=None, help="snapshot folder (default: <src>/.compiled)")
+    parser.add_argument("--check", action="store_true", help="validate only, do not write")
+    args = parser.parse_args(argv)
+
+    report = compile_holidays(args.src)
+
+    for name, problems in report.errors.items():
+        for problem in problems:
+            print(f"ERROR   {name}: {problem}")
+    for name, problems in report.warnings.items():
+        for problem in problems:
+            print(f"WARNING {name}: {problem}")
+
+    if not report.ok:
+        print(f"❌ {len(report.errors)} file(s) with errors — snapshot not published.")
+        return 1
+
+    if not args.check:
+        out = args.out or snapshot_dir(args.src)
+        publish_snapshot(report, out)
+        print(f"✅ {report.count} holidays from {len(report.sources)} file(s) → {out}")
+    else:
+        print(f"✅ {report.count} holidays from {len(report.sources)} file(s) are valid.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,13 +16,28 @@
 # - Services should not perform Telegram network calls directly (commands/daily own messaging).
 #
 # ==================================================
-import json
 import logging
-from datetime import date, datetime
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict
+from typing import Iterable, List, Dict, NamedTuple, Optional, Set, Tuple
 
-from core.dynamic_holidays import get_dynamic_holidays
+from core.dynamic_holidays import get_dynamic_holidays, get_dynamic_on
+from core.settings import local_today
+from core.startup import startup
+from services.holidays_compile import (
+    HOLIDAYS_PATH,
+    Row,
+    ensure_snapshot,
+    read_manifest,
+    read_partition,
+    snapshot_dir,
+)
+from services.holidays_flags import COUNTRY_FLAGS, CATEGORY_EMOJIS
 
 logger = logging.getLogger(__name__)
 
@@ -30,16 +45,619 @@ logger = logging.getLogger(__name__)
 # Types & constants
 # ==================================================
 
-Holiday = Dict[str, object]
+# Non-hot month partitions kept parsed after a range query (LRU).
+# 10 cold + 2 hot = every month: the default `!holidays` view
+# (next_for_source) touches each month that has data.
+HOLIDAYS_COLD_PARTITIONS = int(os.getenv("HOLIDAYS_COLD_PARTITIONS", "10") or 10)
+
+# Source name used for dynamically calculated holidays
+DYNAMIC_SOURCE = "dynamic"
 
-# Root directory containing static holiday JSON files
-HOLIDAYS_PATH = Path("data/holidays")
 
 # ==================================================
-# Static holidays loader
+# Normalization helpers
+# ==================================================
+
+def _normalize_categories(entry: dict) -> List[str]:
+    """Accept both `category` / `categories` and str / list variants."""
+    categories = entry.get("category") or entry.get("categories") or []
+    if isinstance(categories, str):
+        categories = [categories]
+    return list(categories)
+
+
+def _parse_mmdd(mmdd: str) -> Optional[Tuple[int, int]]:
+    """Parse 'MM-DD' into (month, day); None if malformed."""
+    try:
+        parsed = datetime.strptime(f"2000-{mmdd}", "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+    return parsed.month, parsed.day
+
+
+def _next_occurrence(month: int, day: int, today: date) -> date:
+    """
+    Next date (>= today) falling on month/day.
+    Feb 29 resolves to the next leap year.
+    """
+    for year in range(today.year, today.year + 9):
+        try:
+            candidate = date(year, month, day)
+        except ValueError:
+            continue
+        if candidate >= today:
+            return candidate
+    raise ValueError(f"No occurrence for {month:02d}-{day:02d}")
+
+
+def _day_offset(month: int, day: int) -> int:
+    """Day-of-year offset on a leap-year calendar (Feb 29 has its own slot)."""
+    return date(2000, month, day).timetuple().tm_yday
+
+
+# ==================================================
+# Tag bitmasks
+# ==================================================
+#
+# Every distinct country / category gets one bit, so a holiday's tags
+# become a single int and channel filters are a single AND per holiday.
+# Bits are process-wide and stable across reloads.
+#
+class TagBits:
+    """Assigns one bit per distinct tag (case-insensitive)."""
+
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+
+    def bit(self, tag: str) -> int:
+        key = tag.casefold()
+        bit = self._bits.get(key)
+        if bit is None:
+            bit = 1 << len(self._bits)
+            self._bits[key] = bit
+        return bit
+
+    def mask(self, tags) -> int:
+        mask = 0
+        for tag in tags or ():
+            mask |= self.bit(tag)
+        return mask
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+
+COUNTRY_BITS = TagBits()
+CATEGORY_BITS = TagBits()
+
+
+# ==================================================
+# Holiday record
+# ==================================================
+#
+# Compact, immutable record shared by every query. Country/category
+# strings and tuples are interned (the emoji map keys are the canonical
+# string objects), and the display flag/emoji and tag masks are
+# computed once per record.
+#
+# Queries return copies with `parsed_date` set via `_replace`.
+#
+class HolidayRecord(NamedTuple):
+    name: str
+    date: str
+    countries: Tuple[str, ...]
+    categories: Tuple[str, ...]
+    source: str
+    flag: str
+    emoji: str
+    country_mask: int
+    category_mask: int
+    parsed_date: Optional[date] = None
+
+
+Holiday = HolidayRecord
+
+_TAGS: Dict[str, str] = {k: k for k in (*COUNTRY_FLAGS, *CATEGORY_EMOJIS)}
+_TAG_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _intern_tags(tags: Iterable[str]) -> Tuple[str, ...]:
+    """Tuple of interned tags; identical tuples are shared too."""
+    interned = tuple(_TAGS.setdefault(t, sys.intern(t)) for t in tags)
+    return _TAG_TUPLES.setdefault(interned, interned)
+
+
+def make_record(
+    name: str,
+    mmdd: str,
+    countries: Iterable[str],
+    categories: Iterable[str],
+    source: str,
+    parsed_date: Optional[date] = None,
+) -> HolidayRecord:
+    """Build a HolidayRecord with interned tags and precomputed display fields."""
+    countries = _intern_tags(countries)
+    categories = _intern_tags(categories)
+    return HolidayRecord(
+        name=name,
+        date=sys.intern(mmdd),
+        countries=countries,
+        categories=categories,
+        source=sys.intern(source),
+        flag=COUNTRY_FLAGS.get(countries[0], "🌍") if countries else "🌍",
+        emoji=CATEGORY_EMOJIS.get(categories[0], "") if categories else "",
+        country_mask=COUNTRY_BITS.mask(countries),
+        category_mask=CATEGORY_BITS.mask(categories),
+        parsed_date=parsed_date,
+    )
+
+
+def subscription_masks(countries=(), categories=()) -> Tuple[int, int]:
+    """(country_mask, category_mask) for a channel subscription; 0 = any."""
+    return COUNTRY_BITS.mask(countries), CATEGORY_BITS.mask(categories)
+
+
+def filter_by_masks(holidays: List[Holiday], country_mask: int, category_mask: int) -> List[Holiday]:
+    """Keep holidays matching both masks (a zero mask matches everything)."""
+    if not country_mask and not category_mask:
+        return holidays
+    return [
+        h for h in holidays
+        if (not country_mask or h.country_mask & country_mask)
+        and (not category_mask or h.category_mask & category_mask)
+    ]
+
+
+# ==================================================
+# Day-of-year table
+# ==================================================
+#
+# Sorted day-of-year offsets with the holidays falling on each offset.
+# Lookups bisect into the offsets and walk forward (wrapping into
+# next year), so they don't depend on the size of the dataset.
+#
+class _DayTable:
+    """Holidays grouped by day-of-year offset, sorted by offset."""
+
+    __slots__ = ("offsets", "keys", "buckets")
+
+    def __init__(self, records: List[Holiday]):
+        grouped: Dict[int, List[Holiday]] = {}
+        keys: Dict[int, Tuple[int, int]] = {}
+        for record in records:
+            month, day = _parse_mmdd(record.date)
+            offset = _day_offset(month, day)
+            grouped.setdefault(offset, []).append(record)
+            keys[offset] = (month, day)
+
+        self.offsets: List[int] = sorted(grouped)
+        self.keys: List[Tuple[int, int]] = [keys[o] for o in self.offsets]
+        self.buckets: List[List[Holiday]] = [grouped[o] for o in self.offsets]
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def walk(self, today: date):
+        """
+        Yield (occurrence, bucket) in chronological order starting at `today`,
+        covering at most one year.
+        """
+        n = len(self.offsets)
+        if not n:
+            return
+        start = bisect_left(self.offsets, _day_offset(today.month, today.day))
+        for step in range(n):
+            j = (start + step) % n
+            month, day = self.keys[j]
+            occurrence = _next_occurrence(month, day, today)
+            # Feb 29 outside a leap year jumps years ahead: not "next" anymore
+            if (occurrence - today).days > 366:
+                continue
+            yield occurrence, self.buckets[j]
+
+    def on(self, today: date) -> List[Holiday]:
+        """Holidays whose MM-DD matches `today`."""
+        offset = _day_offset(today.month, today.day)
+        i = bisect_left(self.offsets, offset)
+        if i < len(self.offsets) and self.offsets[i] == offset:
+            return self.buckets[i]
+        return []
+
+
+# ==================================================
+# Month partitions
+# ==================================================
+#
+# Holidays are partitioned by the month of their date. Partitions
+# come from the compiled snapshot (see services/holidays_compile.py),
+# one single-read file per month.
+#
+
+def _months_between(start: date, end: date) -> List[int]:
+    """Month numbers touched by [start, end], in chronological order."""
+    months: List[int] = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month) and len(months) < 12:
+        months.append(month)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _record(row: Row) -> Holiday:
+    """Compiled snapshot row → holiday record."""
+    mmdd, name, countries, categories, source = row
+    return make_record(name, mmdd, countries, categories, source)
+
+
+def _dynamic_record(entry: dict) -> Holiday:
+    """core.dynamic_holidays entry → holiday record."""
+    return make_record(
+        entry["name"],
+        entry["date"],
+        entry.get("countries", []),
+        _normalize_categories(entry),
+        DYNAMIC_SOURCE,
+        parsed_date=datetime.strptime(entry["full_date"], "%Y-%m-%d").date(),
+    )
+
+
+class _Partition:
+    """Parsed holidays of one month: a global table + per-source tables."""
+
+    __slots__ = ("key", "table", "by_source")
+
+    def __init__(self, key: int, rows: List[Row]):
+        records = [_record(row) for row in rows]
+        by_source: Dict[str, List[Holiday]] = {}
+        for record in records:
+            by_source.setdefault(record.source, []).append(record)
+
+        self.key = key
+        self.table = _DayTable(records)
+        self.by_source = {name: _DayTable(recs) for name, recs in by_source.items()}
+
+
+# ==================================================
+# Name index (autocomplete)
+# ==================================================
+#
+# Sorted (folded name suffix starting at a word, holiday) pairs:
+# "chri" finds both "Christmas Day" and "Orthodox Christmas" with one
+# bisect + a short forward scan. Built once per (data version, date).
+#
+_WORD_START_RE = re.compile(r"[\s\-–—'’(/]+")
+
+
+class HolidayNameIndex:
+    """Holiday names searchable by word prefix."""
+
+    def __init__(self, holidays: Iterable[Holiday]):
+        entries: List[Tuple[str, Holiday]] = []
+        for h in holidays:
+            folded = h.name.casefold()
+            starts = {0, *(m.end() for m in _WORD_START_RE.finditer(folded))}
+            entries.extend((folded[i:], h) for i in starts if i < len(folded))
+        entries.sort(key=lambda e: e[0])
+
+        self._keys: List[str] = [k for k, _ in entries]
+        self._items: List[Holiday] = [h for _, h in entries]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(self, prefix: str, limit: int = 25) -> List[Holiday]:
+        """Holidays with a word starting with `prefix` (one per name + date)."""
+        prefix = prefix.strip().casefold()
+        found: List[Holiday] = []
+        seen: Set[Tuple[str, str]] = set()
+
+        for i in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[i].startswith(prefix):
+                break
+            h = self._items[i]
+            if (h.name, h.date) in seen:
+                continue
+            seen.add((h.name, h.date))
+            found.append(h)
+            if len(found) >= limit:
+                break
+        return found
+
+    def exact(self, name: str) -> List[Holiday]:
+        """Every holiday named `name` (case-insensitive)."""
+        folded = name.strip().casefold()
+        return [h for h in self.search(folded, limit=len(self._keys) or 1) if h.name.casefold() == folded]
+
+
 # ==================================================
+# Holiday index
+# ==================================================
+#
+# Single in-memory index shared by the daily job and `!holidays`.
 #
-# Loads holidays defined in static JSON files.
+# - Sources are compiled into a validated snapshot, recompiled
+#   automatically when a file's mtime/size changes (checked at startup
+#   and on every date rollover).
+# - Month partitions are loaded on demand. The current and next month
+#   stay hot; other months are only loaded for range queries and kept
+#   in an LRU (HOLIDAYS_COLD_PARTITIONS, by default large enough for
+#   the whole year; lower it to trade disk reads for memory).
+# - Each partition holds day-of-year tables (one global, one per
+#   source file) queried with `bisect`.
+# - Dynamic holidays and the full sorted upcoming list are only
+#   recomputed when the requested date changes.
+#
+# Returned lists are shared: treat them as read-only.
+#
+class HolidayIndex:
+    """In-memory holiday index with lazily loaded month partitions."""
+
+    def __init__(
+        self,
+        path: Path = HOLIDAYS_PATH,
+        cold_partitions: int = HOLIDAYS_COLD_PARTITIONS,
+        snapshot: Optional[Path] = None,
+    ):
+        self.path = path
+        self.snapshot = snapshot or snapshot_dir(path)
+        self.cold_partitions = max(0, cold_partitions)
+
+        # Snapshot manifest (no partition is loaded yet)
+        self._listed = False
+        self._months: Set[int] = set()
+        self._sources: Dict[str, dict] = {}
+        self._version = 0
+        self._source_months: Dict[str, List[int]] = {}
+        # Valid rows of a snapshot that failed validation (served from memory)
+        self._unpublished: Optional[Dict[int, List[Row]]] = None
+
+        # Loaded partitions
+        self._hot_keys: Set[int] = set()
+        self._hot: Dict[int, _Partition] = {}
+        self._cold: "OrderedDict[int, _Partition]" = OrderedDict()
+
+        # Per-day state (recomputed on date rollover)
+        self._day: Optional[date] = None
+        self._dynamic: List[Holiday] = []
+        self._dynamic_dates: List[date] = []
+        self._today: List[Holiday] = []
+        self._upcoming: Optional[List[Holiday]] = None
+        self._names: Optional[Tuple[int, date, HolidayNameIndex]] = None
+
+    # ===========================
+    # Loading
+    # ===========================
+    def _ensure_listed(self) -> None:
+        if self._listed:
+            return
+
+        report = ensure_snapshot(self.path, self.snapshot)
+        if report is None:
+            manifest = read_manifest(self.snapshot) or {}
+            self._unpublished = None
+            self._months = set(manifest.get("partitions", []))
+            sources = manifest.get("sources", {})
+        else:
+            # Bad sources: keep serving every valid entry, from memory
+            self._unpublished = report.partitions
+            self._months = set(report.partitions)
+            sources = report.sources
+
+        # Loaded partitions stay valid until the sources change
+        if sources != self._sources:
+            self._hot.clear()
+            self._cold.clear()
+            self._version += 1
+        self._sources = sources
+        self._source_months = {name: info.get("months", []) for name, info in sources.items()}
+        self._listed = True
+
+    def _load_partition(self, key: int) -> _Partition:
+        if key not in self._months:
+            return _Partition(key, [])
+        if self._unpublished is not None:
+            return _Partition(key, self._unpublished.get(key, []))
+        return _Partition(key, read_partition(self.snapshot, key))
+
+    def _partition(self, key: int) -> _Partition:
+        """Return a partition, parsing it on first use."""
+        part = self._hot.get(key)
+        if part is not None:
+            return part
+
+        part = self._cold.pop(key, None) or self._load_partition(key)
+        if key in self._hot_keys:
+            self._hot[key] = part
+        else:
+            self._cold[key] = part
+            while len(self._cold) > self.cold_partitions:
+                self._cold.popitem(last=False)
+        return part
+
+    def _set_hot(self, today: date) -> None:
+        """Pin the current and next month; demote everything else to the LRU."""
+        next_month = today.month % 12 + 1
+        self._hot_keys = {today.month, next_month}
+
+        for key in [k for k in self._hot if k not in self._hot_keys]:
+            self._cold[key] = self._hot.pop(key)
+        while len(self._cold) > self.cold_partitions:
+            self._cold.popitem(last=False)
+
+        for key in self._hot_keys:
+            self._partition(key)
+
+    def reload(self) -> None:
+        """Drop all cached data; the next query re-checks the snapshot."""
+        self._listed = False
+        self._day = None
+
+    def refresh(self, today: date) -> int:
+        """
+        Re-check the sources now (stat only, partitions are kept if
+        nothing changed) and return the current data version.
+        """
+        self.reload()
+        return self.data_version(today)
+
+    # ===========================
+    # Per-day rollover
+    # ===========================
+    def _ensure_day(self, today: date) -> None:
+        if self._day == today and self._listed:
+            return
+
+        # Date rollover: pick up edited source files
+        self._listed = False
+        self._ensure_listed()
+
+        self._set_hot(today)
+
+        # Dynamic holidays: materialized per year in core.dynamic_holidays
+        dynamic = [_dynamic_record(d) for d in get_dynamic_holidays(today)]
+
+        static_today = self._partition(today.month).table.on(today)
+
+        self._dynamic = dynamic
+        self._dynamic_dates = [h.parsed_date for h in dynamic]
+        self._today = [
+            h._replace(parsed_date=today) for h in static_today
+        ] + [_dynamic_record(d) for d in get_dynamic_on(today)]
+        self._upcoming = None
+        self._day = today
+
+    def _dynamic_between(self, start: date, end: date) -> List[Holiday]:
+        lo = bisect_left(self._dynamic_dates, start)
+        hi = bisect_right(self._dynamic_dates, end)
+        return self._dynamic[lo:hi]
+
+    # ===========================
+    # Queries
+    # ===========================
+    def data_version(self, today: date) -> int:
+        """
+        Counter bumped whenever the loaded holiday data changes
+        (sources are re-checked on every date rollover). Use it
+        together with the date as a cache key for built responses.
+        """
+        self._ensure_day(today)
+        return self._version
+
+    def sources(self) -> List[str]:
+        """Static source file names, sorted (no file is parsed)."""
+        self._ensure_listed()
+        return sorted(self._source_months)
+
+    def on_date(self, today: date) -> List[Holiday]:
+        """Holidays occurring on `today` (touches only today's month)."""
+        self._ensure_day(today)
+        return self._today
+
+    def next_for_source(self, source: str, today: date) -> Optional[Holiday]:
+        """Nearest holiday (>= today) from one source file, or DYNAMIC_SOURCE."""
+        self._ensure_day(today)
+
+        if source == DYNAMIC_SOURCE:
+            upcoming = self._dynamic_between(today, date.max)
+            return upcoming[0] if upcoming else None
+
+        best: Optional[Holiday] = None
+        for key in self._source_months.get(source, []):
+            table = self._partition(key).by_source.get(source)
+            for occurrence, bucket in (table.walk(today) if table else ()):
+                if best is None or occurrence < best.parsed_date:
+                    best = bucket[0]._replace(parsed_date=occurrence)
+                break
+        return best
+
+    def upcoming_within(
+        self,
+        today: date,
+        days: int,
+        source: Optional[str] = None,
+    ) -> List[Holiday]:
+        """Holidays in [today, today + days], sorted by date."""
+        self._ensure_day(today)
+        end = today + timedelta(days=days)
+
+        months = set(_months_between(today, end))
+
+        tables: List[_DayTable] = []
+        if source is None:
+            for key in months & self._months:
+                tables.append(self._partition(key).table)
+        elif source != DYNAMIC_SOURCE:
+            for key in months.intersection(self._source_months.get(source, [])):
+                table = self._partition(key).by_source.get(source)
+                if table is not None:
+                    tables.append(table)
+
+        found: List[Holiday] = []
+        for table in tables:
+            for occurrence, bucket in table.walk(today):
+                if occurrence > end:
+                    break
+                found.extend(h._replace(parsed_date=occurrence) for h in bucket)
+
+        if source in (None, DYNAMIC_SOURCE):
+            found.extend(self._dynamic_between(today, end))
+
+        # Stable sort keeps file order for holidays on the same day
+        found.sort(key=lambda h: h.parsed_date)
+        return found
+
+    def names(self, today: date) -> HolidayNameIndex:
+        """
+        Name index over every static + dynamic holiday, each with its next
+        occurrence as `parsed_date`. Reads all month rows (not the
+        partition cache); rebuilt when the data or the date changes.
+        """
+        self._ensure_day(today)
+        cached = self._names
+        if cached is not None and cached[0] == self._version and cached[1] == today:
+            return cached[2]
+
+        records: List[Holiday] = []
+        for key in sorted(self._months):
+            if self._unpublished is not None:
+                rows = self._unpublished.get(key, [])
+            else:
+                rows = read_partition(self.snapshot, key)
+            for row in rows:
+                record = _record(row)
+                month, day = _parse_mmdd(record.date)
+                records.append(record._replace(parsed_date=_next_occurrence(month, day, today)))
+        records.extend(self._dynamic_between(today, date.max))
+
+        index = HolidayNameIndex(records)
+        self._names = (self._version, today, index)
+        return index
+
+    def upcoming(self, today: date) -> List[Holiday]:
+        """All holidays mapped to their next occurrence, sorted by date."""
+        self._ensure_day(today)
+        if self._upcoming is None:
+            self._upcoming = self.upcoming_within(today, 366)
+        return self._upcoming
+
+
+_index = HolidayIndex()
+
+
+def get_holiday_index() -> HolidayIndex:
+    """Return the process-wide holiday index."""
+    return _index
+
+
+@startup.warmup("holidays", resource="holidays")
+def _warm_index() -> None:
+    """Check / compile the snapshot and load today's partitions in the background."""
+    _index.data_version(local_today())
+
+
+# ==================================================
+# Static holidays loader
+# ==================================================
 #
 # Each JSON entry is expected to contain:
 # - name: str
@@ -52,86 +670,23 @@ HOLIDAYS_PATH = Path("data/holidays")
 #
 def load_static_holidays(today: date) -> List[Holiday]:
     """Service function: load static holidays."""
-    holidays: List[Holiday] = []
-
-    if not HOLIDAYS_PATH.exists():
-        logger.warning("Holidays folder not found: %s", HOLIDAYS_PATH)
-        return holidays
-
-    for file in sorted(HOLIDAYS_PATH.glob("*.json")):
-        try:
-            data = json.loads(file.read_text(encoding="utf-8"))
-        except Exception:
-            logger.exception("Failed to read %s", file)
-            continue
-
-        for entry in data:
-            mmdd = entry.get("date")
-            if not mmdd:
-                continue
-
-            # Build a full date for the current year
-            parsed = datetime.strptime(
-                f"{today.year}-{mmdd}", "%Y-%m-%d"
-            ).date()
-
-            # If the holiday already passed this year,
-            # shift it to the next year
-            if parsed < today:
-                parsed = parsed.replace(year=today.year + 1)
-
-            holidays.append(
-                {
-                    "name": entry["name"],
-                    "date": mmdd,
-                    "parsed_date": parsed,
-                    "countries": entry.get("countries", []),
-                    "categories": (
-                        entry.get("category")
-                        or entry.get("categories")
-                        or []
-                    ),
-                    "source": file.name,
-                }
-            )
-
-    return holidays
+    return [h for h in _index.upcoming(today) if h.source != DYNAMIC_SOURCE]
 
 # ==================================================
 # Combined holidays loader
 # ==================================================
 #
-# Loads and merges:
-# - static holidays (from JSON files)
-# - dynamic holidays (calculated at runtime)
+# Static holidays (from JSON files) merged with
+# dynamic holidays (calculated at runtime).
 #
 # The result is a single, sorted list of holidays.
 #
 def load_all_holidays(today: date | None = None) -> List[Holiday]:
     """Service function: load all holidays."""
     if today is None:
-        today = date.today()
-
-    holidays = load_static_holidays(today)
-
-    # Append dynamically calculated holidays
-    for dynamic in get_dynamic_holidays():
-        holidays.append(
-            {
-                "name": dynamic["name"],
-                "date": dynamic["date"],
-                "parsed_date": datetime.strptime(
-                    dynamic["full_date"], "%Y-%m-%d"
-                ).date(),
-                "countries": dynamic.get("countries", []),
-                "categories": dynamic.get("categories", []),
-                "source": "dynamic",
-            }
-        )
-
-    # Sort holidays chronologically
-    holidays.sort(key=lambda h: h["parsed_date"])
-    return holidays
+        today = local_today()
+
+    return _index.upcoming(today)
 
 # ==================================================
 # Public API
@@ -142,9 +697,6 @@ def load_all_holidays(today: date | None = None) -> List[Holiday]:
 def get_today_holidays(today: date | None = None) -> List[Holiday]:
     """Service function: get today holidays."""
     if today is None:
-        today = date.today()
-
-    today_mmdd = today.strftime("%m-%d")
-    holidays = load_all_holidays(today)
+        today = local_today()
 
-    return [h for h in holidays if h["date"] == today_mmdd]
\ No newline at end of file
+    return _index.on_date(today)
@@ -0,0 +1,95 @@
+# ==================================================
+# services/holidays_subscriptions.py — Per-Channel Holiday Filters
+# ==================================================
+#
+# Lets each holidays channel subscribe to a subset of countries
+# and/or categories instead of receiving the whole dataset.
+#
+# Layer: Services
+#
+# Env format (HOLIDAYS_SUBSCRIPTIONS):
+#   "<channel_id>=<tag>,<tag>;<channel_id>=<tag>"
+#
+#   where <tag> is `country:<key>` or `category:<name>`:
+#
+#   HOLIDAYS_SUBSCRIPTIONS="111=country:russia,category:Religious;222=country:usa,country:uk"
+#
+# Semantics:
+# - Countries are OR-ed, categories are OR-ed, both dimensions are AND-ed
+#   (111 above gets Russian holidays that are also Religious).
+# - A dimension without tags matches everything.
+# - Channels listed in HOLIDAYS_CHANNEL_ID without a subscription get all holidays.
+# - A subscription whose tags are all invalid (typos like `contry:usa`)
+#   matches nothing, with a warning: it never widens to every holiday.
+# ==================================================
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HolidaySubscription:
+    """Countries / categories a channel wants (empty tuple = any)."""
+
+    countries: Tuple[str, ...] = ()
+    categories: Tuple[str, ...] = ()
+
+    @property
+    def matches_nothing(self) -> bool:
+        """No valid tag survived parsing (see parse_subscriptions)."""
+        return not self.countries and not self.categories
+
+
+def parse_subscriptions(raw: str, env_key: str = "HOLIDAYS_SUBSCRIPTIONS") -> Dict[int, HolidaySubscription]:
+    """Parse the compact subscription syntax; invalid parts are skipped with warnings."""
+    subs: Dict[int, HolidaySubscription] = {}
+
+    for part in (raw or "").split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        if "=" not in part:
+            logger.warning("Invalid subscription '%s' in %s (expected <channel_id>=<tags>); skipping.", part, env_key)
+            continue
+
+        channel_s, tags_s = part.split("=", 1)
+        try:
+            channel_id = int(channel_s.strip().lstrip("+"))
+        except ValueError:
+            logger.warning("Invalid channel ID '%s' in %s; skipping.", channel_s, env_key)
+            continue
+
+        countries: list[str] = []
+        categories: list[str] = []
+        for tag in tags_s.split(","):
+            kind, _, value = tag.strip().partition(":")
+            value = value.strip()
+            if not value:
+                continue
+            if kind.strip().lower() == "country":
+                countries.append(value)
+            elif kind.strip().lower() == "category":
+                categories.append(value)
+            else:
+                logger.warning("Unknown subscription tag '%s' in %s (use country:/category:).", tag, env_key)
+
+        if not countries and not categories:
+            logger.warning(
+                "Subscription for channel %s in %s has no valid tags; the channel gets no holidays.",
+                channel_id,
+                env_key,
+            )
+        subs[channel_id] = HolidaySubscription(tuple(countries), tuple(categories))
+
+    return subs
+
+
+def load_subscriptions_from_env(env_key: str = "HOLIDAYS_SUBSCRIPTIONS") -> Dict[int, HolidaySubscription]:
+    """Read per-channel holiday subscriptions from the environment."""
+    return parse_subscriptions(os.getenv(env_key, ""), env_key)
@@ -0,0 +1,370 @@
+# ==================================================
+# services/steam_media.py — Steam Media Store (stale-while-revalidate)
+# ==================================================
+#
+# Official screenshots for the Ban'Lu / Naughty Dog daily post, taken
+# from the Steam appdetails API.
+#
+# Layer: Services
+#
+# Behavior:
+# - The media list is persisted to BANLU_MEDIA_CACHE_PATH, so restarts
+#   start with the last known list instead of refetching. Writes run
+#   in the shared I/O pool (core/io_executor.py). On Fly.io the file
+#   lives on the `bot_state` volume (fly.toml), so the list and its
+#   ETag survive redeploys.
+# - The file is read once: the startup warmup (I/O pool) and the first
+#   reader on the event loop share a lock, the second one just gets
+#   the loaded state.
+# - Readers (`urls()`) never wait on the network: they get the current
+#   list, even if stale, and a stale list triggers one background
+#   revalidation.
+# - Revalidation is a conditional GET (If-None-Match / If-Modified-Since);
+#   a 304 only bumps the freshness timestamp.
+# - A failed or empty fetch keeps the previous list.
+# - A health check HEADs every cached URL (bounded concurrency; a CDN
+#   answering 405 to HEAD gets a one-byte ranged GET instead) and
+#   records status + latency. A URL answering 403/404/410 on
+#   MAX_CHECK_FAILURES checks in a row is blacklisted and never picked;
+#   timeouts, network errors, 429 and 5xx are inconclusive and change
+#   nothing, so an egress outage cannot blacklist the whole list. A
+#   blacklisted URL that answers again is restored on the next check.
+# - `urls()` never returns an empty list while media is cached: if every
+#   URL is blacklisted, the unfiltered list is used.
+# - `steam_media_refresher` (started by bot.py) revalidates the list and
+#   re-checks URL health periodically.
+#
+# ==================================================
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from discord.ext import tasks
+
+from core.http_client import HttpClient, HttpError, http
+from core.io_executor import io_pool
+from core.startup import startup
+
+logger = logging.getLogger(__name__)
+
+STEAM_APP_ID = int(os.getenv("BANLU_STEAM_APP_ID", "1888930"))
+STEAM_STORE_URL = os.getenv(
+    "BANLU_STEAM_URL",
+    f"https://store.steampowered.com/app/{STEAM_APP_ID}/The_Last_of_Us_Part_I/",
+)
+STEAM_APPDETAILS_URL = f"https://store.steampowered.com/api/appdetails?appids={STEAM_APP_ID}&l=english"
+
+BANLU_MEDIA_CACHE_PATH = os.getenv("BANLU_MEDIA_CACHE_PATH", "data/steam_media.json")
+BANLU_MEDIA_TTL_HOURS = float(os.getenv("BANLU_MEDIA_TTL_HOURS", "6") or 6)
+
+BANLU_MEDIA_CHECK_HOURS = float(os.getenv("BANLU_MEDIA_CHECK_HOURS", "24") or 24)
+BANLU_MEDIA_CHECK_CONCURRENCY = max(1, int(os.getenv("BANLU_MEDIA_CHECK_CONCURRENCY", "4") or 4))
+
+MAX_MEDIA = 80
+
+# Statuses meaning "this image is gone": only these count as strikes,
+# and MAX_CHECK_FAILURES strikes in a row blacklist the URL. Anything
+# else that fails (429, 5xx, timeouts) is inconclusive.
+DEAD_STATUSES = frozenset({403, 404, 410})
+MAX_CHECK_FAILURES = 3
+
+# HEAD rejected: retry as GET (first byte only)
+HEAD_UNSUPPORTED_STATUSES = frozenset({405, 501})
+
+
+def media_urls_from_appdetails(payload: Any, app_id: int = STEAM_APP_ID) -> List[str]:
+    """Screenshots + fallback images from an appdetails response."""
+    try:
+        block = payload.get(str(app_id), {})
+        if not block.get("success"):
+            return []
+        data = block.get("data", {}) or {}
+    except Exception:
+        return []
+
+    urls: List[str] = []
+
+    # screenshots
+    for s in (data.get("screenshots") or []):
+        full = s.get("path_full")
+        if full:
+            urls.append(full)
+
+    # nice fallbacks (still official)
+    for key in ("background_raw", "header_image"):
+        v = data.get(key)
+        if isinstance(v, str) and v:
+            urls.append(v)
+
+    # de-dup keep order
+    return list(dict.fromkeys(urls))[:MAX_MEDIA]
+
+
+@dataclass(frozen=True)
+class MediaCheck:
+    """Result of one HEAD check."""
+
+    url: str
+    ok: bool
+    status: Optional[int]
+    latency_ms: float
+    error: Optional[str] = None
+
+
+class SteamMediaStore:
+    """Disk-backed Steam media list with background revalidation."""
+
+    def __init__(
+        self,
+        url: str = STEAM_APPDETAILS_URL,
+        path: str = BANLU_MEDIA_CACHE_PATH,
+        ttl_seconds: float = BANLU_MEDIA_TTL_HOURS * 3600,
+        client: HttpClient = http,
+        app_id: int = STEAM_APP_ID,
+    ):
+        self.url = url
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.client = client
+        self.app_id = app_id
+        self._state: Optional[Dict[str, Any]] = None
+        self._load_lock = threading.Lock()
+        self._refreshing: Optional[asyncio.Task] = None
+
+    # ===========================
+    # Persistence
+    # ===========================
+    def _load(self) -> Dict[str, Any]:
+        state = self._state
+        if state is not None:
+            return state
+
+        # Warmup thread vs. event loop: only one reads, the other reuses it
+        with self._load_lock:
+            if self._state is None:
+                self._state = self._read()
+            return self._state
+
+    def _read(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = {
+            "media": [],
+            "etag": None,
+            "last_modified": None,
+            "fetched_at": 0.0,
+            # url -> {ok, status, latency_ms, failures, dead, checked_at}
+            "health": {},
+            "checked_at": 0.0,
+        }
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # A different app / URL invalidates the stored list
+            if isinstance(data, dict) and data.get("url") == self.url:
+                state.update({k: data[k] for k in state if k in data})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            logger.warning("Steam media cache %s is unreadable; refetching.", self.path)
+
+        return state
+
+    def _write(self, state: Dict[str, Any]) -> None:
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp, self.path)
+
+    async def _persist(self) -> None:
+        state = dict(self._load(), url=self.url)
+        try:
+            await io_pool.run("steam_media.save", self._write, state, resource="steam_media")
+        except OSError:
+            logger.exception("Failed to persist Steam media cache to %s.", self.path)
+
+    # ===========================
+    # Reads (never touch the network)
+    # ===========================
+    def age(self) -> float:
+        return time.time() - float(self._load().get("fetched_at") or 0.0)
+
+    def is_stale(self) -> bool:
+        return not self._load()["media"] or self.age() >= self.ttl_seconds
+
+    def urls(self) -> List[str]:
+        """Current live media list (possibly stale); schedules a revalidation if stale."""
+        state = self._load()
+        if self.is_stale():
+            self._revalidate_in_background()
+        health = state["health"]
+        live = [u for u in state["media"] if not health.get(u, {}).get("dead")]
+        # Never filter down to nothing: a bad check must not drop every image
+        return live or list(state["media"])
+
+    def dead_urls(self) -> List[str]:
+        state = self._load()
+        return [u for u in state["media"] if state["health"].get(u, {}).get("dead")]
+
+    def _revalidate_in_background(self) -> None:
+        if self._refreshing is not None and not self._refreshing.done():
+            return
+        try:
+            self._refreshing = asyncio.get_running_loop().create_task(self.refresh())
+        except RuntimeError:
+            pass  # no loop (sync caller at import/CLI time): the refresher will catch up
+
+    # ===========================
+    # Revalidation
+    # ===========================
+    async def refresh(self, *, force: bool = False) -> bool:
+        """
+        Conditional fetch of the media list. Returns True if the list is
+        fresh afterwards (changed or 304); on failure the old list stays.
+        """
+        state = self._load()
+        if not force and not self.is_stale():
+            return True
+
+        headers: Dict[str, str] = {}
+        if state["media"]:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+
+        try:
+            resp = await self.client.get(self.url, headers=headers or None)
+        except HttpError as e:
+            logger.warning("Steam media refresh failed (serving %d cached): %s", len(state["media"]), e)
+            return False
+
+        if resp.status == 304:
+            state["fetched_at"] = time.time()
+            await self._persist()
+            return True
+
+        if not resp.ok:
+            logger.warning("Steam media refresh: HTTP %s (serving %d cached)", resp.status, len(state["media"]))
+            return False
+
+        try:
+            media = media_urls_from_appdetails(resp.json(), self.app_id)
+        except HttpError as e:
+            logger.warning("Steam media refresh: %s", e)
+            return False
+        if not media:
+            logger.warning("Steam media refresh returned no images; keeping %d cached.", len(state["media"]))
+            return False
+
+        if media != state["media"]:
+            # New URLs have not been checked yet: check soon
+            state["health"] = {u: h for u, h in state["health"].items() if u in media}
+            state["checked_at"] = 0.0
+        state.update(
+            media=media,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            fetched_at=time.time(),
+        )
+        await self._persist()
+        logger.info("Steam media refreshed: %d image(s).", len(media))
+        return True
+
+    # ===========================
+    # URL health
+    # ===========================
+    def health_due(self, interval_seconds: float = BANLU_MEDIA_CHECK_HOURS * 3600) -> bool:
+        state = self._load()
+        return bool(state["media"]) and time.time() - float(state.get("checked_at") or 0.0) >= interval_seconds
+
+    async def _check_one(self, url: str, gate: asyncio.Semaphore) -> MediaCheck:
+        async with gate:
+            start = time.perf_counter()
+            try:
+                resp = await self.client.request("HEAD", url, read_body=False)
+                if resp.status in HEAD_UNSUPPORTED_STATUSES:
+                    resp = await self.client.request(
+                        "GET", url, headers={"Range": "bytes=0-0"}, read_body=False
+                    )
+            except HttpError as e:
+                return MediaCheck(url, False, None, (time.perf_counter() - start) * 1000, str(e))
+            latency = (time.perf_counter() - start) * 1000
+            return MediaCheck(url, 200 <= resp.status < 400, resp.status, latency)
+
+    async def check_health(self, *, concurrency: int = BANLU_MEDIA_CHECK_CONCURRENCY) -> List[MediaCheck]:
+        """HEAD-check every cached URL; update the blacklist and latency stats."""
+        state = self._load()
+        media = list(state["media"])
+        if not media:
+            return []
+
+        gate = asyncio.Semaphore(max(1, concurrency))
+        results = await asyncio.gather(*(self._check_one(u, gate) for u in media))
+
+        now = time.time()
+        previous = state["health"]
+        # A refresh() may have replaced the list while the checks ran
+        current = set(state["media"])
+        health: Dict[str, Dict[str, Any]] = {}
+        for r in results:
+            if r.url not in current:
+                continue
+            before = previous.get(r.url, {})
+            if r.ok:
+                failures = 0
+            elif r.status in DEAD_STATUSES:
+                failures = int(before.get("failures", 0)) + 1
+            else:
+                failures = int(before.get("failures", 0))  # inconclusive: no strike
+            health[r.url] = {
+                "ok": r.ok,
+                "status": r.status,
+                "latency_ms": round(r.latency_ms, 1),
+                "failures": failures,
+                "dead": failures >= MAX_CHECK_FAILURES,
+                "checked_at": now,
+            }
+            if r.error:
+                health[r.url]["error"] = r.error
+        # URLs added by a concurrent refresh keep their (empty) entries
+        health.update({u: h for u, h in previous.items() if u in current and u not in health})
+
+        state["health"] = health
+        state["checked_at"] = now
+        await self._persist()
+
+        dead = [u for u, h in health.items() if h["dead"]]
+        logger.info(
+            "Steam media health: %d/%d alive, median %.0f ms, max %.0f ms.",
+            len(current) - len(dead),
+            len(current),
+            statistics.median(r.latency_ms for r in results),
+            max(r.latency_ms for r in results),
+        )
+        for url in dead:
+            logger.warning("Steam media blacklisted (status %s): %s", health[url]["status"], url)
+        return list(results)
+
+
+# Shared store used by the Ban'Lu daily job
+steam_media = SteamMediaStore()
+startup.warmup("steam_media", resource="steam_media")(steam_media._load)
+
+
+@tasks.loop(hours=1)
+async def steam_media_refresher():
+    """Revalidate the Steam media list and its URLs in the background."""
+    await steam_media.refresh()
+    if steam_media.health_due():
+        await steam_media.check_health()
@@ -0,0 +1,61 @@
+from datetime import date
+
+import pytest
+
+from core.dynamic_holidays import (
+    MON,
+    THU,
+    HolidayRule,
+    LastWeekday,
+    LunarTable,
+    NthWeekday,
+    _easter_orthodox,
+    _easter_western,
+)
+
+
+@pytest.mark.parametrize(
+    "year, expected",
+    [
+        (2021, date(2021, 5, 2)),
+        (2023, date(2023, 4, 16)),
+        (2024, date(2024, 5, 5)),
+        (2025, date(2025, 4, 20)),
+        (2026, date(2026, 4, 12)),
+    ],
+)
+def test_orthodox_easter_known_years(year, expected):
+    assert _easter_orthodox(year) == expected
+
+
+@pytest.mark.parametrize(
+    "year, expected",
+    [
+        (2024, date(2024, 3, 31)),
+        (2025, date(2025, 4, 20)),
+        (2026, date(2026, 4, 5)),
+    ],
+)
+def test_western_easter_known_years(year, expected):
+    assert _easter_western(year) == expected
+
+
+def test_nth_and_last_weekday():
+    assert NthWeekday("Thanksgiving", month=11, weekday=THU, n=4).date_in(2026) == date(2026, 11, 26)
+    assert NthWeekday("Fifth Monday", month=2, weekday=MON, n=5).date_in(2026) is None
+    assert LastWeekday("Memorial Day", month=5, weekday=MON).date_in(2026) == date(2026, 5, 25)
+
+
+def test_lunar_table_missing_year_warns_once(caplog):
+    rule = LunarTable("Test Lunar", dates={2026: "02-17"})
+    assert rule.date_in(2026) == date(2026, 2, 17)
+
+    with caplog.at_level("WARNING", logger="dynamic_holidays"):
+        assert rule.date_in(2099) is None
+        assert rule.date_in(2099) is None
+    assert len([r for r in caplog.records if "2099" in r.getMessage()]) == 1
+
+
+def test_holiday_rule_is_abstract():
+    with pytest.raises(TypeError):
+        HolidayRule("abstract")
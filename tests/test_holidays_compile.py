@@ -0,0 +1,35 @@
+import json
+
+from services.holidays_compile import SNAPSHOT_DIRNAME, main
+
+
+def _write(folder, name, entries):
+    (folder / name).write_text(json.dumps(entries), encoding="utf-8")
+
+
+def test_check_passes_on_valid_source(tmp_path, capsys):
+    _write(tmp_path, "January.json", [{"date": "01-01", "name": "New Year", "countries": ["russia"]}])
+
+    assert main(["--src", str(tmp_path), "--check"]) == 0
+    assert "1 holidays" in capsys.readouterr().out
+    assert not (tmp_path / SNAPSHOT_DIRNAME).exists()
+
+
+def test_check_fails_on_invalid_source(tmp_path, capsys):
+    _write(tmp_path, "January.json", [{"date": "13-45", "name": "Broken"}, {"date": "01-02"}])
+    (tmp_path / "February.json").write_text("[{", encoding="utf-8")
+
+    assert main(["--src", str(tmp_path), "--check"]) == 1
+    out = capsys.readouterr().out
+    assert "January.json: entry #1 ('Broken'): bad date" in out
+    assert "January.json: entry #2: missing name" in out
+    assert "February.json: invalid JSON" in out
+    assert "2 file(s) with errors" in out
+    assert not (tmp_path / SNAPSHOT_DIRNAME).exists()
+
+
+def test_invalid_source_is_not_published(tmp_path):
+    _write(tmp_path, "January.json", [{"date": "01-01", "name": "New Year", "countries": 5}])
+
+    assert main(["--src", str(tmp_path)]) == 1
+    assert not (tmp_path / SNAPSHOT_DIRNAME).exists()
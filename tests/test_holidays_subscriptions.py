@@ -0,0 +1,20 @@
+from services.holidays_subscriptions import parse_subscriptions
+
+
+def test_valid_tags():
+    subs = parse_subscriptions("111=country:russia,category:Religious;222=country:usa,country:uk")
+    assert subs[111].countries == ("russia",)
+    assert subs[111].categories == ("Religious",)
+    assert subs[222].countries == ("usa", "uk")
+    assert not subs[111].matches_nothing
+
+
+def test_all_tags_invalid_matches_nothing():
+    subs = parse_subscriptions("111=contry:usa,categroy:Religious")
+    assert 111 in subs
+    assert subs[111].matches_nothing
+
+
+def test_invalid_parts_are_skipped():
+    subs = parse_subscriptions("nonsense;abc=country:usa;;333=country:uk")
+    assert list(subs) == [333]